@@ -1,5 +1,10 @@
 import bpy
 import os
+import math
+import shutil
+import tempfile
+import numpy as np
+from mathutils import Vector
 from bpy.types import Operator, Panel
 from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty
 
@@ -16,7 +21,11 @@ class LODGeneratorTool(bpy.types.Operator):
         
         lod_count = context.scene.lod_count
         reduction_ratio = context.scene.reduction_ratio
-        
+
+        # The impostor atlas is saved to the export folder, check it before doing any work
+        if context.scene.lod_add_impostor and impostor_output_dir(context.scene) is None:
+            self.report({'ERROR'}, "Set an Export Path (or save the blend file) to write the impostor atlas to")
+            return {'CANCELLED'}
         
         self.create_lods(context, lod_count, reduction_ratio)
         
@@ -87,6 +96,10 @@ class LODGeneratorTool(bpy.types.Operator):
             
             # Else Put out a error message : You need to specify a folder
             
+        # Optional far LOD: a camera-facing card textured with an impostor atlas
+        if bpy.context.scene.lod_add_impostor:
+            self.generate_impostor_lod(obj, lod_collection, lod_count)
+
         # Original object is deselected so we dont export or delete it on accident
         obj.select_set(False)
         
@@ -94,6 +107,49 @@ class LODGeneratorTool(bpy.types.Operator):
         
         return lod_collection
         
+    def generate_impostor_lod(self, obj, lod_collection, lod_index):
+        """Render an impostor atlas of obj with Cycles (CPU) and add a matching card as the last LOD."""
+        scene = bpy.context.scene
+        mode = scene.impostor_mode
+        frames = scene.impostor_frames
+        frame_res = scene.impostor_resolution
+
+        directions = impostor_view_directions(mode, frames)
+        if mode == 'OCTAHEDRAL':
+            cols = rows = frames
+        else:
+            cols = math.ceil(math.sqrt(len(directions)))
+            rows = math.ceil(len(directions) / cols)
+
+        # Keep the atlas within a texture size engines accept (and a sane float buffer)
+        if max(cols, rows) * frame_res > IMPOSTOR_MAX_ATLAS:
+            frame_res = IMPOSTOR_MAX_ATLAS // max(cols, rows)
+            self.report({'WARNING'}, f"Impostor frames reduced to {frame_res} px to fit a {IMPOSTOR_MAX_ATLAS} px atlas")
+
+        # World space bounds so the card matches what the camera saw
+        corners = [obj.matrix_world @ Vector(c) for c in obj.bound_box]
+        center = sum(corners, Vector()) / 8.0
+        radius = max((c - center).length for c in corners) or 1.0
+
+        atlas = render_impostor_atlas(obj, directions, center, radius, frame_res, cols, rows)
+
+        img = bpy.data.images.new(f"T_{obj.name}_Impostor", width=cols * frame_res, height=rows * frame_res, alpha=True)
+        img.pixels.foreach_set(atlas.ravel())
+        output_directory = impostor_output_dir(scene)
+        os.makedirs(output_directory, exist_ok=True)
+        img.filepath_raw = os.path.join(output_directory, f"{img.name}.png")
+        img.file_format = 'PNG'
+        img.save()
+
+        card = build_impostor_card(obj, directions, mode, radius, cols, rows, lod_index)
+        card.data.materials.append(create_impostor_material(obj, img))
+        card.location = center
+        card.location.x += 3 * (lod_index + 1)
+        lod_collection.objects.link(card)
+
+        self.report({'INFO'}, f"Impostor LOD{lod_index} created for {obj.name} ({len(directions)} views)")
+        return card
+
     def set_collection(self, collection):
         self.lod_collection = collection
          
@@ -120,6 +176,162 @@ class LODGeneratorTool(bpy.types.Operator):
             bpy.ops.object.modifier_apply(modifier="LOD_3")
     """
     
+IMPOSTOR_MAX_ATLAS = 8192  # largest atlas side in pixels
+
+def impostor_output_dir(scene):
+    """Absolute folder the impostor atlas is saved to, or None if the export path can't be used."""
+    path = scene.export_path.strip()
+    if not path or (path.startswith("//") and not bpy.data.filepath):
+        return None
+    return bpy.path.abspath(path)
+
+def impostor_view_directions(mode, frames):
+    """Unit view directions (from the asset towards the camera) for each atlas frame."""
+    directions = []
+    if mode == 'OCTAHEDRAL':
+        # Hemi-octahedral grid: every frame of an N x N atlas maps to a direction in the upper hemisphere
+        for row in range(frames):
+            for col in range(frames):
+                u = (col + 0.5) / frames * 2.0 - 1.0
+                v = (row + 0.5) / frames * 2.0 - 1.0
+                x = (u + v) * 0.5
+                y = (u - v) * 0.5
+                z = 1.0 - abs(x) - abs(y)
+                directions.append(Vector((x, y, z)).normalized())
+    else:
+        # Multi-view ring around the asset at eye level
+        for i in range(frames):
+            angle = 2.0 * math.pi * i / frames
+            directions.append(Vector((math.sin(angle), -math.cos(angle), 0.0)))
+    return directions
+
+
+def render_impostor_atlas(obj, directions, center, radius, frame_res, cols, rows):
+    """Renders every view in a throwaway scene and packs them into one (H, W, 4) float32 atlas."""
+    tmp_dir = tempfile.mkdtemp(prefix="impostor_")
+    tmp_scene = bpy.data.scenes.new(f"{obj.name}_ImpostorRender")
+    tmp_scene.collection.objects.link(obj)
+
+    render = tmp_scene.render
+    render.engine = 'CYCLES'
+    tmp_scene.cycles.device = 'CPU'
+    tmp_scene.cycles.samples = 16
+    render.film_transparent = True
+    render.resolution_x = frame_res
+    render.resolution_y = frame_res
+    render.resolution_percentage = 100
+    render.image_settings.file_format = 'PNG'
+    render.image_settings.color_mode = 'RGBA'
+    # Albedo without tone mapping; this scene is thrown away after, so nothing to restore
+    tmp_scene.view_settings.view_transform = 'Standard'
+    tmp_scene.view_settings.look = 'None'
+    tmp_scene.view_settings.exposure = 0.0
+    tmp_scene.view_settings.gamma = 1.0
+
+    world = bpy.data.worlds.new("ImpostorWorld")
+    world.color = (0.5, 0.5, 0.5)
+    tmp_scene.world = world
+
+    cam_data = bpy.data.cameras.new("ImpostorCam")
+    cam_data.type = 'ORTHO'
+    cam_data.ortho_scale = radius * 2.0
+    cam_data.clip_start = radius * 0.01
+    cam_data.clip_end = radius * 6.0
+    cam = bpy.data.objects.new("ImpostorCam", cam_data)
+    tmp_scene.collection.objects.link(cam)
+    tmp_scene.camera = cam
+
+    sun_data = bpy.data.lights.new("ImpostorSun", type='SUN')
+    sun = bpy.data.objects.new("ImpostorSun", sun_data)
+    sun.rotation_euler = (math.radians(45.0), 0.0, math.radians(45.0))
+    tmp_scene.collection.objects.link(sun)
+
+    atlas = np.zeros((rows * frame_res, cols * frame_res, 4), dtype=np.float32)
+    frame_pixels = np.empty(frame_res * frame_res * 4, dtype=np.float32)
+    try:
+        for i, direction in enumerate(directions):
+            cam.location = center + direction * radius * 3.0
+            cam.rotation_euler = (-direction).to_track_quat('-Z', 'Y').to_euler()
+            render.filepath = os.path.join(tmp_dir, f"view_{i:03d}.png")
+            bpy.ops.render.render(write_still=True, scene=tmp_scene.name)
+
+            frame_img = bpy.data.images.load(render.filepath)
+            frame_img.pixels.foreach_get(frame_pixels)
+            bpy.data.images.remove(frame_img)
+
+            col, row = i % cols, i // cols
+            atlas[row * frame_res:(row + 1) * frame_res, col * frame_res:(col + 1) * frame_res] = \
+                frame_pixels.reshape(frame_res, frame_res, 4)
+    finally:
+        bpy.data.objects.remove(cam)
+        bpy.data.cameras.remove(cam_data)
+        bpy.data.objects.remove(sun)
+        bpy.data.lights.remove(sun_data)
+        bpy.data.worlds.remove(world)
+        bpy.data.scenes.remove(tmp_scene)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return atlas
+
+
+def build_impostor_card(obj, directions, mode, radius, cols, rows, lod_index):
+    """Builds the quad-card mesh whose UVs point at the matching atlas frames."""
+    verts = []
+    faces = []
+    uvs = []
+
+    def frame_uvs(i):
+        col, row = i % cols, i // cols
+        u0, v0 = col / cols, row / rows
+        u1, v1 = (col + 1) / cols, (row + 1) / rows
+        return [(u0, v0), (u1, v0), (u1, v1), (u0, v1)]
+
+    if mode == 'OCTAHEDRAL':
+        # Single billboard; the engine shader picks the frame from the view direction
+        front_frame = min(range(len(directions)), key=lambda i: (directions[i] - Vector((0.0, -1.0, 0.0))).length)
+        card_dirs = [(front_frame, Vector((0.0, -1.0, 0.0)))]
+    else:
+        # Opposite views share a plane, so half the ring gives a crossed card. With an
+        # odd count no two views are opposite; the first half, rounded up, covers the circle.
+        card_dirs = [(i, directions[i]) for i in range(max(1, math.ceil(len(directions) / 2)))]
+
+    for frame, direction in card_dirs:
+        right = Vector((0.0, 0.0, 1.0)).cross(direction).normalized() * radius
+        up = Vector((0.0, 0.0, radius))
+        base = len(verts)
+        verts.extend([-right - up, right - up, right + up, -right + up])
+        faces.append((base, base + 1, base + 2, base + 3))
+        uvs.extend(frame_uvs(frame))
+
+    mesh = bpy.data.meshes.new(f"{obj.name}_LOD{lod_index}_Impostor")
+    mesh.from_pydata([tuple(v) for v in verts], [], faces)
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", np.array(uvs, dtype=np.float32).ravel())
+    mesh.update()
+
+    card = bpy.data.objects.new(f"{obj.name}_LOD{lod_index}", mesh)
+    card["ImpostorMode"] = mode
+    card["ImpostorFrames"] = len(directions)
+    card["ImpostorGrid"] = (cols, rows)
+    return card
+
+
+def create_impostor_material(obj, img):
+    """Unlit alpha-clipped material that samples the impostor atlas."""
+    mat = bpy.data.materials.new(name=f"MI_{obj.name}_Impostor")
+    mat.use_nodes = True
+    mat.blend_method = 'CLIP'
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+    tex = nodes.new(type='ShaderNodeTexImage')
+    tex.image = img
+    if bsdf:
+        links.new(tex.outputs['Color'], bsdf.inputs['Base Color'])
+        links.new(tex.outputs['Alpha'], bsdf.inputs['Alpha'])
+    return mat
+
+
 class LODGeneratorPanel(bpy.types.Panel):
     bl_label = "LOD Generator Panel"
     bl_idname = "OBJECT_PT_lod_generator"
@@ -132,6 +344,13 @@ class LODGeneratorPanel(bpy.types.Panel):
         layout.operator("objects.lod_generator")
         layout.prop(context.scene, "lod_count")
         layout.prop(context.scene, "reduction_ratio")
+
+        layout.prop(context.scene, "lod_add_impostor")
+        if context.scene.lod_add_impostor:
+            box = layout.box()
+            box.prop(context.scene, "impostor_mode")
+            box.prop(context.scene, "impostor_frames")
+            box.prop(context.scene, "impostor_resolution")
         
         layout.operator("operator_normal_map_baker")
         
@@ -268,7 +487,30 @@ def register():
         default=False
     )
 
-
+    bpy.types.Scene.lod_add_impostor = BoolProperty(
+        name="Impostor Final LOD",
+        description="Add a billboard card with a rendered impostor atlas as the last LOD",
+        default=False
+    )
+    bpy.types.Scene.impostor_mode = bpy.props.EnumProperty(
+        name="Impostor Mode",
+        description="How the impostor views are laid out",
+        items=[
+            ('MULTIVIEW', "Multi-View", "Ring of views around the asset, crossed cards"),
+            ('OCTAHEDRAL', "Octahedral", "Hemi-octahedral N x N grid of views, single billboard"),
+        ],
+        default='MULTIVIEW'
+    )
+    bpy.types.Scene.impostor_frames = IntProperty(
+        name="Impostor Frames",
+        description="Number of views (Multi-View) or frames per atlas side (Octahedral)",
+        default=8, min=2, max=16
+    )
+    bpy.types.Scene.impostor_resolution = IntProperty(
+        name="Frame Resolution",
+        description="Pixel size of each impostor frame",
+        default=256, min=32, max=2048
+    )
 
     
 
@@ -283,6 +525,10 @@ def unregister():
     del bpy.types.Scene.lod_count
     del bpy.types.Scene.reduction_ratio
     del bpy.types.Scene.export_path
+    del bpy.types.Scene.lod_add_impostor
+    del bpy.types.Scene.impostor_mode
+    del bpy.types.Scene.impostor_frames
+    del bpy.types.Scene.impostor_resolution
 
 
 if __name__ == "__main__":
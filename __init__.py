@@ -36,11 +36,17 @@ from . import id_generator
 
 from . import csv_to_mesh_validator 
 
+from . import scene_validation
+
+from . import viewport_overlay
+
 
 modules = [
                 renaming_export,
                 id_generator,
                 csv_to_mesh_validator,
+                scene_validation,
+                viewport_overlay,
             #     lightmap_generator,
                   ]
 
@@ -0,0 +1,225 @@
+import csv
+import os
+import sqlite3
+
+from .asset_table import (DB_EXTENSIONS, AssetRow, AssetNameIndex, NameCandidate, NameResolution, WriteBackResult,
+                          normalize_asset_name, replace_sheet)
+
+# Optional SQLite backend for the asset sheet.
+# Same columns as the CSV, plus an indexed normalized name for O(log n) lookups.
+# Point scene.csv_path at a .db/.sqlite file to use it.
+
+DEFAULT_COLUMNS = ['AssetName', 'Category', 'MaxTris', 'ActualTris', 'TexResolution', 'Status', 'MasterMaterial', 'Notes']
+
+
+def is_asset_db_path(path):
+    return os.path.splitext(path)[1].lower() in DB_EXTENSIONS
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+class AssetDatabase:
+    """
+    Asset rows stored in SQLite (WAL mode). Exposes the same lookup API as
+    AssetTable so the validator doesn't care which backend is in use.
+    """
+
+    def __init__(self, path, timeout=10.0):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS columns (position INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        self._local_writes = 0
+        self._index = None
+        self._index_version = None
+        self._issues = []
+        if not self.fieldnames:
+            self._create_assets_table(DEFAULT_COLUMNS)
+
+    def close(self):
+        self.conn.close()
+
+    # Schema
+
+    @property
+    def fieldnames(self):
+        return [r[0] for r in self.conn.execute("SELECT name FROM columns ORDER BY position")]
+
+    def _create_assets_table(self, fieldnames):
+        cols = ", ".join(f"{_quote(c)} TEXT" for c in fieldnames)
+        self.conn.execute("DROP TABLE IF EXISTS assets")
+        self.conn.execute(f"CREATE TABLE assets (id INTEGER PRIMARY KEY, NormName TEXT NOT NULL, {cols})")
+        self.conn.execute("CREATE INDEX assets_norm_name ON assets (NormName)")
+        self.conn.execute("DELETE FROM columns")
+        self.conn.executemany("INSERT INTO columns (position, name) VALUES (?, ?)", list(enumerate(fieldnames)))
+
+    # Versioning, so callers can key caches the same way as on a CSV's mtime/size
+
+    @property
+    def mtime_ns(self):
+        # data_version moves when another connection commits, _local_writes when we do
+        return self.conn.execute("PRAGMA data_version").fetchone()[0] * 1000003 + self._local_writes
+
+    size = 0
+
+    def is_stale(self, stat):
+        return False
+
+    # Lookups
+
+    def _row_dict(self, row):
+        return AssetRow.from_csv({c: row[c] for c in self.fieldnames}, row['id']) if row is not None else None
+
+    @property
+    def rows(self):
+        fields = self.fieldnames
+        return [AssetRow.from_csv({c: r[c] for c in fields}, r['id'])
+                for r in self.conn.execute("SELECT * FROM assets ORDER BY id")]
+
+    @property
+    def issues(self):
+        self.index  # rows are parsed (and checked) when the name index is built
+        return self._issues
+
+    @property
+    def by_name(self):
+        return self.index.rows_by_key
+
+    @property
+    def index(self):
+        version = self.mtime_ns
+        if self._index is None or self._index_version != version:
+            rows_by_key = {}
+            issues = []
+            fields = self.fieldnames
+            for r in self.conn.execute("SELECT * FROM assets ORDER BY id"):
+                row = AssetRow.from_csv({c: r[c] for c in fields}, r['id'], issues)
+                rows_by_key.setdefault(normalize_asset_name(row.asset_name), row)
+            self._issues = issues
+            self._index = AssetNameIndex(rows_by_key)
+            self._index_version = version
+        return self._index
+
+    def get(self, asset_name):
+        """Exact lookup on the normalized name, through the NormName index."""
+        row = self.conn.execute(
+            "SELECT * FROM assets WHERE NormName = ? ORDER BY id LIMIT 1",
+            (normalize_asset_name(asset_name),)).fetchone()
+        return self._row_dict(row)
+
+    def resolve(self, asset_name):
+        """Exact hits stay on the SQL index; only misses fall back to the fuzzy name index."""
+        row = self.get(asset_name)
+        if row is not None:
+            key = normalize_asset_name(asset_name)
+            return NameResolution(row, [NameCandidate(key, row, 'exact', 1.0)], False)
+        return self.index.resolve(asset_name)
+
+    def find(self, asset_name):
+        return self.resolve(asset_name).row
+
+    # Writes
+
+    def apply_updates(self, updates, base_values=None):
+        """
+        Row-level field updates in one transaction. A field that someone else
+        changed since base_values was captured is reported as a conflict.
+        """
+        base_values = base_values or {}
+        fields_known = set(self.fieldnames)
+        updated, missing, conflicts = [], [], []
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, fields in updates.items():
+                row = self.conn.execute(
+                    "SELECT * FROM assets WHERE NormName = ? ORDER BY id LIMIT 1", (key,)).fetchone()
+                if row is None:
+                    missing.append(key)
+                    continue
+                applied = {}
+                # Read through AssetRow like base_values were, so an empty cell is None on both sides
+                parsed = self._row_dict(row)
+                for field, value in fields.items():
+                    if field not in fields_known:
+                        continue
+                    current = parsed.get(field)
+                    base = base_values.get((key, field), current)
+                    if current != base and current != value:
+                        conflicts.append((row['AssetName'], field, current, value))
+                        continue
+                    applied[field] = value
+                if applied:
+                    sets = ", ".join(f"{_quote(f)} = ?" for f in applied)
+                    self.conn.execute(f"UPDATE assets SET {sets} WHERE id = ?", (*applied.values(), row['id']))
+                    updated.append(row['AssetName'])
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self._local_writes += 1
+        return WriteBackResult(updated, missing, conflicts)
+
+    # CSV import / export
+
+    def import_csv(self, csv_path):
+        """Replaces the database contents with the rows of csv_path."""
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile)
+            fieldnames = reader.fieldnames or DEFAULT_COLUMNS
+            rows = list(reader)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._create_assets_table(fieldnames)
+            cols = ", ".join(_quote(c) for c in fieldnames)
+            marks = ", ".join("?" for _ in fieldnames)
+            self.conn.executemany(
+                f"INSERT INTO assets (NormName, {cols}) VALUES (?, {marks})",
+                [(normalize_asset_name(r.get('AssetName') or ''), *(r.get(c) for c in fieldnames)) for r in rows])
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self._local_writes += 1
+        return len(rows)
+
+    def export_csv(self, csv_path):
+        """
+        Writes the database back out in the CSV layout it was imported from,
+        under the same lock and temp file + rename as the CSV write-back.
+        """
+        rows = self.rows
+        fields = self.fieldnames
+        replace_sheet(csv_path, fields, [row.to_dict(fields) for row in rows])
+        return len(rows)
+
+    def backup(self, path):
+        """Consistent copy of the database (WAL included) to path."""
+        target = sqlite3.connect(path)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
+
+    def row_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+
+_DB_CACHE = {}
+
+def open_asset_db(path, create=False):
+    """Cached connection for path. Returns None if it doesn't exist and create is False."""
+    db = _DB_CACHE.get(path)
+    if db is not None:
+        return db
+    if not create and not os.path.exists(path):
+        return None
+    db = _DB_CACHE[path] = AssetDatabase(path)
+    return db
+
+def close_asset_dbs():
+    for db in _DB_CACHE.values():
+        db.close()
+    _DB_CACHE.clear()
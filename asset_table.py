@@ -0,0 +1,726 @@
+import csv
+import glob
+import os
+import re
+import tempfile
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+# Asset sheet access for the CSV validator.
+# Kept free of bpy so it can also be used from headless/command line tools.
+
+PREFIX_LIST = ['SM_', 'SK_', 'MM_']  # unreal naming conventions
+DB_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')  # asset sheets stored in SQLite, see asset_db
+SHEET_SEPARATOR = ';'  # "env.csv;chars.csv" or a glob like "sheets/*.csv" loads several sheets
+
+
+def strip_prefix(name, prefixes=PREFIX_LIST):
+    for prefix in prefixes:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    # If it cant find prefix, strip up to first underscore
+    if "_" in name:
+        return name.split("_", 1)[1]
+    return name
+
+def take_away_underscore(name):
+    """
+    Joins the two parts of the string split by the last underscore.
+    Example: "SM_Asset_LOD1" -> "SM_AssetLOD1"
+    """
+    if "_" in name:
+        parts = name.rsplit("_", 1)
+        return parts[0] + parts[1]
+    return name
+
+def normalize_asset_name(name):
+    """Key used for every asset lookup: prefix stripped, last underscore removed, lowercase."""
+    return take_away_underscore(strip_prefix(name).lower())
+
+
+def name_tokens(name):
+    """Splits 'SM_DoorHeavy_01' into {'door', 'heavy', '01'}."""
+    return {t.lower() for t in re.findall(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+', strip_prefix(name))}
+
+def word_tokens(name):
+    """name_tokens without the purely numeric ones; '01' says nothing about which asset it is."""
+    return {t for t in name_tokens(name) if not t.isdigit()}
+
+def compact_asset_name(name):
+    """normalize_asset_name with every separator removed: 'SM_Enemy_Goblin_01' -> 'enemygoblin01'."""
+    return re.sub(r'[^a-z0-9]', '', strip_prefix(name).lower())
+
+VARIANT_SUFFIX = re.compile(r'(\.\d{3,}|_LOD\d+)$', re.IGNORECASE)
+
+def strip_variant_suffix(name):
+    """Drops Blender's '.001' duplicate suffix and '_LOD1' level suffixes: 'SM_CrateA_LOD1.001' -> 'SM_CrateA'."""
+    stripped = VARIANT_SUFFIX.sub('', name)
+    while stripped != name:
+        name, stripped = stripped, VARIANT_SUFFIX.sub('', stripped)
+    return name
+
+MIN_TOKEN_OVERLAP = 0.5  # share of the query's word tokens a row must have to be suggested
+
+
+NameCandidate = namedtuple("NameCandidate", "key row kind score")
+NameResolution = namedtuple("NameResolution", "row candidates ambiguous")  # ambiguous: only suggestions, nothing confirmed
+
+
+class AssetNameIndex:
+    """
+    Resolves object names to sheet rows without scanning every row:
+    exact hash lookup, the same with separators ignored, then suggestions
+    from an Aho-Corasick pass for sheet names contained in the query
+    (longest first) and from shared word tokens.
+    """
+
+    def __init__(self, rows_by_key):
+        self.rows_by_key = rows_by_key
+        self.keys = [k for k in rows_by_key if k]
+
+        # Compact name -> key, only where the compact form is unique
+        self.compact = {}
+        for key, row in rows_by_key.items():
+            compact = compact_asset_name(row.asset_name)
+            self.compact[compact] = None if compact in self.compact else key
+
+        self.tokens = {}
+        for key, row in rows_by_key.items():
+            for token in word_tokens(row.asset_name):
+                self.tokens.setdefault(token, set()).add(key)
+
+        # Aho-Corasick automaton over the normalized names
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for i, key in enumerate(self.keys):
+            state = 0
+            for ch in key:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(i)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = self._fail[state]
+                    while f and ch not in self._goto[f]:
+                        f = self._fail[f]
+                    self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def contained_in(self, text):
+        """All indexed names that occur inside text, in O(len(text) + matches)."""
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            found.update(self._out[state])
+        return [self.keys[i] for i in found]
+
+    def candidates(self, asset_name):
+        """Ranked candidate rows for asset_name, best first."""
+        key = normalize_asset_name(asset_name)
+        if key in self.rows_by_key:
+            return [NameCandidate(key, self.rows_by_key[key], 'exact', 1.0)]
+        compact = self.compact.get(compact_asset_name(asset_name))
+        if compact is not None:
+            return [NameCandidate(compact, self.rows_by_key[compact], 'normalized', 1.0)]
+        base = strip_variant_suffix(asset_name)
+        if base != asset_name:
+            # A duplicate or LOD of a sheet asset is that asset
+            base_key = normalize_asset_name(base)
+            if base_key in self.rows_by_key:
+                return [NameCandidate(base_key, self.rows_by_key[base_key], 'variant', 1.0)]
+
+        results = []
+        for name in self.contained_in(key):
+            results.append(NameCandidate(name, self.rows_by_key[name], 'substring', len(name) / len(key)))
+        if not results:
+            query_tokens = word_tokens(asset_name)
+            shared = {}
+            for token in query_tokens:
+                for name in self.tokens.get(token, ()):
+                    shared[name] = shared.get(name, 0) + 1
+            for name, count in shared.items():
+                if count / len(query_tokens) < MIN_TOKEN_OVERLAP:
+                    continue
+                score = count / len(query_tokens | word_tokens(self.rows_by_key[name].asset_name))
+                results.append(NameCandidate(name, self.rows_by_key[name], 'token', score))
+        results.sort(key=lambda c: (-c.score, c.key))
+        return results
+
+    def resolve(self, asset_name):
+        """
+        Only exact and separator-insensitive matches, and '.001' / '_LOD1'
+        variants of an exact match, resolve on their own.
+        Substring and token hits are returned as candidates with ambiguous
+        set, for the user to confirm by renaming the object.
+        """
+        candidates = self.candidates(asset_name)
+        if candidates and candidates[0].kind in ('exact', 'normalized', 'variant'):
+            return NameResolution(candidates[0].row, candidates, False)
+        return NameResolution(None, candidates, bool(candidates))
+
+
+# Typed rows
+
+class AssetCategory(Enum):
+    ENVIRONMENT = "Environment"
+    PROP = "Prop"
+    CHARACTER = "Character"
+
+class AssetStatus(Enum):
+    PENDING = "Pending"
+    APPROVED = "Approved"
+    OVER_BUDGET = "OverBudget"
+
+
+LoadIssue = namedtuple("LoadIssue", "line asset message")
+
+
+def budget_status(row, tris):
+    """'OK' or 'OVER_BUDGET' for tris against row.max_tris; 'BAD_CSV_ROW' when MaxTris is empty or not a number."""
+    if row.max_tris is None:
+        return 'BAD_CSV_ROW'
+    return 'OK' if tris <= row.max_tris else 'OVER_BUDGET'
+
+
+def _parse_int(value, field, required, issues, line, asset):
+    if value is None or value.strip() == "":
+        if required:
+            issues.append(LoadIssue(line, asset, f"{field} is empty"))
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        issues.append(LoadIssue(line, asset, f"{field} is not a number: {value!r}"))
+        return None
+
+def _parse_enum(enum_cls, value):
+    # Unknown values are kept as plain strings so nothing is lost on write-back
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value or None
+
+
+class AssetRow:
+    """
+    One asset sheet row, parsed once at load time. Numbers are ints (None if
+    empty or malformed), Category/Status are enums when recognised, and
+    master_material always carries the MM_ prefix.
+
+    Also behaves like the csv.DictReader row it replaces: row.get('MaxTris'),
+    row['AssetName'] and row['ActualTris'] = '123' still work on the CSV text.
+    """
+    __slots__ = ("asset_name", "category", "max_tris", "actual_tris", "tex_resolution",
+                 "status", "master_material_name", "master_material", "notes", "line", "extra", "invalid")
+
+    FIELDS = {
+        'AssetName': 'asset_name',
+        'Category': 'category',
+        'MaxTris': 'max_tris',
+        'ActualTris': 'actual_tris',
+        'TexResolution': 'tex_resolution',
+        'Status': 'status',
+        'MasterMaterial': 'master_material_name',
+        'Notes': 'notes',
+    }
+
+    @classmethod
+    def from_csv(cls, data, line=0, issues=None):
+        if issues is None:
+            issues = []
+        row = cls.__new__(cls)
+        name = data.get('AssetName') or ''
+        if not name:
+            issues.append(LoadIssue(line, name, "AssetName is empty"))
+        row.asset_name = name
+        row.line = line
+        row.category = _parse_enum(AssetCategory, data.get('Category'))
+        row.invalid = None
+        row._set_int(data, 'MaxTris', True, issues)
+        row._set_int(data, 'ActualTris', False, issues)
+        row._set_int(data, 'TexResolution', False, issues)
+        row.status = _parse_enum(AssetStatus, data.get('Status'))
+        row._set_master_material(data.get('MasterMaterial') or '')
+        row.notes = data.get('Notes') or ''
+        extra = {k: v for k, v in data.items() if k not in cls.FIELDS and k is not None}
+        row.extra = extra or None
+        return row
+
+    def _set_int(self, data, field, required, issues):
+        raw = data.get(field)
+        value = _parse_int(raw, field, required, issues, self.line, self.asset_name)
+        setattr(self, self.FIELDS[field], value)
+        # Keep malformed text so writing the sheet back doesn't lose it
+        if value is None and raw and raw.strip():
+            if self.invalid is None:
+                self.invalid = {}
+            self.invalid[field] = raw
+        elif self.invalid:
+            self.invalid.pop(field, None)
+
+    def _set_master_material(self, name):
+        self.master_material_name = name
+        if name and not name.startswith("MM_"):
+            name = "MM_" + name
+        self.master_material = name or None
+
+    @property
+    def category_name(self):
+        return self.category.value if isinstance(self.category, AssetCategory) else (self.category or '')
+
+    @property
+    def status_name(self):
+        return self.status.value if isinstance(self.status, AssetStatus) else (self.status or '')
+
+    # dict compatibility, on the CSV text form
+
+    def get(self, field, default=None):
+        attr = self.FIELDS.get(field)
+        if attr is None:
+            return self.extra.get(field, default) if self.extra else default
+        if attr == 'category':
+            return self.category_name or default
+        if attr == 'status':
+            return self.status_name or default
+        if self.invalid and field in self.invalid:
+            return self.invalid[field]
+        value = getattr(self, attr)
+        if value is None or value == '':
+            return default
+        return str(value)
+
+    def __getitem__(self, field):
+        value = self.get(field)
+        if value is None and field not in self.FIELDS and not (self.extra and field in self.extra):
+            raise KeyError(field)
+        return value if value is not None else ''
+
+    def __setitem__(self, field, value):
+        attr = self.FIELDS.get(field)
+        if attr is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[field] = value
+        elif attr == 'category':
+            self.category = _parse_enum(AssetCategory, value)
+        elif attr == 'status':
+            self.status = _parse_enum(AssetStatus, value)
+        elif attr == 'master_material_name':
+            self._set_master_material(value)
+        elif attr in ('max_tris', 'actual_tris', 'tex_resolution'):
+            self._set_int({field: str(value)}, field, False, [])
+        else:
+            setattr(self, attr, value)
+
+    def to_dict(self, fieldnames):
+        return {f: self.get(f, '') for f in fieldnames}
+
+    def __repr__(self):
+        return f"AssetRow({self.asset_name!r}, max_tris={self.max_tris}, status={self.status_name!r})"
+
+
+class AssetTable:
+    """A CSV asset sheet parsed once and indexed by normalized asset name."""
+
+    def __init__(self, path, fieldnames, rows, mtime_ns, size, issues=None):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.rows = rows
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.issues = issues or []
+
+        # First row wins on duplicate names, same as the old linear scan
+        self.by_name = {}
+        for row in rows:
+            self.by_name.setdefault(normalize_asset_name(row.asset_name), row)
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = AssetNameIndex(self.by_name)
+        return self._index
+
+    def is_stale(self, stat):
+        return stat.st_mtime_ns != self.mtime_ns or stat.st_size != self.size
+
+    def get(self, asset_name):
+        """Exact lookup on the normalized name."""
+        return self.by_name.get(normalize_asset_name(asset_name))
+
+    def resolve(self, asset_name):
+        return self.index.resolve(asset_name)
+
+    def find(self, asset_name):
+        """Best unambiguous row for asset_name, or None."""
+        return self.resolve(asset_name).row
+
+
+SheetConflict = namedtuple("SheetConflict", "asset sheets")
+
+
+class AssetFederation:
+    """
+    Several asset sheets (e.g. one per department) behind one lookup.
+    Each sheet is still loaded and cached on its own, so editing one sheet
+    only re-parses that one. On duplicate asset names the first sheet in
+    the list wins and the clash is recorded in conflicts.
+    """
+
+    def __init__(self, spec, tables):
+        self.path = spec
+        self.tables = tables  # sheet path -> AssetTable/AssetDatabase, in priority order
+        self.by_name = {}
+        self.sheet_by_name = {}  # normalized name -> path of the sheet that owns the row
+        owners = {}
+        for path, table in tables.items():
+            for key, row in table.by_name.items():
+                if key in self.by_name:
+                    owners.setdefault(key, [self.sheet_by_name[key]]).append(path)
+                    continue
+                self.by_name[key] = row
+                self.sheet_by_name[key] = path
+        self.conflicts = [SheetConflict(self.by_name[key].asset_name, paths) for key, paths in owners.items()]
+        self.issues = [issue for table in tables.values() for issue in table.issues]
+        self._index = None
+
+    @property
+    def rows(self):
+        return [row for table in self.tables.values() for row in table.rows]
+
+    @property
+    def mtime_ns(self):
+        return max((t.mtime_ns for t in self.tables.values()), default=0)
+
+    @property
+    def size(self):
+        return sum(t.size for t in self.tables.values())
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = AssetNameIndex(self.by_name)
+        return self._index
+
+    def is_stale(self, stat):
+        return False
+
+    def sheet_for(self, asset_name):
+        """Path of the sheet an asset's row comes from, or None."""
+        return self.sheet_by_name.get(normalize_asset_name(asset_name))
+
+    def get(self, asset_name):
+        return self.by_name.get(normalize_asset_name(asset_name))
+
+    def resolve(self, asset_name):
+        return self.index.resolve(asset_name)
+
+    def find(self, asset_name):
+        return self.resolve(asset_name).row
+
+
+def is_sheet_list(spec):
+    return SHEET_SEPARATOR in spec or glob.has_magic(spec)
+
+def sheet_spec_abspath(spec, abspath=os.path.abspath):
+    """Applies abspath (e.g. bpy.path.abspath) to every sheet in a ';' separated list."""
+    parts = [p.strip() for p in spec.split(SHEET_SEPARATOR) if p.strip()]
+    return SHEET_SEPARATOR.join(abspath(p) for p in parts)
+
+def expand_sheet_spec(spec):
+    """Sheet paths for a ';' separated list of files and glob patterns, in order, without repeats."""
+    paths = []
+    for part in spec.split(SHEET_SEPARATOR):
+        part = part.strip()
+        if not part:
+            continue
+        matches = sorted(glob.glob(part)) if glob.has_magic(part) else [part]
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+_TABLE_CACHE = {}
+_FEDERATION_CACHE = {}
+LOAD_WORKERS = 4
+
+def _load_federation(spec):
+    paths = expand_sheet_spec(spec)
+    # Parse the sheets side by side; unchanged ones come straight from the cache
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, max(1, len(paths)))) as pool:
+        loaded = list(pool.map(load_asset_table, paths))
+    tables = {path: table for path, table in zip(paths, loaded) if table is not None}
+    if not tables:
+        _FEDERATION_CACHE.pop(spec, None)
+        return None
+
+    federation = _FEDERATION_CACHE.get(spec)
+    if federation is not None and list(federation.tables) == list(tables) \
+            and all(federation.tables[p] is t for p, t in tables.items()):
+        return federation
+    federation = AssetFederation(spec, tables)
+    _FEDERATION_CACHE[spec] = federation
+    return federation
+
+def load_asset_table(csv_path):
+    """
+    Returns the cached AssetTable for csv_path, re-parsing only when the
+    file's mtime or size changed. Returns None if the file can't be read.
+    A ';' separated list or glob of sheets gives an AssetFederation.
+    """
+    if not csv_path:
+        return None
+    if is_sheet_list(csv_path):
+        return _load_federation(csv_path)
+    if os.path.splitext(csv_path)[1].lower() in DB_EXTENSIONS:
+        from .asset_db import open_asset_db
+        return open_asset_db(csv_path)
+    try:
+        stat = os.stat(csv_path)
+    except OSError:
+        _TABLE_CACHE.pop(csv_path, None)
+        return None
+
+    table = _TABLE_CACHE.get(csv_path)
+    if table is not None and not table.is_stale(stat):
+        return table
+
+    issues = []
+    try:
+        # utf-8-sig: Excel saves CSVs with a byte order mark
+        with open(csv_path, newline='', encoding='utf-8-sig') as csvfile:
+            reader = csv.DictReader(csvfile)
+            # line 1 is the header
+            rows = [AssetRow.from_csv(data, line, issues) for line, data in enumerate(reader, start=2)]
+            fieldnames = reader.fieldnames
+    except (OSError, UnicodeDecodeError, csv.Error):
+        _TABLE_CACHE.pop(csv_path, None)
+        return None
+    table = AssetTable(csv_path, fieldnames, rows, stat.st_mtime_ns, stat.st_size, issues)
+    _TABLE_CACHE[csv_path] = table
+    return table
+
+def cached_asset_table(csv_path):
+    """The table already in memory for csv_path, without touching the file."""
+    if is_sheet_list(csv_path):
+        return _FEDERATION_CACHE.get(csv_path)
+    if os.path.splitext(csv_path)[1].lower() in DB_EXTENSIONS:
+        from .asset_db import _DB_CACHE
+        return _DB_CACHE.get(csv_path)
+    return _TABLE_CACHE.get(csv_path)
+
+def invalidate_asset_table(csv_path=None):
+    """Drops one cached table, or all of them when no path is given."""
+    if csv_path is None:
+        _TABLE_CACHE.clear()
+        _FEDERATION_CACHE.clear()
+    else:
+        _TABLE_CACHE.pop(csv_path, None)
+        _FEDERATION_CACHE.pop(csv_path, None)
+
+
+# Batched write-back
+
+WriteBackResult = namedtuple("WriteBackResult", "updated missing conflicts")
+
+LOCK_TIMEOUT = 10.0  # seconds to wait for another writer
+STALE_LOCK_AGE = 120.0  # a lock older than this is assumed abandoned
+
+def acquire_sheet_lock(csv_path, timeout=LOCK_TIMEOUT, stale_age=STALE_LOCK_AGE):
+    """Takes the advisory <sheet>.lock file every writer of the sheet honours. Returns its path."""
+    lock_path = csv_path + ".lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return lock_path
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > stale_age:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"CSV is locked by another writer: {lock_path}")
+            time.sleep(0.05)
+
+def release_sheet_lock(lock_path):
+    try:
+        os.remove(lock_path)
+    except OSError:
+        pass
+
+def write_csv_atomically(csv_path, fieldnames, rows):
+    """Writes dict rows to a temp file next to csv_path and renames it over the sheet."""
+    directory = os.path.dirname(os.path.abspath(csv_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".csv_writeback_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        # mkstemp creates the file 0600; keep the mode of the file being replaced
+        try:
+            mode = os.stat(csv_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def replace_sheet(csv_path, fieldnames, rows):
+    """Overwrites a whole sheet under the write-back lock, atomically."""
+    lock_path = acquire_sheet_lock(csv_path)
+    try:
+        write_csv_atomically(csv_path, fieldnames, rows)
+    finally:
+        invalidate_asset_table(csv_path)
+        release_sheet_lock(lock_path)
+
+
+class CSVWriteQueue:
+    """
+    Collects field updates for one operator run and writes them to the sheet
+    in a single pass: advisory lock file, re-read if the sheet changed since
+    the values were queued, temp file plus atomic rename. With several
+    sheets, each update goes to the sheet that owns the row.
+    """
+
+    LOCK_TIMEOUT = LOCK_TIMEOUT
+    STALE_LOCK_AGE = STALE_LOCK_AGE
+
+    def __init__(self, csv_path, base_table=None):
+        self.csv_path = csv_path
+        self.base_table = base_table if base_table is not None else load_asset_table(csv_path)
+        self.updates = {}  # normalized name -> {field: value}
+        self.base_values = {}  # (normalized name, field) -> value when queued
+
+    def __len__(self):
+        return len(self.updates)
+
+    def set(self, asset_name, field, value):
+        key = normalize_asset_name(asset_name)
+        self.updates.setdefault(key, {})[field] = str(value)
+        if (key, field) not in self.base_values:
+            row = self.base_table.by_name.get(key) if self.base_table else None
+            self.base_values[(key, field)] = row.get(field) if row else None
+
+    def _acquire_lock(self):
+        return acquire_sheet_lock(self.csv_path, self.LOCK_TIMEOUT, self.STALE_LOCK_AGE)
+
+    def flush(self):
+        """Applies every queued update. Returns a WriteBackResult."""
+        if not self.updates:
+            return WriteBackResult([], [], [])
+
+        if isinstance(self.base_table, AssetFederation):
+            return self._flush_federated()
+
+        # SQLite backend does row-level updates under its own locking
+        if self.base_table is not None and hasattr(self.base_table, "apply_updates"):
+            result = self.base_table.apply_updates(self.updates, self.base_values)
+            self.updates.clear()
+            self.base_values.clear()
+            return result
+
+        lock_path = self._acquire_lock()
+        try:
+            table = load_asset_table(self.csv_path)
+            if table is None:
+                return WriteBackResult([], list(self.updates), [])
+            changed_on_disk = self.base_table is not None and (
+                table.mtime_ns != self.base_table.mtime_ns or table.size != self.base_table.size)
+
+            updated, missing, conflicts = [], [], []
+            for key, fields in self.updates.items():
+                row = table.by_name.get(key)
+                if row is None:
+                    missing.append(key)
+                    continue
+                applied = False
+                for field, value in fields.items():
+                    current = row.get(field)
+                    # Someone else wrote a different value since we read the sheet
+                    if changed_on_disk and current != self.base_values.get((key, field)) and current != value:
+                        conflicts.append((row.asset_name, field, current, value))
+                        continue
+                    row[field] = value
+                    applied = True
+                if applied:
+                    updated.append(row.asset_name)
+
+            if not updated:
+                # Nothing applies, leave the sheet alone
+                self.updates.clear()
+                self.base_values.clear()
+                return WriteBackResult(updated, missing, conflicts)
+
+            # Last check for writers that don't honour the lock
+            stat = os.stat(self.csv_path)
+            if table.is_stale(stat):
+                invalidate_asset_table(self.csv_path)
+                raise RuntimeError(f"CSV changed while writing, nothing was saved: {self.csv_path}")
+
+            try:
+                write_csv_atomically(self.csv_path, table.fieldnames,
+                                     (row.to_dict(table.fieldnames) for row in table.rows))
+            finally:
+                invalidate_asset_table(self.csv_path)
+
+            self.updates.clear()
+            self.base_values.clear()
+            return WriteBackResult(updated, missing, conflicts)
+        finally:
+            release_sheet_lock(lock_path)
+
+    def _flush_federated(self):
+        by_sheet = {}
+        missing = []
+        for key, fields in self.updates.items():
+            sheet = self.base_table.sheet_by_name.get(key)
+            if sheet is None:
+                missing.append(key)
+                continue
+            queue = by_sheet.get(sheet)
+            if queue is None:
+                queue = by_sheet[sheet] = CSVWriteQueue(sheet, self.base_table.tables[sheet])
+            queue.updates[key] = fields
+            for field in fields:
+                queue.base_values[(key, field)] = self.base_values.get((key, field))
+
+        updated, conflicts = [], []
+        for queue in by_sheet.values():
+            result = queue.flush()
+            updated += result.updated
+            missing += result.missing
+            conflicts += result.conflicts
+        self.updates.clear()
+        self.base_values.clear()
+        return WriteBackResult(updated, missing, conflicts)
@@ -0,0 +1,221 @@
+"""
+Headless batch validator for a directory of .blend files.
+
+Runs outside Blender and farms each .blend out to a pool of `blender -b`
+worker processes. Every worker validates the file's assets (triangle
+budget, naming, material and texture memory checks) against the shared asset
+sheet and prints its results back; they are merged into one report.
+
+    python batch_validate.py <depot_dir> --csv GameData.csv --report nightly.html
+        [--blender blender] [--workers 4] [--timeout 600] [--force]
+
+Finished files are journaled next to the report, so a crashed or killed
+run picks up where it stopped, and files unchanged since the last run
+(same mtime, size and asset sheet) are not opened again.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+RESULT_MARKER = "@@CSV2MESH_RESULT@@"
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# Worker side, runs inside `blender -b file.blend --python batch_validate.py -- --worker ...`
+
+def run_worker(args):
+    import importlib
+    import bpy
+
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+    addon = importlib.import_module(os.path.basename(ADDON_DIR))
+    asset_table = importlib.import_module(addon.__name__ + ".asset_table")
+    scene_validation = importlib.import_module(addon.__name__ + ".scene_validation")
+
+    table = asset_table.load_asset_table(args.csv)
+    results = []
+    for scene in bpy.data.scenes:
+        depsgraph = None
+        if args.modifiers:
+            # Nothing has been evaluated yet in a freshly loaded headless file
+            view_layer = scene.view_layers[0]
+            view_layer.update()
+            depsgraph = view_layer.depsgraph
+        for result in scene_validation.validate_scene(scene, table, depsgraph, extra_checks=True,
+                                                      texture_format=args.texture_format):
+            result["scene"] = scene.name
+            results.append(result)
+
+    print(RESULT_MARKER + json.dumps({"results": results}), flush=True)
+
+
+# Orchestrator side
+
+def find_blend_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.lower().endswith(".blend"):
+                yield os.path.join(dirpath, name)
+
+def sheet_list_abspath(spec):
+    return ";".join(os.path.abspath(p.strip()) for p in spec.split(";") if p.strip())
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def load_journal(journal_path):
+    """Last journaled entry per .blend file."""
+    entries = {}
+    if not os.path.exists(journal_path):
+        return entries
+    with open(journal_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn last line from a crash
+            entries[entry["file"]] = entry
+    return entries
+
+def compact_journal(journal_path, entries):
+    """Rewrites the journal with one line per file, atomically (temp file + rename)."""
+    directory = os.path.dirname(os.path.abspath(journal_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".journal_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the mode of the file being replaced
+        try:
+            mode = os.stat(journal_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, journal_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def validate_file(blend_path, args):
+    """Runs one Blender worker and returns its per-asset results."""
+    cmd = [
+        args.blender, "-b", blend_path, "--factory-startup",
+        "--python", os.path.abspath(__file__),
+        "--", "--worker", "--csv", sheet_list_abspath(args.csv),
+        "--texture-format", args.texture_format,
+    ]
+    if args.modifiers:
+        cmd.append("--modifiers")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        return "TIMEOUT", [{"status": "TIMEOUT"}], time.perf_counter() - start
+    except OSError as e:
+        return "CRASHED", [{"status": "CRASHED", "issues": [str(e)]}], time.perf_counter() - start
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return "OK", json.loads(line[len(RESULT_MARKER):])["results"], time.perf_counter() - start
+    tail = (proc.stderr or proc.stdout).strip().splitlines()[-5:]
+    return "CRASHED", [{"status": "CRASHED", "issues": tail}], time.perf_counter() - start
+
+def run_batch(args):
+    # Imported here so the worker side never needs it on sys.path
+    sys.path.insert(0, ADDON_DIR)
+    from validation_report import write_report
+    from asset_table import expand_sheet_spec
+
+    journal_path = args.journal or os.path.splitext(args.report)[0] + ".journal.jsonl"
+    journal = {} if args.force else load_journal(journal_path)
+    csv_signature = [file_signature(p) for p in expand_sheet_spec(args.csv)]
+
+    files = sorted(find_blend_files(args.depot))
+    todo, reused = [], {}
+    for path in files:
+        entry = journal.get(path)
+        if (entry and entry["state"] == "OK" and entry["signature"] == file_signature(path)
+                and entry["csv_signature"] == csv_signature):
+            reused[path] = entry
+        else:
+            todo.append(path)
+    print(f"{len(files)} .blend files, {len(reused)} unchanged since the last run, {len(todo)} to validate")
+
+    entries = dict(reused)
+    with open(journal_path, 'a', encoding='utf-8') as journal_file, \
+            ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(validate_file, path, args): path for path in todo}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            state, results, seconds = future.result()
+            entry = {
+                "file": path,
+                "state": state,
+                "signature": file_signature(path),
+                "csv_signature": csv_signature,
+                "seconds": round(seconds, 2),
+                "results": results,
+            }
+            # Journal as we go so a crash only loses the files still running
+            journal_file.write(json.dumps(entry) + "\n")
+            journal_file.flush()
+            entries[path] = entry
+            print(f"[{done}/{len(todo)}] {state:8} {seconds:6.1f}s {os.path.relpath(path, args.depot)}")
+
+    # The run finished: drop superseded lines and files that are gone
+    compact_journal(journal_path, [entries[path] for path in files])
+
+    merged = []
+    for path in files:
+        for result in entries[path]["results"]:
+            merged.append(dict(result, file=os.path.relpath(path, args.depot)))
+    failed = sum(1 for r in merged if r.get("status") != "OK" or r.get("issues"))
+    meta = {
+        "depot": os.path.abspath(args.depot),
+        "csv": sheet_list_abspath(args.csv),
+        "files": len(files),
+        "validated": len(todo),
+        "skipped_unchanged": len(reused),
+        "assets": len(merged),
+        "failed": failed,
+    }
+    write_report(merged, args.report, meta)
+    print(f"{len(merged)} assets, {failed} with issues. Report: {args.report}")
+    return 1 if failed else 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Validate every .blend in a directory against the asset sheet.")
+    parser.add_argument("depot", nargs="?", help="Directory to search for .blend files")
+    parser.add_argument("--csv", required=True, help="Asset sheet (.csv or SQLite .db); several as a ';' separated list or glob")
+    parser.add_argument("--report", default="validation_report.json", help="Merged report (.json, .csv or .html)")
+    parser.add_argument("--blender", default="blender", help="Blender executable used for the workers")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Parallel Blender processes")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds before a worker is killed")
+    parser.add_argument("--journal", help="Resume journal (default: next to the report)")
+    parser.add_argument("--force", action="store_true", help="Ignore the journal and validate every file")
+    parser.add_argument("--modifiers", action="store_true", help="Count triangles with modifiers applied")
+    parser.add_argument("--texture-format", default="AUTO", help="Compression format for texture memory estimates (AUTO, BC1, BC3, BC5, BC7, ASTC4, RGBA8, RGBA16F)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    # Blender passes its own arguments first; ours come after "--"
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = parse_args(argv)
+    if args.worker:
+        run_worker(args)
+    else:
+        if not args.depot:
+            sys.exit("depot directory is required")
+        sys.exit(run_batch(args))
@@ -1,11 +1,20 @@
 import bpy
+import os
+import time
 
 from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, CollectionProperty, PointerProperty
-import csv
+
+from .asset_table import (PREFIX_LIST, AssetCategory, strip_prefix, take_away_underscore, load_asset_table, cached_asset_table,
+                          is_sheet_list, sheet_spec_abspath, budget_status, CSVWriteQueue)
+from .asset_db import open_asset_db, is_asset_db_path, close_asset_dbs
+from .viewport_overlay import overlay_toggled
+from .rename_planner import plan_renames
+from .scene_validation import scene_sheet_path, build_root_map, triangle_count, get_asset_status, get_panel_status
+from .result_log import (message_code, active_result_log, start_result_log, resume_result_log,
+                         suspend_result_log, end_result_log, last_result_log)
 
 # configs [to remove]
 CSV_PATH = "I:/Blender/MyScripts/GameData.csv"  # Update this path!
-PREFIX_LIST = ['SM_', 'SK_', 'MM_']  # unreal naming conventions
 
 # utility functions
 
@@ -15,32 +24,17 @@ def is_triangle_count_within_budget(obj):
     root = obj
     while root.parent:
         root = root.parent
-    asset_name = strip_prefix(root.name)
-    row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(asset_name)
+    row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(root.name)
     if not row:
         return None  # No CSV row found
-    max_tris = int(row.get('MaxTris', 0))
-    actual_triangles = len(obj.data.polygons)
-    return actual_triangles <= max_tris
-
-def strip_prefix(name, prefixes=PREFIX_LIST):
-    for prefix in prefixes:
-        if name.startswith(prefix):
-            return name[len(prefix):]
-    # If it cant find prefix, strip up to first underscore
-    if "_" in name:
-        return name.split("_", 1)[1]
-    return name
-    
-def take_away_underscore(name):
-    """
-    Joins the two parts of the string split by the last underscore.
-    Example: "SM_Asset_LOD1" -> "SM_AssetLOD1"
-    """
-    if "_" in name:
-        parts = name.rsplit("_", 1)
-        return parts[0] + parts[1]
-    return name
+    status = budget_status(row, triangle_count(obj.data))
+    if status == 'BAD_CSV_ROW':
+        return None  # Malformed row, reported when the CSV was loaded
+    return status == 'OK'
+
+def get_asset_table():
+    """Cached asset table for the scene's CSV, re-read only when the file changes."""
+    return load_asset_table(scene_sheet_path(bpy.context.scene))
 
 
 # debug method
@@ -49,13 +43,70 @@ def show_message(message="", title="Error", icon='ERROR'):
         self.layout.label(text=message)
     bpy.context.window_manager.popup_menu(draw, title=title, icon=icon)
 
+def log_result(obj_name, message="", title="Error", icon='ERROR'):
+    """
+    Records a per-object message in the running operator's result log, or
+    shows it as a popup when called outside a batch operator.
+    """
+    log = active_result_log()
+    if log is None:
+        show_message(message, title=title, icon=icon)
+        return
+    severity = icon if icon in ('ERROR', 'WARNING') else 'INFO'
+    log.add(obj_name, message_code(title), message, severity)
+
+def known_prefixes(scene):
+    """PREFIX_LIST plus the prefixes from the scene's custom prefix list, each ending in '_'."""
+    prefixes = list(PREFIX_LIST)
+    for item in scene.csv2mesh_prefixes:
+        prefix = item.prefix.strip("_")
+        if prefix and prefix + "_" not in prefixes:
+            prefixes.append(prefix + "_")
+    return prefixes
+
+def apply_renames(requests, record_original=False, overwrite_original=False):
+    """
+    Renames objects ({current name: new name}) as one planned batch, see
+    rename_planner. Returns the RenamePlan with what was renamed and skipped.
+    """
+    # Linked objects can't be renamed and don't share the local namespace
+    objects = {obj.name: obj for obj in bpy.data.objects if obj.library is None}
+    plan = plan_renames({old: new for old, new in requests.items() if old in objects}, objects.keys())
+    if record_original:
+        for old, new in plan.renamed:
+            obj = objects[old]
+            if overwrite_original or "original_name" not in obj:
+                obj["original_name"] = old
+    for current, new in plan.steps:
+        obj = objects.pop(current)
+        obj.name = new
+        objects[new] = obj
+    return plan
+
+def report_renames(operator, plan):
+    for skip in plan.skipped[:10]:
+        operator.report({'WARNING'}, f"Not renamed '{skip.old}' -> '{skip.new}': {skip.reason}")
+    if len(plan.skipped) > 10:
+        operator.report({'WARNING'}, f"... {len(plan.skipped) - 10} more renames skipped")
+    operator.report({'WARNING'} if plan.skipped else {'INFO'},
+                    f"Renamed {len(plan)} objects, skipped {len(plan.skipped)}.")
+
+RESULT_TEXT_NAME = "CSV2Mesh Results"
+
+def publish_result_log(log):
+    """Writes the full log to a Text datablock so it can be scrolled in the Text Editor."""
+    text = bpy.data.texts.get(RESULT_TEXT_NAME) or bpy.data.texts.new(RESULT_TEXT_NAME)
+    text.clear()
+    text.write(log.to_text())
+    return text
+
 
 
 def clear_custom_properties(obj):
     keys_to_remove = [k for k in obj.keys() if not k.startswith("_")]
     for k in keys_to_remove:
         del obj[k]
-    show_message(f"Cleared custom properties for {obj.name}.", title="Custom Properties Cleared", icon='INFO')
+    log_result(obj.name, f"Cleared custom properties for {obj.name}.", title="Custom Properties Cleared", icon='INFO')
 
 
 #CSV data read/write functions
@@ -75,64 +126,121 @@ class CSV2MESH_OT_SetCSVData(bpy.types.Operator):
         self.report({'INFO'}, f"CSV path set to: {CSV_PATH}")
         return {'FINISHED'}
     
-    def get_csv_row_for_asset(asset_name):
-        asset_name = asset_name # Normalize asset name
-        asset_name = strip_prefix(asset_name).lower()
-        asset_name = take_away_underscore(asset_name.lower())
-
-        csv_path = bpy.context.scene.csv_path.lower()
-        with open(csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if strip_prefix(row.get('AssetName', '')).lower() == asset_name:
-                    return row
-                if strip_prefix(row.get('AssetName', '')).lower() in asset_name:
-                    return row
-        return None
+    def resolve_csv_row_for_asset(asset_name):
+        table = get_asset_table()
+        if table is None:
+            return None
+        return table.resolve(asset_name)
+
+    def get_csv_row_for_asset(asset_name, obj_name=None):
+        """Sheet row for asset_name; a miss or an unconfirmed match is logged under obj_name."""
+        obj_name = obj_name or asset_name
+        resolution = CSV2MESH_OT_SetCSVData.resolve_csv_row_for_asset(asset_name)
+        if resolution and resolution.ambiguous:
+            candidates = ", ".join(c.row.asset_name for c in resolution.candidates)
+            log_result(obj_name, f"Asset '{asset_name}' has no exact CSV row. Closest: {candidates}. Please rename it to one of them to confirm.", title="Unconfirmed CSV Row", icon='ERROR')
+            return None
+        if resolution is None or resolution.row is None:
+            log_result(obj_name, f"No CSV row found for asset '{asset_name}'. Please check the CSV file.", title="CSV Row Not Found", icon='ERROR')
+            return None
+        return resolution.row
     
+class CSV2MESH_OT_ImportCSVToDatabase(bpy.types.Operator):
+    bl_idname = "csv2mesh.import_csv_to_database"
+    bl_label = "Convert CSV to SQLite"
+    bl_description = "Import the current CSV into a SQLite asset database next to it and switch to it"
+    bl_options = {'REGISTER'}
+
+    @staticmethod
+    def paths(context):
+        csv_path = bpy.path.abspath(context.scene.csv_path)
+        return csv_path, os.path.splitext(csv_path)[0] + ".db"
+
+    def invoke(self, context, event):
+        _, db_path = self.paths(context)
+        if os.path.isfile(db_path):
+            # The existing table is replaced; ask first (a backup is kept either way)
+            return context.window_manager.invoke_confirm(
+                self, event, title="Replace Asset Database?",
+                message=f"{os.path.basename(db_path)} already exists. Its assets will be replaced "
+                        f"(a copy is kept as {os.path.basename(db_path)}.bak).",
+                confirm_text="Replace")
+        return self.execute(context)
+
+    def execute(self, context):
+        csv_path, db_path = self.paths(context)
+        if is_asset_db_path(csv_path) or not os.path.isfile(csv_path):
+            self.report({'ERROR'}, "CSV Path must point at an existing .csv file.")
+            return {'CANCELLED'}
+        db = open_asset_db(db_path, create=True)
+        backup = None
+        if db.row_count():
+            backup = db_path + ".bak"
+            db.backup(backup)
+        count = db.import_csv(csv_path)
+        context.scene.csv_path = db_path
+        self.report({'INFO'}, f"Imported {count} rows into {db_path}" + (f", previous contents saved to {backup}" if backup else ""))
+        return {'FINISHED'}
+
+class CSV2MESH_OT_ExportDatabaseToCSV(bpy.types.Operator):
+    bl_idname = "csv2mesh.export_database_to_csv"
+    bl_label = "Export SQLite to CSV"
+    bl_description = "Write the SQLite asset database back out in the CSV layout"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        db_path = bpy.path.abspath(context.scene.csv_path)
+        db = open_asset_db(db_path) if is_asset_db_path(db_path) else None
+        if db is None:
+            self.report({'ERROR'}, "CSV Path must point at an existing asset database.")
+            return {'CANCELLED'}
+        csv_path = os.path.splitext(db_path)[0] + ".csv"
+        try:
+            count = db.export_csv(csv_path)
+        except (TimeoutError, OSError) as e:
+            self.report({'ERROR'}, f"CSV export failed: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {count} rows to {csv_path}")
+        return {'FINISHED'}
+
 # CSV write to update actual triangles count
 
     # very risky function, use with caution
     
-def update_actual_tris_in_csv(asset_name, actual_tris, csv_path):
+def update_actual_tris_in_csv(asset_name, actual_tris, csv_path, queue=None):
+    """
+    Queues an ActualTris update. Without a queue the change is written
+    straight away; batch operators pass their own queue and flush it once.
+    """
     if csv_path is None or not csv_path:
-        show_message("CSV path is not set. Please set the CSV path first.", title="CSV Path Not Set", icon='ERROR')
+        log_result(asset_name, "CSV path is not set. Please set the CSV path first.", title="CSV Path Not Set", icon='ERROR')
         return
-    rows = []
-    updated = False
-    
-    # Read all rows
-    with open(csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        fieldnames = reader.fieldnames
-        for row in reader:
-            if strip_prefix(row.get('AssetName', '')) == strip_prefix(asset_name):
-                row['ActualTris'] = str(actual_tris)
-                updated = True
-            rows.append(row)
-    # Write all rows back
-    if updated:
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-        show_message(f"Updated ActualTris for {asset_name} to {actual_tris}.", title="CSV Updated", icon='INFO')
+    if queue is not None:
+        queue.set(asset_name, 'ActualTris', actual_tris)
+        return
+
+    queue = CSVWriteQueue(sheet_spec_abspath(csv_path, bpy.path.abspath))
+    queue.set(asset_name, 'ActualTris', actual_tris)
+    result = queue.flush()
+    if result.updated:
+        log_result(asset_name, f"Updated ActualTris for {asset_name} to {actual_tris}.", title="CSV Updated", icon='INFO')
     else:
-        show_message(f"Asset {asset_name} not found in CSV.", title="CSV Update Failed", icon='ERROR')
+        log_result(asset_name, f"Asset {asset_name} not found in CSV.", title="CSV Update Failed", icon='ERROR')
 
 # Main functions
 
-def process_asset(obj):
-    """Rename and tag the object based on CSV data."""
+def process_asset(obj, renames=None):
+    """
+    Rename and tag the object based on CSV data. With a renames dict the
+    rename is only queued there, for the caller to apply in one batch.
+    """
     clear_custom_properties(obj)
     root = obj
     while root.parent:
         root = root.parent
-    asset_name = strip_prefix(root.name).lower()
+    asset_name = root.name  # resolve() strips the prefix itself
     row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(asset_name)
-
     if not row:
-        show_message(f"No CSV row found for asset '{asset_name}'. Please check the CSV file.", title="CSV Row Not Found", icon='ERROR')
         return
     
 
@@ -141,24 +249,24 @@ def process_asset(obj):
         root["original_name"] = root.name
 
     # Assign asset name property
-    root["AssetName"] = row['AssetName']
-    show_message(f"Asset name '{row['AssetName']}' matches the selected rootect '{root.name}'.", title="Asset Name Match", icon='INFO')
+    root["AssetName"] = row.asset_name
+    log_result(root.name, f"Asset name '{row.asset_name}' matches the selected rootect '{root.name}'.", title="Asset Name Match", icon='INFO')
 
     # Asset type logic
-    asset_type = row.get('Category', None)
+    asset_type = row.category
     if asset_type:
-        show_message(f"Asset type '{asset_type}' found and stored.", title="Asset Type", icon='INFO')
-        if asset_type in ("Environment", "Prop"):
+        log_result(root.name, f"Asset type '{row.category_name}' found and stored.", title="Asset Type", icon='INFO')
+        if asset_type in (AssetCategory.ENVIRONMENT, AssetCategory.PROP):
             root["AssetType"] = "StaticMesh"
-            new_name = f"SM_{row['AssetName']}"
-        elif asset_type == "Character":
+            new_name = f"SM_{row.asset_name}"
+        elif asset_type is AssetCategory.CHARACTER:
             root["AssetType"] = "SkeletalMesh"
-            new_name = f"SK_{row['AssetName']}"
+            new_name = f"SK_{row.asset_name}"
         else:
-            root["AssetType"] = asset_type
+            root["AssetType"] = row.category_name
             new_name = root.name  # No change
     else:
-        show_message("Asset type not found in CSV row.", title="Asset Type Not Found", icon='ERROR')
+        log_result(root.name, "Asset type not found in CSV row.", title="Asset Type Not Found", icon='ERROR')
         print(f"root.name: {root.name}, new_name: {new_name}")
         print(f"Comparison result: {root.name.lower() == new_name.lower()}")
         new_name = root.name
@@ -167,14 +275,21 @@ def process_asset(obj):
     # Rename if needed
     if root.name.lower() != new_name.lower():
         if bpy.context.scene.csv2mesh_dont_ask_again:
-            old_name = root.name
-            root.name = new_name
-            show_message(f"Renamed rootect from '{old_name}' to '{new_name}' without confirmation.", title="Renaming Rootect", icon='INFO')
+            if renames is not None:
+                renames[root.name] = new_name
+                log_result(root.name, f"Renaming '{root.name}' to '{new_name}' without confirmation.", title="Renaming Rootect", icon='INFO')
+            else:
+                old_name = root.name
+                plan = apply_renames({old_name: new_name})
+                if plan.skipped:
+                    log_result(old_name, f"Could not rename '{old_name}' to '{new_name}': {plan.skipped[0].reason}", title="Rename Skipped", icon='ERROR')
+                else:
+                    log_result(root.name, f"Renamed rootect from '{old_name}' to '{new_name}' without confirmation.", title="Renaming Rootect", icon='INFO')
         else:
             bpy.ops.csv2mesh.show_name_correction('INVOKE_DEFAULT', incorrect_name=root.name, correct_name=new_name)
-            show_message(f"Renaming rootect from '{root.name}' to '{new_name}'", title="Renaming rootect", icon='INFO')
+            log_result(root.name, f"Renaming rootect from '{root.name}' to '{new_name}'", title="Renaming rootect", icon='INFO')
     else:
-        show_message(f"No renaming needed for {root.name}, already matches '{new_name}'.", title="No Renaming Needed", icon='INFO')
+        log_result(root.name, f"No renaming needed for {root.name}, already matches '{new_name}'.", title="No Renaming Needed", icon='INFO')
 
     # Optionally assign master material
     assign_master_material(root, row)
@@ -185,23 +300,18 @@ def assign_master_material(obj, row=None):
         root = obj
         while root.parent:
              root = root.parent
-        asset_name = strip_prefix(root.name)
-        row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(asset_name)
+        row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(root.name, obj.name)
         if not row:
-            show_message(f"No CSV row found for {obj.name} for material assignment.", title="CSV Row Not Found", icon='ERROR')
             return
 
-    master_material = row.get('MasterMaterial', None)
+    # Already carries the MM_ prefix
+    master_material = row.master_material
     if not master_material:
-        show_message(f"No MasterMaterial found for {obj.name} in CSV.", title="Master Material Not Found", icon='ERROR')
+        log_result(obj.name, f"No MasterMaterial found for {obj.name} in CSV.", title="Master Material Not Found", icon='ERROR')
         return
 
-    # Ensure MM_ prefix
-    if not master_material.startswith("MM_"):
-        master_material = "MM_" + master_material
-
     obj["MasterMaterial"] = master_material
-    show_message(f"Assigned MasterMaterial '{master_material}' to {obj.name} as custom property.", title="Master Material Assigned", icon='INFO')
+    log_result(obj.name, f"Assigned MasterMaterial '{master_material}' to {obj.name} as custom property.", title="Master Material Assigned", icon='INFO')
 
     # New Operation: Rename current material or Create a new one
     # Rename check
@@ -210,14 +320,14 @@ def assign_master_material(obj, row=None):
         if mat.name != master_material:
             old_name = mat.name
             mat.name = master_material
-            show_message(f"Renamed material from '{old_name}' to '{master_material}' for {obj.name}.", title="Material Renamed", icon='INFO')
+            log_result(obj.name, f"Renamed material from '{old_name}' to '{master_material}' for {obj.name}.", title="Material Renamed", icon='INFO')
         else:
-            show_message(f"Material '{master_material}' already assigned to {obj.name}.", title="Material Already Assigned", icon='INFO')
+            log_result(obj.name, f"Material '{master_material}' already assigned to {obj.name}.", title="Material Already Assigned", icon='INFO')
 
     if mat is None:
         # Create a new material if it doesn't exist
         mat = bpy.data.materials.new(name=master_material)
-        show_message(f"Created new material: {master_material} for {obj.name}.", title="Material Created", icon='INFO')
+        log_result(obj.name, f"Created new material: {master_material} for {obj.name}.", title="Material Created", icon='INFO')
         # Assign the new material to the object
         if obj.type == 'MESH':
             if not obj.data.materials:
@@ -226,7 +336,7 @@ def assign_master_material(obj, row=None):
                 # Replace existing materials with the new one
                 for i in range(len(obj.data.materials)):
                     obj.data.materials[i] = mat
-            show_message(f"Assigned material '{master_material}' to {obj.name}.", title="Material Assigned", icon='INFO')
+            log_result(obj.name, f"Assigned material '{master_material}' to {obj.name}.", title="Material Assigned", icon='INFO')
 
     
     
@@ -248,37 +358,258 @@ def assign_master_material(obj, row=None):
 
 # --- BLENDER OPERATORS AND PANEL ---
 
-class CSV2MESH_OT_ProcessSelected(bpy.types.Operator):
+class CSV2MESH_BatchOperator:
+    """
+    Mixin for operators that work through the selection one object at a time.
+    invoke() runs the job modally from a timer: each tick handles as many objects
+    as fit in TIME_BUDGET, sized from the measured time per object, shows
+    progress in the status bar and can be cancelled with Esc. execute() still
+    runs everything in one go for scripts and redo.
+
+    Per-object messages go to a ResultLog for the run instead of popups; at
+    the end the log is written to the "CSV2Mesh Results" text and summarised
+    in one dialog (invoke) or one report line (execute).
+
+    Subclasses implement process_object() and optionally begin()/finish().
+    """
+    TIME_BUDGET = 0.05  # seconds of work per timer tick
+
+    def begin(self, context):
+        pass
+
+    def process_object(self, context, obj):
+        raise NotImplementedError
+
+    def finish(self, context, cancelled=False):
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
+
+    def execute(self, context):
+        log = start_result_log(self.bl_label)
+        try:
+            self.begin(context)
+            for obj in context.selected_objects:
+                self.process_object(context, obj)
+            result = self.finish(context)
+        finally:
+            end_result_log(log)
+        self._report_result_log(log, dialog=False)
+        return result
+
+    def invoke(self, context, event):
+        self._objects = list(context.selected_objects)
+        self._index = 0
+        self._chunk = 1
+        self._seconds_per_object = None
+        self._log = start_result_log(self.bl_label)
+        try:
+            self.begin(context)
+        finally:
+            suspend_result_log()
+
+        wm = context.window_manager
+        wm.progress_begin(0, max(1, len(self._objects)))
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.report({'WARNING'}, f"{self.bl_label} cancelled after {self._index} of {len(self._objects)} objects.")
+            return self._end_modal(context, cancelled=True)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        start = time.perf_counter()
+        end = min(self._index + self._chunk, len(self._objects))
+        # Only active during our own ticks, other operators still get their popups
+        resume_result_log(self._log)
+        try:
+            for obj in self._objects[self._index:end]:
+                try:
+                    obj.name  # raises if the object was deleted while the job was running
+                except ReferenceError:
+                    continue
+                self.process_object(context, obj)
+        finally:
+            suspend_result_log()
+        done = end - self._index
+        self._index = end
+
+        # Adapt the chunk size so each tick stays within the time budget
+        if done:
+            per_object = (time.perf_counter() - start) / done
+            if self._seconds_per_object is None:
+                self._seconds_per_object = per_object
+            else:
+                self._seconds_per_object = 0.7 * self._seconds_per_object + 0.3 * per_object
+            self._chunk = max(1, int(self.TIME_BUDGET / max(self._seconds_per_object, 1e-6)))
+
+        context.window_manager.progress_update(self._index)
+        context.workspace.status_text_set(
+            f"{self.bl_label}: {self._index}/{len(self._objects)} objects (Esc to cancel)")
+
+        if self._index >= len(self._objects):
+            return self._end_modal(context)
+        return {'RUNNING_MODAL'}
+
+    def _end_modal(self, context, cancelled=False):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        resume_result_log(self._log)
+        try:
+            result = self.finish(context, cancelled)
+        finally:
+            end_result_log(self._log)
+        self._report_result_log(self._log, dialog=True)
+        return result
+
+    def _report_result_log(self, log, dialog):
+        if not log.entries:
+            return
+        publish_result_log(log)
+        counts = log.counts()
+        self.report({'WARNING'} if counts['ERROR'] else {'INFO'}, log.summary())
+        if dialog:
+            bpy.ops.csv2mesh.show_result_log('INVOKE_DEFAULT')
+
+
+class CSV2MESH_OT_ShowResultLog(bpy.types.Operator):
+    bl_idname = "csv2mesh.show_result_log"
+    bl_label = "Batch Results"
+    bl_description = "Summary of the last batch operator run"
+
+    MAX_ROWS = 12
+
+    @classmethod
+    def poll(cls, context):
+        return last_result_log() is not None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_popup(self, width=500)
+
+    def execute(self, context):
+        return {'FINISHED'}
+
+    def draw(self, context):
+        log = last_result_log()
+        layout = self.layout
+        counts = log.counts()
+        layout.label(text=log.summary())
+        row = layout.row()
+        row.label(text=f"{counts['ERROR']} errors", icon='ERROR')
+        row.label(text=f"{counts['WARNING']} warnings", icon='INFO')
+
+        # Most common problems, then the first few errors
+        box = layout.box()
+        for code, count in list(log.code_counts('ERROR').items())[:5]:
+            box.label(text=f"{code}: {count}", icon='ERROR')
+        errors = [e for e in log.entries if e.severity == 'ERROR']
+        for entry in errors[:self.MAX_ROWS]:
+            box.label(text=f"{entry.obj_name}: {entry.message}")
+        if len(errors) > self.MAX_ROWS:
+            box.label(text=f"... {len(errors) - self.MAX_ROWS} more, see the '{RESULT_TEXT_NAME}' text")
+
+        row = layout.row()
+        row.operator("csv2mesh.open_result_log", icon='TEXT')
+        row.operator("csv2mesh.save_result_log", icon='EXPORT')
+
+
+class CSV2MESH_OT_OpenResultLog(bpy.types.Operator):
+    bl_idname = "csv2mesh.open_result_log"
+    bl_label = "Open Full Report"
+    bl_description = "Show the full result log of the last batch run in a Text Editor"
+
+    @classmethod
+    def poll(cls, context):
+        return last_result_log() is not None
+
+    def execute(self, context):
+        text = publish_result_log(last_result_log())
+        # Reuse an open Text Editor, otherwise turn the largest area into one
+        area = next((a for a in context.screen.areas if a.type == 'TEXT_EDITOR'), None)
+        if area is None:
+            area = max(context.screen.areas, key=lambda a: a.width * a.height)
+            area.type = 'TEXT_EDITOR'
+        area.spaces.active.text = text
+        return {'FINISHED'}
+
+
+class CSV2MESH_OT_SaveResultLog(bpy.types.Operator):
+    bl_idname = "csv2mesh.save_result_log"
+    bl_label = "Save Results as JSON"
+    bl_description = "Save the result log of the last batch run to a JSON file"
+
+    filepath: StringProperty(subtype='FILE_PATH', default="//batch_results.json")
+
+    @classmethod
+    def poll(cls, context):
+        return last_result_log() is not None
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        try:
+            last_result_log().write_json(path)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {path}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Saved batch results to {path}")
+        return {'FINISHED'}
+
+
+class CSV2MESH_OT_ProcessSelected(CSV2MESH_BatchOperator, bpy.types.Operator):
     bl_idname = "csv2mesh.process_selected"
     bl_label = "Process Selected Assets"
     bl_description = "Process selected objects using CSV data"
+    bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
-        for obj in context.selected_objects:
-            process_asset(obj)
-            #print_custom_properties(obj)
-        self.report({'INFO'}, "Processed selected assets.")
+    def begin(self, context):
+        self._renames = {}
+
+    def process_object(self, context, obj):
+        process_asset(obj, self._renames)
+        #print_custom_properties(obj)
+
+    def finish(self, context, cancelled=False):
+        # All queued root renames at once, so swapped names don't end up as .001
+        plan = apply_renames(self._renames, record_original=True)
+        for skip in plan.skipped:
+            log_result(skip.old, f"Could not rename '{skip.old}' to '{skip.new}': {skip.reason}", title="Rename Skipped", icon='ERROR')
+        if cancelled:
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Processed selected assets, renamed {len(plan)}.")
         return {'FINISHED'}
 
-class CSV2MESH_OT_ClearCustomProps(bpy.types.Operator):
+class CSV2MESH_OT_ClearCustomProps(CSV2MESH_BatchOperator, bpy.types.Operator):
     bl_idname = "csv2mesh.clear_custom_props"
     bl_label = "Clear Custom Properties"
     bl_description = "Clear custom properties from selected objects"
 
-    def execute(self, context):
-        for obj in context.selected_objects:
-            clear_custom_properties(obj)
+    def process_object(self, context, obj):
+        clear_custom_properties(obj)
+
+    def finish(self, context, cancelled=False):
+        if cancelled:
+            return {'CANCELLED'}
         self.report({'INFO'}, "Cleared custom properties.")
         return {'FINISHED'}
 
-class CSV2MESH_OT_AssignMasterMaterial(bpy.types.Operator):
+class CSV2MESH_OT_AssignMasterMaterial(CSV2MESH_BatchOperator, bpy.types.Operator):
     bl_idname = "csv2mesh.assign_master_material"
     bl_label = "Assign Master Material"
     bl_description = "Assign master material from CSV to selected objects"
 
-    def execute(self, context):
-        for obj in context.selected_objects:
-            assign_master_material(obj)
+    def process_object(self, context, obj):
+        assign_master_material(obj)
+
+    def finish(self, context, cancelled=False):
+        if cancelled:
+            return {'CANCELLED'}
         self.report({'INFO'}, "Assigned master material.")
         return {'FINISHED'}
 
@@ -296,10 +627,21 @@ class CSV2MESH_PT_ToolsPanel(bpy.types.Panel):
         row = layout.row()
         
         row.prop(context.scene, "csv_path", text="CSV Path")
+        if is_sheet_list(context.scene.csv_path):
+            table = cached_asset_table(scene_sheet_path(context.scene))
+            if table is not None:
+                icon = 'ERROR' if table.conflicts else 'FILE'
+                layout.label(text=f"{len(table.tables)} sheets, {len(table.conflicts)} duplicate asset names", icon=icon)
+        elif is_asset_db_path(context.scene.csv_path):
+            row.operator("csv2mesh.export_database_to_csv", text="", icon='EXPORT')
+        else:
+            row.operator("csv2mesh.import_csv_to_database", text="", icon='DISK_DRIVE')
         
         layout.operator("csv2mesh.process_selected", icon='CHECKMARK')
         layout.operator("csv2mesh.assign_master_material", icon='MATERIAL')
         layout.operator("csv2mesh.clear_custom_props", icon='X')
+        if last_result_log() is not None:
+            layout.operator("csv2mesh.show_result_log", text="Last Batch Results", icon='TEXT')
 
         layout.separator()
         layout.label(text="Asset Management Tools", icon='ASSET_MANAGER')
@@ -326,41 +668,53 @@ class CSV2MESH_PT_ToolsPanel(bpy.types.Panel):
         layout.separator()
         layout.label(text="Mesh Validation Tools", icon='CHECKMARK')
         layout.operator("csv2mesh.validate_triangle_count", text="Validate Triangle Count", icon='TRIA_DOWN')
+        box = layout.box()
+        box.prop(context.scene, "csv2mesh_report_path", text="Report")
+        box.prop(context.scene, "csv2mesh_report_use_modifiers")
+        box.prop(context.scene, "csv2mesh_texture_format")
+        box.operator("csv2mesh.validate_scene", icon='SCENE_DATA')
+        layout.prop(context.scene, "csv2mesh_live_validation")
+        if context.scene.csv2mesh_live_validation and context.active_object:
+            status = get_asset_status(context.active_object)
+            if status is None:
+                layout.label(text="Live: not edited yet", icon='TIME')
+            elif status["status"] == "OK":
+                layout.label(text=f"Live: OK ({status['tris']}/{status['max_tris']})", icon='CHECKMARK')
+            else:
+                layout.label(text=f"Live: {status['status']} ({status['tris']}/{status['max_tris']})", icon='ERROR')
 
         obj = context.active_object
         if obj is not None and context.selected_objects:
-            # Use parent name if available
-            root = obj
-            while root.parent:
-                root = root.parent
-            asset_name = strip_prefix(root.name)
-            csv_row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(asset_name)
+            # Cached readout, filled in lazily so redraws do no file or mesh work
+            status = get_panel_status(obj)
             box = layout.box()
             row = box.row()
             col1 = row.column(align=True)
             col2 = row.column(align=True)
             col1.label(text=f"Active Object: {obj.name}", icon='OBJECT_DATA')
-            if obj.type == 'MESH':
-                col1.label(text=f"Actual Tris: {len(obj.data.polygons)}")
-            else:
-                col1.label(text="Actual Tris: N/A, not a mesh object")
             col2.label(text="CSV Data", icon='FILE_TEXT')
-            if csv_row:
-                col2.label(text=f"Max Tris: {csv_row.get('MaxTris', 'N/A')}")
+            if status is None:
+                col1.label(text="Actual Tris: ...")
+                col2.label(text="Max Tris: ...")
             else:
-                col2.label(text="Max Tris: N/A")
+                if status["tris"] is not None:
+                    col1.label(text=f"Actual Tris: {status['tris']}")
+                else:
+                    col1.label(text="Actual Tris: N/A, not a mesh object")
+                col2.label(text=f"Max Tris: {status['max_tris'] or 'N/A'}")
+                if "gpu_verts" in status:
+                    col1.label(text=f"GPU Verts: {status['gpu_verts']}")
+                    col1.label(text=f"Draw Calls: {status['sections']}")
+                    col2.label(text=f"VB: {status['vertex_bytes'] / 1024:.1f} KB")
+                    col2.label(text=f"IB: {status['index_bytes'] / 1024:.1f} KB")
+                if status["within_budget"] is True:
+                    box.label(text="Triangle Count: OK", icon='CHECKMARK')
+                elif status["within_budget"] is False:
+                    box.label(text="Triangle Count: Over Budget", icon='ERROR')
+                else:
+                    box.label(text="Triangle Count: N/A", icon='QUESTION')
         else: 
             layout.label(text="No active object selected.", icon='ERROR')
-            # Show triangle count status for active object
-            obj = context.active_object
-            if obj is not None and context.selected_objects:
-                result = is_triangle_count_within_budget(obj)
-                if result is True:
-                    layout.label(text="Triangle Count: OK", icon='CHECKMARK')
-                elif result is False:
-                    layout.label(text="Triangle Count: Over Budget", icon='ERROR')
-                else:
-                    layout.label(text="Triangle Count: N/A", icon='QUESTION')
 
             
         
@@ -383,7 +737,10 @@ class CSV2MESH_OT_ShowNameCorrection(bpy.types.Operator):
     def execute(self, context):
         obj = bpy.data.objects.get(self.incorrect_name)
         if obj and obj.name != self.correct_name:
-            obj.name = self.correct_name
+            plan = apply_renames({self.incorrect_name: self.correct_name}, record_original=True)
+            if plan.skipped:
+                self.report({'ERROR'}, f"Could not rename '{self.incorrect_name}': {plan.skipped[0].reason}")
+                return {'CANCELLED'}
             show_message(f"Renamed '{self.incorrect_name}' to '{self.correct_name}'", title="Asset Renamed", icon='INFO')
             self.report({'INFO'}, f"Renamed '{self.incorrect_name}' to '{self.correct_name}'")
         return {'FINISHED'}
@@ -416,51 +773,70 @@ class CSV2MESH_OT_DisplayCustomProps(bpy.types.Operator):
             self.report({'INFO'}, "Displayed custom properties.")
         return {'FINISHED'}
     
-class CSV2MESH_OT_ValidateTriangleCount(bpy.types.Operator):
+class CSV2MESH_OT_ValidateTriangleCount(CSV2MESH_BatchOperator, bpy.types.Operator):
     bl_idname = "csv2mesh.validate_triangle_count"
     bl_label = "Validate Triangle Count"
     bl_description = "Validate triangle count of selected objects against CSV data"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                root = obj
-                while root.parent:
-                    root = root.parent
-                asset_name = strip_prefix(root.name)
-                row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(asset_name)
-                if not row:
-                    show_message(f"No CSV row found for {obj.name}.", title="CSV Row Not Found", icon='ERROR')
-                    continue
-
-                csv_tris = row.get('ActualTris', 0)
-               
-                within_budget = is_triangle_count_within_budget(obj)
-                max_tris = int(row.get('MaxTris', 0))
-                actual_triangles = len(obj.data.polygons)
+    def begin(self, context):
+        self._queue = CSVWriteQueue(scene_sheet_path(context.scene))
 
-                
-
-                if within_budget:
-                    # show_message(
-                    #     f"Triangle count within budget for {obj.name}: Expected {max_tris}, got {actual_triangles}.",
-                    #     title="Triangle Count Within Budget",
-                    #     icon='CHECKMARK'
-                    #     )
-                    update_actual_tris_in_csv(asset_name, actual_triangles, context.scene.csv_path)
-                
-                else:
-                    show_message(
-                f"Triangle count for {obj.name} is over budget: {actual_triangles}. Please use Decimation modifier or reduce polygons",
-                title="Triangle Count Over Budget", 
-                icon='ERROR'
+    def process_object(self, context, obj):
+        if obj.type == 'MESH':
+            root = obj
+            while root.parent:
+                root = root.parent
+            row = CSV2MESH_OT_SetCSVData.get_csv_row_for_asset(root.name, obj.name)
+            if not row:
+                return
+
+            actual_triangles = triangle_count(obj.data)
+            status = budget_status(row, actual_triangles)
+
+            if status == 'BAD_CSV_ROW':
+                log_result(obj.name,
+                    f"CSV row '{row.asset_name}' (line {row.line}) has no valid MaxTris: {row.get('MaxTris')!r}. Please fix the CSV.",
+                    title="Malformed CSV Row",
+                    icon='ERROR'
                 )
-
+            elif status == 'OK':
+                # Queued under the sheet's own name, the object name may differ from it
+                update_actual_tris_in_csv(row.asset_name, actual_triangles, context.scene.csv_path, queue=self._queue)
             else:
-                show_message(f"{obj.name} is not a mesh object.", title="Invalid Object Type", icon='ERROR')
+                log_result(obj.name,
+                    f"Triangle count for {obj.name} is over budget: {actual_triangles}. Please use Decimation modifier or reduce polygons",
+                    title="Triangle Count Over Budget",
+                    icon='ERROR'
+                )
 
-        return {'FINISHED'}
+        else:
+            log_result(obj.name, f"{obj.name} is not a mesh object.", title="Invalid Object Type", icon='ERROR')
+
+    def finish(self, context, cancelled=False):
+        status = {'CANCELLED'} if cancelled else {'FINISHED'}
+        if not len(self._queue):
+            self.report({'INFO'}, "No ActualTris updates to write.")
+            return status
+
+        # One write for the whole run, also keeps what was validated before a cancel
+        try:
+            result = self._queue.flush()
+        except (TimeoutError, RuntimeError, OSError) as e:
+            self.report({'ERROR'}, f"CSV write-back failed: {e}")
+            return {'CANCELLED'}
+        for name, field, theirs, ours in result.conflicts:
+            log_result(name, f"{name}: {field} was changed to {theirs} by someone else, kept it (ours: {ours})",
+                       title="CSV Write Conflict", icon='WARNING')
+        for name in result.missing:
+            log_result(name, f"{name}: row no longer in the CSV, ActualTris not written",
+                       title="CSV Row Missing", icon='WARNING')
+        if result.missing or result.conflicts:
+            self.report({'WARNING'}, f"Updated ActualTris for {len(result.updated)} assets; "
+                                     f"{len(result.missing)} rows missing, {len(result.conflicts)} conflicts.")
+        else:
+            self.report({'INFO'}, f"Updated ActualTris for {len(result.updated)} assets.")
+        return status
     
 
 class CSV2MESH_PT_RenameOperationsPanel(bpy.types.Panel):
@@ -501,6 +877,8 @@ class CSV2MESH_PT_RenameOperationsPanel(bpy.types.Panel):
 
         # Button version because above doesnt work for multiple objects
         box_row.operator("csv2mesh.show_all_asset_names_in_viewport", text="Toggle Asset Names in Viewport")            
+        if scene.csv2mesh_toggle_show_asset_names:
+            box.prop(scene, "csv2mesh_overlay_max_labels")
 
         layout.operator("csv2mesh.rename_operations", icon='TEXT')
         layout.label(text="Custom Prefix List:", icon='PRESET')
@@ -545,11 +923,10 @@ class CSV2MESH_OT_RenameOperations(bpy.types.Operator):
             show_message("No objects selected.", title="No Selection", icon='ERROR')
             return {'CANCELLED'}
         else:
-            for obj in context.selected_objects:
-                if obj.parent is None:
-                    obj["original_name"] = obj.name
-                    new_name = take_away_underscore(obj.name)
-                    obj.name = new_name
+            requests = {obj.name: take_away_underscore(obj.name)
+                        for obj in context.selected_objects if obj.parent is None}
+            plan = apply_renames(requests, record_original=True, overwrite_original=True)
+            report_renames(self, plan)
             return {'FINISHED'}
         
        
@@ -565,7 +942,8 @@ class CSV2MESH_PrefixItem(bpy.types.PropertyGroup):
 class CSV2MESH_OT_AssignPrefixes(bpy.types.Operator):
     bl_idname = "csv2mesh.assign_prefix"
     bl_label = "Assign Prefix"
-    bl_description = "Assign selected prefix to active object"
+    bl_description = "Assign selected prefix to the selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
         scene = context.scene
@@ -573,13 +951,14 @@ class CSV2MESH_OT_AssignPrefixes(bpy.types.Operator):
         if not scene.csv2mesh_prefixes or idx >= len(scene.csv2mesh_prefixes):
             show_message("No prefix selected.", title="Prefix Assignment", icon='ERROR')
             return {'CANCELLED'}
-        prefix = scene.csv2mesh_prefixes[idx].prefix
-        obj = context.active_object
-        if obj:
+        prefix = scene.csv2mesh_prefixes[idx].prefix.strip("_")
+        objects = context.selected_objects or ([context.active_object] if context.active_object else [])
+        if objects:
             # Remove existing known prefix
-            name_wo_prefix = strip_prefix(obj.name)
-            obj.name = prefix + "_" + name_wo_prefix
-            show_message(f"Assigned prefix '{prefix}' to '{obj.name}'", title="Prefix Assigned", icon='INFO')
+            prefixes = known_prefixes(scene)
+            requests = {obj.name: prefix + "_" + strip_prefix(obj.name, prefixes) for obj in objects}
+            plan = apply_renames(requests)
+            report_renames(self, plan)
             return {'FINISHED'}
         else:
             show_message("No active object.", title="Prefix Assignment", icon='ERROR')
@@ -656,22 +1035,15 @@ class CSV2MESH_OT_ResetNameToOriginal(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        def revert_names(obj):
-        # Revert this object if it has an original_name
-            if "original_name" in obj:
-                original_name = obj["original_name"]
-                obj.name = original_name
-                show_message(f"Reset name of {obj.name} to original name: {original_name}", title="Name Reset", icon='INFO')
-            # Recurse for children
-            for child in obj.children:
-                revert_names(child)
-
-        for obj in context.selected_objects:
-            # Get the root object (topmost parent)
-            root = obj
-            while root.parent:
-                root = root.parent
-            revert_names(root)
+        # Every object with an original_name in the selected hierarchies, reverted as one batch
+        roots = {build_root_map(context.selected_objects)[obj] for obj in context.selected_objects}
+        requests = {}
+        for root in roots:
+            for obj in (root, *root.children_recursive):
+                if "original_name" in obj:
+                    requests[obj.name] = obj["original_name"]
+        plan = apply_renames(requests)
+        report_renames(self, plan)
         return {'FINISHED'}
         
 class CSV2MESH_OT_ShowAssetNamesInViewport(bpy.types.Operator):
@@ -698,15 +1070,12 @@ class CSV2MESH_OT_ShowAssetNamesInViewport(bpy.types.Operator):
 class CSV2MESH_OT_ShowAllAssetNamesInViewport(bpy.types.Operator):
     bl_idname = "csv2mesh.show_all_asset_names_in_viewport"
     bl_label = "Toggle Asset Names in Viewport"
-    bl_description = "Toggle showing asset names in the viewport for all selected objects"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_description = "Toggle the viewport overlay with CSV asset names, triangle budgets and status for every asset"
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
-        value = not context.scene.csv2mesh_toggle_show_asset_names
-        context.scene.csv2mesh_toggle_show_asset_names = value
-        for obj in context.scene.objects:
-            if hasattr(obj, "show_name"):
-                obj.show_name = value
+        # Drawn by viewport_overlay, no per-object show_name writes
+        context.scene.csv2mesh_toggle_show_asset_names = not context.scene.csv2mesh_toggle_show_asset_names
         return {'FINISHED'}
     
 
@@ -715,6 +1084,11 @@ class CSV2MESH_OT_ShowAllAssetNamesInViewport(bpy.types.Operator):
 
 classes = (
     CSV2MESH_OT_SetCSVData,
+    CSV2MESH_OT_ShowResultLog,
+    CSV2MESH_OT_OpenResultLog,
+    CSV2MESH_OT_SaveResultLog,
+    CSV2MESH_OT_ImportCSVToDatabase,
+    CSV2MESH_OT_ExportDatabaseToCSV,
     CSV2MESH_OT_ProcessSelected,
     CSV2MESH_OT_ClearCustomProps,
     CSV2MESH_OT_AssignMasterMaterial,
@@ -746,7 +1120,7 @@ def register():
         bpy.utils.register_class(cls)
     bpy.types.Scene.csv_path = StringProperty(
         name="CSV Path",
-        description="Path to the CSV file containing asset data",
+        description="Path to the CSV file containing asset data. Several sheets can be given as a ';' separated list or a glob (e.g. //sheets/*.csv)",
         default=CSV_PATH,
         subtype='FILE_PATH'
     )   
@@ -778,9 +1152,9 @@ def register():
 
     bpy.types.Scene.csv2mesh_toggle_show_asset_names = BoolProperty(
         name="Show Asset Names in Viewport",
-        description="Toggle showing asset names in the viewport for selected objects",
+        description="Overlay CSV asset names, triangle budgets and status on every asset in the viewport",
         default=False,
-        
+        update=overlay_toggled
     )
 
     
@@ -794,6 +1168,7 @@ def unregister():
         except Exception:
             pass
     
+    close_asset_dbs()
     del bpy.types.Scene.csv_path
     del bpy.types.Scene.show_custom_props
     del bpy.types.Scene.csv2mesh_dont_ask_again
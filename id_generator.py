@@ -1,6 +1,14 @@
 import bpy
+import colorsys
+import os
 import random
-from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+from mathutils import Vector
+
+from .mesh_analysis import (connected_components, uv_islands, find_uv_overlaps, rasterize_uv_colors, raster_buffers,
+                            color_parts)
 
 HIGH_CONTRAST_COLORS = {
     "Red":     (1, 0, 0, 1),
@@ -11,6 +19,248 @@ HIGH_CONTRAST_COLORS = {
     "Cyan":    (0, 1, 1, 1),
 }
 
+# Kelly's colors of maximum contrast, minus white and black (black is the bake background)
+KELLY_COLORS = [
+    "F3C300", "875692", "F38400", "A1CAF1", "BE0032", "C2B280", "848482",
+    "008856", "E68FAC", "0067A5", "F99379", "604E97", "F6A600", "B3446C",
+    "DCD300", "882D17", "8DB600", "654522", "E25822", "2B3D26",
+]
+
+ID_PALETTES = {
+    'HIGH_CONTRAST': list(HIGH_CONTRAST_COLORS.values()),
+    'KELLY': [tuple(int(h[i:i + 2], 16) / 255 for i in (0, 2, 4)) + (1,) for h in KELLY_COLORS],
+}
+
+def palette_colors(palette, count):
+    """
+    count colors from the palette. If the coloring needs more than the
+    palette holds, extra hues are spread around the wheel by the golden ratio.
+    """
+    colors = list(ID_PALETTES[palette][:count])
+    hue = 0.0
+    while len(colors) < count:
+        hue = (hue + 0.618033988749895) % 1.0
+        colors.append(colorsys.hsv_to_rgb(hue, 0.85, 0.9) + (1,))
+    return colors
+
+def loose_part_ids(mesh):
+    """Per-vertex loose part index for a mesh, read with foreach_get."""
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return connected_components(len(mesh.vertices), edges.reshape(-1, 2))
+
+def part_vertex_groups(part_ids):
+    """Vertex indices of each part, as a list of arrays indexed by part id."""
+    order = np.argsort(part_ids, kind='stable')
+    return np.split(order, np.cumsum(np.bincount(part_ids))[:-1])
+
+
+# Color writing shared by the ID, overlap and gradient bakers.
+# Colors are built as one (loops, 4) float32 array and written with a single
+# foreach_set instead of one RNA write per face corner.
+
+def loop_vertex_indices(mesh):
+    """Vertex index of every loop (face corner)."""
+    verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", verts)
+    return verts
+
+def vertex_coords(mesh):
+    """(V, 3) object space vertex positions."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+def read_loop_colors(vcol):
+    colors = np.empty(len(vcol.data) * 4, dtype=np.float32)
+    vcol.data.foreach_get("color", colors)
+    return colors.reshape(-1, 4)
+
+def write_loop_colors(vcol, loop_colors):
+    """Writes a (loops, 4) color array to a vertex color layer in one call."""
+    vcol.data.foreach_set("color", np.ascontiguousarray(loop_colors, dtype=np.float32).reshape(-1))
+
+def write_vertex_colors(mesh, vcol, vertex_colors, loop_verts=None):
+    """Per-vertex (V, 4) colors spread to every loop through the loop -> vertex index."""
+    if loop_verts is None:
+        loop_verts = loop_vertex_indices(mesh)
+    write_loop_colors(vcol, np.asarray(vertex_colors, dtype=np.float32)[loop_verts])
+
+def write_part_colors(mesh, vcol, part_ids, palette, loop_verts=None):
+    """One color per part: palette is (parts, 4), part_ids a per-vertex part index."""
+    write_vertex_colors(mesh, vcol, np.asarray(palette, dtype=np.float32)[part_ids], loop_verts)
+
+
+def loop_face_indices(mesh):
+    """Polygon index of every loop."""
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+    return np.repeat(np.arange(len(totals)), totals)
+
+def loop_uvs(uv_layer):
+    uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+def loop_triangle_arrays(mesh):
+    """(T, 3) loop indices and the polygon index of every triangle of the tessellated mesh."""
+    mesh.calc_loop_triangles()
+    tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    tri_face = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_face)
+    return tri_loops.reshape(-1, 3), tri_face
+
+def mesh_uv_overlaps(mesh, uv_layer):
+    """
+    True UV overlaps for a mesh: per face, per island and per triangle pair,
+    see mesh_analysis.find_uv_overlaps. Returns (UVOverlaps, face island ids).
+    """
+    uvs = loop_uvs(uv_layer)
+    tri_loops, tri_face = loop_triangle_arrays(mesh)
+    loop_face = loop_face_indices(mesh)
+    face_island = uv_islands(loop_face, loop_vertex_indices(mesh), uvs, len(mesh.polygons))
+    overlaps = find_uv_overlaps(uvs[tri_loops], tri_face, face_island, len(mesh.polygons))
+    return overlaps, face_island
+
+def id_bake_inputs(mesh, vcol, uv_layer):
+    """UVs (T, 3, 2) and colors (T, 3, 4) of every triangle corner, for rasterize_uv_colors."""
+    tri_loops, _ = loop_triangle_arrays(mesh)
+    return loop_uvs(uv_layer)[tri_loops], read_loop_colors(vcol)[tri_loops]
+
+def bake_vertex_colors(mesh, vcol, uv_layer, size, padding, out=None, threads=None):
+    """
+    Rasterizes a vertex color layer into UV space, (size, size, 4) float32
+    in image.pixels order.
+    """
+    tri_uvs, tri_colors = id_bake_inputs(mesh, vcol, uv_layer)
+    return rasterize_uv_colors(tri_uvs, tri_colors, size, size, padding, threads=threads, out=out)
+
+ID_BAKE_MAX_WORKERS = 4
+ID_BAKE_MEMORY = 2 * 1024 ** 3  # bytes of raster buffers a parallel batch may hold
+
+def id_bake_workers(jobs, size):
+    """Objects baked at once: bounded by the cores, a fixed cap and the buffer memory at this size."""
+    per_bake = size * size * (4 * 4 + 1)  # float RGBA image plus coverage mask
+    return max(1, min(jobs, os.cpu_count() or 1, ID_BAKE_MAX_WORKERS, ID_BAKE_MEMORY // per_bake))
+
+def id_export_dir(scene):
+    """Absolute export directory for baked ID maps, or None if it can't be resolved."""
+    path = scene.export_baked_ID or "//"
+    if path.startswith("//") and not bpy.data.filepath:
+        return None  # relative to an unsaved blend file
+    return bpy.path.abspath(path)
+
+def save_id_image(obj, pixels, directory):
+    """
+    Writes baked pixels to the object's <name>_ID image, reusing the one from
+    an earlier bake, and saves it as <name>_ID.png in directory.
+    """
+    height, width = pixels.shape[:2]
+    img = bpy.data.images.get(f"{obj.name}_ID")
+    if img is None or tuple(img.size) != (width, height):
+        if img is not None:
+            bpy.data.images.remove(img)
+        img = bpy.data.images.new(f"{obj.name}_ID", width=width, height=height)
+    img.pixels.foreach_set(pixels.reshape(-1))
+    img.update()
+
+    os.makedirs(directory, exist_ok=True)
+    img.filepath_raw = os.path.join(directory, f"{bpy.path.clean_name(obj.name)}_ID.png")
+    img.file_format = 'PNG'
+    img.save()
+    return img.filepath_raw
+
+def color_loose_parts(obj, scene):
+    """
+    One ID color per loose part on the active vertex color layer (created if
+    missing), chosen by graph coloring so parts whose bounds touch in UV or
+    object space never share a color. Returns (parts, colors used).
+    """
+    mesh = obj.data
+
+    # Ensure a vertex color layer exists
+    if not mesh.vertex_colors:
+        vcol = mesh.vertex_colors.new(name="LooseParts")
+    else:
+        vcol = mesh.vertex_colors.active
+
+    # Find loose parts
+    part_ids = loose_part_ids(mesh)
+    parts = part_vertex_groups(part_ids)
+
+    # Neighbouring parts, from the part bounds in the chosen space
+    loop_verts = loop_vertex_indices(mesh)
+    if scene.id_adjacency_space == 'UV' and mesh.uv_layers.active:
+        points, labels = loop_uvs(mesh.uv_layers.active), part_ids[loop_verts]
+    else:
+        points, labels = vertex_coords(mesh), part_ids
+    part_color = color_parts(points, labels, len(parts), scene.id_adjacency_gap)
+    used = int(part_color.max()) + 1 if len(parts) else 0
+    palette = np.asarray(palette_colors(scene.id_palette, used), dtype=np.float32)
+
+    # Assign colors by loose part
+    write_part_colors(mesh, vcol, part_ids, palette[part_color], loop_verts)
+
+    if scene.create_vertex_groups_from_loose_parts:
+        # A vertex group for each loose part
+        for i, group in enumerate(parts):
+            vg_name = f"ID_MAP_{i+1}"
+            if vg_name not in obj.vertex_groups:
+                vg = obj.vertex_groups.new(name=vg_name)
+                vg.add(group.tolist(), 1.0, 'ADD')
+    return len(parts), used
+
+# Gradient bakers: work on every selected mesh, in local or world space,
+# with per-object or shared bounds
+
+def gradient_objects(context):
+    """Selected meshes with vertices, or the active one if nothing is selected."""
+    objects = [obj for obj in context.selected_objects if obj.type == 'MESH' and len(obj.data.vertices)]
+    obj = context.active_object
+    if not objects and obj and obj.type == 'MESH' and len(obj.data.vertices):
+        objects = [obj]
+    return objects
+
+def gradient_layer(mesh, name):
+    # Ensure a vertex color layer exists
+    if not mesh.vertex_colors:
+        return mesh.vertex_colors.new(name=name)
+    return mesh.vertex_colors.active
+
+def gradient_coords(obj, space):
+    """(V, 3) vertex positions in object space, or world space for space 'WORLD'."""
+    co = vertex_coords(obj.data)
+    if space == 'WORLD':
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        co = co @ matrix[:3, :3].T + matrix[:3, 3]
+    return co
+
+def gradient_bounds(coord_arrays):
+    """(lo, hi) over one or more coordinate arrays."""
+    stacked = [(co.min(axis=0), co.max(axis=0)) for co in coord_arrays]
+    return np.min([lo for lo, _ in stacked], axis=0), np.max([hi for _, hi in stacked], axis=0)
+
+def gradient_pivot(obj, scene, bounds):
+    """Radial gradient centre in the gradient space of obj."""
+    if scene.gradient_pivot == 'BBOX_CENTER':
+        return (bounds[0] + bounds[1]) / 2
+    if scene.gradient_pivot == 'ORIGIN':
+        world = obj.matrix_world.translation
+    elif scene.gradient_pivot == 'CURSOR':
+        world = scene.cursor.location
+    else:
+        world = scene.gradient_pivot_location
+    if scene.gradient_space == 'LOCAL':
+        return np.array(obj.matrix_world.inverted() @ Vector(world), dtype=np.float32)
+    return np.array(world, dtype=np.float32)
+
+def overlap_summary(overlaps):
+    folded = sum(1 for a, b in overlaps.island_pairs if a == b)
+    return (f"{int(overlaps.face_overlaps.sum())} faces overlap, "
+            f"{len(overlaps.island_pairs) - folded} island pairs overlap, {folded} islands overlap themselves")
+
+
 class OBJECT_OT_loose_parts_to_vertex_colors(bpy.types.Operator):
     bl_idname = "object.loose_parts_to_vertex_colors"
     bl_label = "Loose Parts to Vertex Colors"
@@ -20,23 +270,10 @@ class OBJECT_OT_loose_parts_to_vertex_colors(bpy.types.Operator):
         print("Checking for overlapping UVs...")
         obj = bpy.context.active_object
         mesh = obj.data
-        uv_layer = mesh.uv_layers.active.data
-
-        # Map rounded UVs to list of vertex indices
-        uv_to_verts = defaultdict(set)
-        for poly in mesh.polygons:
-            for li in poly.loop_indices:
-                uv = uv_layer[li].uv
-                # Round to 4 decimals to avoid floating point issues
-                uv_key = (round(uv.x, 4), round(uv.y, 4))
-                vert_idx = mesh.loops[li].vertex_index
-                uv_to_verts[uv_key].add(vert_idx)
-
-        # Find overlapped UVs (more than one vertex per UV)
-        overlapped_verts = set()
-        for verts in uv_to_verts.values():
-            if len(verts) > 1:
-                overlapped_verts.update(verts)
+
+        # Faces whose UV triangles overlap another UV triangle
+        overlaps, _ = mesh_uv_overlaps(mesh, mesh.uv_layers.active)
+        loop_overlaps = overlaps.face_overlaps[loop_face_indices(mesh)]
 
         # # Assign to a vertex group
         # vg = obj.vertex_groups.get("OverlappedUVs")
@@ -72,22 +309,14 @@ class OBJECT_OT_loose_parts_to_vertex_colors(bpy.types.Operator):
             self.report({'ERROR'}, "Too many vertex color layers!")
             return {'CANCELLED'}
 
-        # Assign color to all loops whose vertex is in overlapped_verts
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                if vert_idx in overlapped_verts:
-                    vcol.data[loop_idx].color = overlap_color
+        # Overlap color on loops of overlapping faces, black on the rest (for clarity)
+        loop_colors = np.zeros((len(mesh.loops), 4), dtype=np.float32)
+        loop_colors[:, 3] = 1.0
+        loop_colors[loop_overlaps] = overlap_color
+        write_loop_colors(vcol, loop_colors)
 
-                # Optionally, clear color for non-overlapped verts (for clarity)
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                if vert_idx not in overlapped_verts:
-                    vcol.data[loop_idx].color = (0, 0, 0, 1)  # Black or transparent
 
-
-        print(f"Assigned {len(overlapped_verts)} vertices to 'OverlappedUVs' group.")
+        self.report({'WARNING'} if overlaps.island_pairs else {'INFO'}, overlap_summary(overlaps))
 
         
 
@@ -98,67 +327,14 @@ class OBJECT_OT_loose_parts_to_vertex_colors(bpy.types.Operator):
             self.report({'ERROR'}, "Select a mesh object")
             return {'CANCELLED'}
 
-        mesh = obj.data
-
-        # Ensure a vertex color layer exists
-        if not mesh.vertex_colors:
-            vcol = mesh.vertex_colors.new(name="LooseParts")
-        else:
-            vcol = mesh.vertex_colors.active
-
-        # Find loose parts
-        verts = mesh.vertices
-        visited = set()
-        parts = []
-        for v in verts:
-            if v.index in visited:
-                continue
-            group = set()
-            stack = [v.index]
-            while stack:
-                idx = stack.pop()
-                if idx in visited:
-                    continue
-                visited.add(idx)
-                group.add(idx)
-                for e in mesh.edges:
-                    if e.vertices[0] == idx and e.vertices[1] not in visited:
-                        stack.append(e.vertices[1])
-                    elif e.vertices[1] == idx and e.vertices[0] not in visited:
-                        stack.append(e.vertices[0])
-            if group:
-                parts.append(group)
-
-        color_names = list(HIGH_CONTRAST_COLORS.keys())
-        if len(parts) > len(color_names):
-            self.report({'WARNING'}, "More parts than unique colors! Some colors will repeat.")
-        random.shuffle(color_names)
-
-        used_colors = set()
-        # Assign colors by loose part
-        for i, group in enumerate(parts):
-            color_name = color_names[i % len(color_names)]
-            color_value = HIGH_CONTRAST_COLORS[color_name]
-            used_colors.add(color_name)
-            for poly in mesh.polygons:
-                if any(vidx in group for vidx in poly.vertices):
-                    for loop_idx in poly.loop_indices:
-                        vcol.data[loop_idx].color = color_value
-
-
-            
-
-            # If the toggle is enabled, create a vertex group for this loose part
-            if context.scene.create_vertex_groups_from_loose_parts:
-                vg_name = f"ID_MAP_{i+1}"
-                if vg_name not in obj.vertex_groups:
-                    vg = obj.vertex_groups.new(name=vg_name)
-                    vg.add(list(group), 1.0, 'ADD')
-            
-            #self.check_for_overlapping_uvs(context, used_colors)
+        scene = context.scene
+        parts, used = color_loose_parts(obj, scene)
+        if used > len(ID_PALETTES[scene.id_palette]):
+            self.report({'WARNING'}, f"Neighbouring parts needed {used} colors, more than the palette has; extra hues were added.")
 
+        #self.check_for_overlapping_uvs(context, used_colors)
 
-        self.report({'INFO'}, f"Assigned vertex colours to {len(parts)} loose parts.")
+        self.report({'INFO'}, f"Assigned {used} vertex colours to {parts} loose parts.")
         return {'FINISHED'}
 
 class VIEW3D_PT_ID_Map_Baker(bpy.types.Panel):
@@ -176,12 +352,23 @@ class VIEW3D_PT_ID_Map_Baker(bpy.types.Panel):
         # Export button
         layout.prop(scene, "create_vertex_groups_from_loose_parts", text="Create Vertex Groups from Loose Parts")
 
+        row = layout.row(align=True)
+        row.prop(scene, "id_palette", text="")
+        row.prop(scene, "id_adjacency_space", text="")
+        row.prop(scene, "id_adjacency_gap")
         layout.operator("object.loose_parts_to_vertex_colors", icon='NONE')
 
+        row = layout.row(align=True)
+        row.prop(scene, "id_bake_resolution", text="")
+        row.prop(scene, "id_bake_padding")
         layout.operator("object.bake_vertex_colors_to_image", icon='EXPORT')
 
         layout.prop(scene, "export_baked_ID", text="//", icon='FOLDER_REDIRECT')
 
+        row = layout.row(align=True)
+        row.operator("object.batch_bake_id_maps", icon='RENDERLAYERS')
+        row.prop(scene, "id_bake_parallel", text="", icon='SORTTIME')
+
 
         layout.operator("object.detect_overlapping_uvs", icon='NONE')
 
@@ -193,12 +380,20 @@ class VIEW3D_PT_ID_Map_Baker(bpy.types.Panel):
         grid.prop(scene, "gradient_g_axis", text="Green Axis")
         grid.prop(scene, "gradient_b_axis", text="Blue Axis")
 
+        row = layout.row(align=True)
+        row.prop(scene, "gradient_space", expand=True)
+        row = layout.row(align=True)
+        row.prop(scene, "gradient_bounds", expand=True)
+
         row = layout.row()
         row.prop(scene,"reverse_bbox_gradient_toggle", text="Reverse")
         row.operator("object.bake_bbox_gradient_to_vertex_colors", icon='NONE')
 
         layout.separator()
         layout.label(text="Bake Origin Radial Vert Colours:")
+        layout.prop(scene, "gradient_pivot")
+        if scene.gradient_pivot == 'CUSTOM':
+            layout.prop(scene, "gradient_pivot_location", text="")
         layout.operator("object.bake_origin_radial_gradient_to_vertex_colours", icon='NONE')
 
 
@@ -217,64 +412,108 @@ class OBJECT_OT_bake_vertex_colors_to_image(bpy.types.Operator):
             self.report({'ERROR'}, "Select a mesh object")
             return {'CANCELLED'}
 
-        # Ensure UV map exists
-        if not obj.data.uv_layers:
-            obj.data.uv_layers.new(name="UVMap")
-
-        # Create a new image
-        img = bpy.data.images.new(f"{obj.name}_ID", width=1024, height=1024)
-
-        # Ensure material and node setup
-        mat = obj.active_material
-        if not mat:
-            mat = bpy.data.materials.new(name="BakeMat")
-            obj.data.materials.append(mat)
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-
-        # Remove existing bake nodes if any
-        for n in nodes:
-            if n.name in {"BakeImage", "VCOL", "EMIT"}:
-                nodes.remove(n)
-
-        # Add image texture node
-        img_node = nodes.new(type='ShaderNodeTexImage')
-        img_node.name = "BakeImage"
-        img_node.image = img
-
-        # Add attribute node for vertex colors
-        attr_node = nodes.new(type='ShaderNodeAttribute')
-        attr_node.name = "VCOL"
-        attr_node.attribute_name = obj.data.vertex_colors.active.name
-
-        # Add emission node
-        emit_node = nodes.new(type='ShaderNodeEmission')
-        emit_node.name = "EMIT"
-
-        # Connect attribute color to emission color
-        links.new(attr_node.outputs['Color'], emit_node.inputs['Color'])
-        # Connect emission to material output
-        output_node = nodes.get("Material Output")
-        links.new(emit_node.outputs['Emission'], output_node.inputs['Surface'])
-
-        # Set image node as active for baking
-        nodes.active = img_node
-
-        # Set Cycles as render engine and bake type
-        bpy.context.scene.render.engine = 'CYCLES'
-        bpy.context.scene.cycles.bake_type = 'EMIT'
-
-        # Bake!
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.bake(type='EMIT')
-
-        # Save the image (optional)
-        img.filepath_raw = bpy.path.abspath("//baked_vertex_colors.png")
-        img.file_format = 'PNG'
-        img.save()
-
-        self.report({'INFO'}, "Vertex colors baked and image saved as baked_vertex_colors.png")
+        mesh = obj.data
+        if not mesh.uv_layers.active:
+            self.report({'ERROR'}, "The mesh needs a UV map to bake to")
+            return {'CANCELLED'}
+        if not mesh.vertex_colors.active:
+            self.report({'ERROR'}, "The mesh has no vertex colors to bake")
+            return {'CANCELLED'}
+        scene = context.scene
+        directory = id_export_dir(scene)
+        if directory is None:
+            self.report({'ERROR'}, "Save the blend file or set an absolute ID export directory")
+            return {'CANCELLED'}
+        if obj.mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Rasterized straight into UV space; material and render settings are left alone
+        size = int(scene.id_bake_resolution)
+        pixels = bake_vertex_colors(mesh, mesh.vertex_colors.active, mesh.uv_layers.active, size, scene.id_bake_padding)
+        path = save_id_image(obj, pixels, directory)
+
+        self.report({'INFO'}, f"Vertex colors baked and image saved as {path}")
+        return {'FINISHED'}
+
+class OBJECT_OT_batch_bake_id_maps(bpy.types.Operator):
+    """Color loose parts and bake an ID map for every selected mesh"""
+    bl_idname = "object.batch_bake_id_maps"
+    bl_label = "Batch Bake ID Maps"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'ERROR'}, "Select one or more mesh objects")
+            return {'CANCELLED'}
+        directory = id_export_dir(scene)
+        if directory is None:
+            self.report({'ERROR'}, "Save the blend file or set an absolute ID export directory")
+            return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        size = int(scene.id_bake_resolution)
+        padding = scene.id_bake_padding
+
+        # Mesh data is read and written on the main thread; only the
+        # rasterizing runs off it
+        jobs = []
+        skipped = []
+        for obj in objects:
+            mesh = obj.data
+            if not mesh.uv_layers.active or not mesh.polygons:
+                skipped.append(obj.name)
+                continue
+            color_loose_parts(obj, scene)
+            jobs.append(obj)
+
+        saved = 0
+        if scene.id_bake_parallel and len(jobs) > 1:
+            # One object per worker on a single tile thread. At most one bake
+            # per buffer set is in flight, and each finished raster is saved
+            # and its buffers handed to the next object before more work starts.
+            workers = id_bake_workers(len(jobs), size)
+            free = [raster_buffers(size, size) for _ in range(workers)]
+            pending = {}
+            remaining = iter(jobs)
+
+            def submit(pool):
+                obj = next(remaining, None)
+                if obj is None:
+                    return
+                mesh = obj.data
+                buffers = free.pop()
+                tri_uvs, tri_colors = id_bake_inputs(mesh, mesh.vertex_colors.active, mesh.uv_layers.active)
+                future = pool.submit(rasterize_uv_colors, tri_uvs, tri_colors, size, size, padding,
+                                     threads=1, out=buffers)
+                pending[future] = (obj, buffers)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for _ in range(workers):
+                    submit(pool)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        obj, buffers = pending.pop(future)
+                        save_id_image(obj, future.result(), directory)
+                        saved += 1
+                        free.append(buffers)
+                        submit(pool)
+        else:
+            # One after another through the same scratch buffers
+            buffers = raster_buffers(size, size)
+            for obj in jobs:
+                mesh = obj.data
+                pixels = bake_vertex_colors(mesh, mesh.vertex_colors.active, mesh.uv_layers.active,
+                                            size, padding, out=buffers)
+                save_id_image(obj, pixels, directory)
+                saved += 1
+
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {len(skipped)} meshes without a UV map or faces: {', '.join(skipped)}")
+        self.report({'INFO'}, f"Baked {saved} ID maps to {directory}")
         return {'FINISHED'}
 
 class OBJECT_OT_detect_overlapping_uvs(bpy.types.Operator):
@@ -285,30 +524,28 @@ class OBJECT_OT_detect_overlapping_uvs(bpy.types.Operator):
 
     def execute(self, context):
         obj = bpy.context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.uv_layers.active:
+            self.report({'ERROR'}, "Select a mesh object with a UV map")
+            return {'CANCELLED'}
+        if obj.mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         mesh = obj.data
-        uv_layer = mesh.uv_layers.active.data
-
-        # Map rounded UVs to list of vertex indices
-        uv_to_verts = defaultdict(set)
-        for poly in mesh.polygons:
-            for li in poly.loop_indices:
-                uv = uv_layer[li].uv
-                # Round to 4 decimals to avoid floating point issues
-                uv_key = (round(uv.x, 4), round(uv.y, 4))
-                vert_idx = mesh.loops[li].vertex_index
-                uv_to_verts[uv_key].add(vert_idx)
-
-        # Find overlapped UVs (more than one vertex per UV)
-        overlapped_verts = set()
-        for verts in uv_to_verts.values():
-            if len(verts) > 1:
-                overlapped_verts.update(verts)
+
+        # Faces whose UV triangles overlap another UV triangle, including
+        # overlaps between triangles that share no vertex
+        overlaps, _ = mesh_uv_overlaps(mesh, mesh.uv_layers.active)
+        loop_verts = loop_vertex_indices(mesh)
+        loop_overlaps = overlaps.face_overlaps[loop_face_indices(mesh)]
+        overlapped_verts = np.unique(loop_verts[loop_overlaps])
+
+        # Select the overlapping faces for inspection in edit mode
+        mesh.polygons.foreach_set("select", overlaps.face_overlaps)
 
         # Assign to a vertex group
         vg = obj.vertex_groups.get("OverlappedUVs")
         if not vg:
             vg = obj.vertex_groups.new(name="OverlappedUVs")
-        vg.add(list(overlapped_verts), 1.0, 'REPLACE')
+        vg.add(overlapped_verts.tolist(), 1.0, 'REPLACE')
 
         # Assign a unique vertex color to all overlapped UVs
         # Pick a color (e.g., Magenta)
@@ -323,15 +560,13 @@ class OBJECT_OT_detect_overlapping_uvs(bpy.types.Operator):
             self.report({'ERROR'}, "Too many vertex color layers!")
             return {'CANCELLED'}
 
-        # Assign color to all loops whose vertex is in overlapped_verts
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                if vert_idx in overlapped_verts:
-                    vcol.data[loop_idx].color = overlap_color
-
+        # Assign color to the loops of overlapping faces, keep the rest
+        loop_colors = read_loop_colors(vcol)
+        loop_colors[loop_overlaps] = overlap_color
+        write_loop_colors(vcol, loop_colors)
 
         print(f"Assigned {len(overlapped_verts)} vertices to 'OverlappedUVs' group.")
+        self.report({'WARNING'} if overlaps.island_pairs else {'INFO'}, overlap_summary(overlaps))
 
         return {'FINISHED'}
     
@@ -342,66 +577,36 @@ class OBJECT_OT_bake_bbox_gradient_to_vertex_colors(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "Select a mesh object")
+        objects = gradient_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "Select a mesh object with vertices")
             return {'CANCELLED'}
-
-        mesh = obj.data
-
-        # Ensure a vertex color layer exists
-        if not mesh.vertex_colors:
-            vcol = mesh.vertex_colors.new(name="BBOX_Gradient")
-        else:
-            vcol = mesh.vertex_colors.active
-
-        # Get all vertex coordinates in object space
-        coords = [v.co for v in mesh.vertices]
-        min_x = min(v.x for v in coords)
-        max_x = max(v.x for v in coords)
-        min_y = min(v.y for v in coords)
-        max_y = max(v.y for v in coords)
-        min_z = min(v.z for v in coords)
-        max_z = max(v.z for v in coords)
-
-        # Avoid division by zero
-        range_x = max_x - min_x if max_x != min_x else 1.0
-        range_y = max_y - min_y if max_y != min_y else 1.0
-        range_z = max_z - min_z if max_z != min_z else 1.0
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
         scene = context.scene
-        axis_map = {
-            'X' : lambda v: (v.x - min_x) / range_x,
-            'Y' : lambda v: (v.y - min_y) / range_y,
-            'Z' : lambda v: (v.z - min_z) / range_z,
-
-        }
-
-        r_axis = scene.gradient_r_axis
-        g_axis = scene.gradient_g_axis
-        b_axis = scene.gradient_b_axis
-
-
-        # Assign gradient color to each loop (per face corner)
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                v = mesh.vertices[vert_idx].co
-                # Normalize to 0..1
-                r = axis_map[r_axis](v)
-                g = axis_map[g_axis](v)
-                b = axis_map[b_axis](v)
-                if scene.reverse_bbox_gradient_toggle:
-
-                    # Reverse the gradient
-                    r = 1.0 - r
-                    g = 1.0 - g
-                    b = 1.0 - b
-                
-                # Example: RGB = XYZ gradient
-                vcol.data[loop_idx].color = (r, g, b, 1.0)
-
-        self.report({'INFO'}, "BBOX gradient vertex colors assigned.")
+        coords = {obj: gradient_coords(obj, scene.gradient_space) for obj in objects}
+        shared = gradient_bounds(coords.values()) if scene.gradient_bounds == 'SHARED' else None
+
+        axis_index = {'X': 0, 'Y': 1, 'Z': 2}
+        channels = [axis_index[a] for a in (scene.gradient_r_axis, scene.gradient_g_axis, scene.gradient_b_axis)]
+        for obj, co in coords.items():
+            lo, hi = shared or gradient_bounds([co])
+            extent = hi - lo
+            extent[extent == 0] = 1.0  # Avoid division by zero
+
+            # Normalize to 0..1 along each axis
+            normalized = (co - lo) / extent
+            vertex_colors = np.ones((len(co), 4), dtype=np.float32)
+            vertex_colors[:, :3] = normalized[:, channels]
+            if scene.reverse_bbox_gradient_toggle:
+                # Reverse the gradient
+                vertex_colors[:, :3] = 1.0 - vertex_colors[:, :3]
+
+            # Assign gradient color to each loop (per face corner)
+            write_vertex_colors(obj.data, gradient_layer(obj.data, "BBOX_Gradient"), vertex_colors)
+
+        self.report({'INFO'}, f"BBOX gradient vertex colors assigned to {len(objects)} objects.")
         return {'FINISHED'}
     
 class OBJECT_OT_bake_origin_radial_gradient_to_vertex_colors(bpy.types.Operator):
@@ -411,35 +616,35 @@ class OBJECT_OT_bake_origin_radial_gradient_to_vertex_colors(bpy.types.Operator)
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "Select a mesh object")
+        objects = gradient_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "Select a mesh object with vertices")
             return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        mesh = obj.data
-
-        # Ensure a vertex color layer exists
-        if not mesh.vertex_colors:
-            vcol = mesh.vertex_colors.new(name="OriginRadialGradient")
-        else:
-            vcol = mesh.vertex_colors.active
-
-        # Compute distances from origin for all vertices
-        coords = [v.co for v in mesh.vertices]
-        distances = [v.length for v in coords]
-        max_dist = max(distances) if distances else 1.0
-
-        # Assign gradient color to each loop (per face corner)
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                v = mesh.vertices[vert_idx].co
-                d = v.length / max_dist if max_dist != 0 else 0.0
-                # Grayscale: all channels get the same value
-                
-                vcol.data[loop_idx].color = (d, d, d, 1.0)
-
-        self.report({'INFO'}, "Radial gradient from origin assigned to vertex colors.")
+        scene = context.scene
+        coords = {obj: gradient_coords(obj, scene.gradient_space) for obj in objects}
+        shared = gradient_bounds(coords.values()) if scene.gradient_bounds == 'SHARED' else None
+
+        # Distance of every vertex from the pivot, in the gradient space
+        distances = {}
+        for obj, co in coords.items():
+            pivot = gradient_pivot(obj, scene, shared or gradient_bounds([co]))
+            distances[obj] = np.linalg.norm(co - pivot, axis=1)
+
+        # The whole selection fades out over the same radius when shared
+        shared_max = max(float(d.max()) for d in distances.values()) if shared else None
+        for obj, dist in distances.items():
+            max_dist = shared_max if shared else float(dist.max())
+            d = dist / max_dist if max_dist != 0 else np.zeros_like(dist)
+
+            # Grayscale: all channels get the same value
+            vertex_colors = np.ones((len(d), 4), dtype=np.float32)
+            vertex_colors[:, :3] = d[:, None]
+            write_vertex_colors(obj.data, gradient_layer(obj.data, "OriginRadialGradient"), vertex_colors)
+
+        self.report({'INFO'}, f"Radial gradient assigned to vertex colors of {len(objects)} objects.")
         return {'FINISHED'}
 
 def properties():
@@ -455,6 +660,80 @@ def properties():
         description="Toggle the reverse BBOX gradient",
         default=False
     )   
+    bpy.types.Scene.id_palette = bpy.props.EnumProperty(
+        name="ID Palette",
+        description="Colors the loose parts are colored from",
+        items=[('HIGH_CONTRAST', "High Contrast", "Six saturated primaries and secondaries"),
+               ('KELLY', "Kelly 20", "Twenty colors picked to be told apart easily")],
+        default='HIGH_CONTRAST'
+    )
+    bpy.types.Scene.id_adjacency_space = bpy.props.EnumProperty(
+        name="Neighbours In",
+        description="Where parts count as touching, so they get different colors",
+        items=[('UV', "UV", "Parts whose UV bounds touch"),
+               ('OBJECT', "Object", "Parts whose bounding boxes touch in object space")],
+        default='UV'
+    )
+    bpy.types.Scene.id_adjacency_gap = bpy.props.FloatProperty(
+        name="Gap",
+        description="Parts closer than this (UV or object units) also count as touching",
+        default=0.0,
+        min=0.0
+    )
+    bpy.types.Scene.id_bake_resolution = bpy.props.EnumProperty(
+        name="Bake Resolution",
+        description="Width and height of the baked ID map",
+        items=[(str(s), f"{s} px", "") for s in (512, 1024, 2048, 4096, 8192)],
+        default='1024'
+    )
+    bpy.types.Scene.export_baked_ID = bpy.props.StringProperty(
+        name="Export Baked ID Location",
+        description="Directory the baked ID maps are saved to as <object>_ID.png",
+        default="//",
+        subtype='DIR_PATH'
+    )
+    bpy.types.Scene.id_bake_parallel = bpy.props.BoolProperty(
+        name="Bake in Parallel",
+        description="Batch bake several objects at once instead of splitting each bake across all cores",
+        default=False
+    )
+    bpy.types.Scene.id_bake_padding = bpy.props.IntProperty(
+        name="Padding",
+        description="Pixels of edge dilation around each UV island",
+        default=4,
+        min=0,
+        max=64
+    )
+    bpy.types.Scene.gradient_space = bpy.props.EnumProperty(
+        name="Gradient Space",
+        description="Coordinates the gradients are computed in",
+        items=[('LOCAL', "Local", "Each object's own space"),
+               ('WORLD', "World", "World space, so placed objects line up")],
+        default='LOCAL'
+    )
+    bpy.types.Scene.gradient_bounds = bpy.props.EnumProperty(
+        name="Gradient Bounds",
+        description="Bounds the gradients are normalized to",
+        items=[('OBJECT', "Per Object", "Each object spans the full gradient"),
+               ('SHARED', "Shared", "One bounding box and radius across all selected objects, for modular kits")],
+        default='OBJECT'
+    )
+    bpy.types.Scene.gradient_pivot = bpy.props.EnumProperty(
+        name="Pivot",
+        description="Centre of the radial gradient",
+        items=[('ORIGIN', "Origin", "Each object's origin"),
+               ('BBOX_CENTER', "Bounds Center", "Center of the gradient bounds"),
+               ('CURSOR', "3D Cursor", "The 3D cursor"),
+               ('CUSTOM', "Custom", "A world space location")],
+        default='ORIGIN'
+    )
+    bpy.types.Scene.gradient_pivot_location = bpy.props.FloatVectorProperty(
+        name="Pivot Location",
+        description="World space centre of the radial gradient",
+        subtype='XYZ',
+        size=3,
+        default=(0.0, 0.0, 0.0)
+    )
     bpy.types.Scene.gradient_r_axis = bpy.props.EnumProperty(
         name="Red Axis",
         description="Axis for Red channel",
@@ -478,6 +757,7 @@ def register():
     bpy.utils.register_class(OBJECT_OT_loose_parts_to_vertex_colors)
     bpy.utils.register_class(VIEW3D_PT_ID_Map_Baker)
     bpy.utils.register_class(OBJECT_OT_bake_vertex_colors_to_image)
+    bpy.utils.register_class(OBJECT_OT_batch_bake_id_maps)
     bpy.utils.register_class(OBJECT_OT_detect_overlapping_uvs)
     bpy.utils.register_class(OBJECT_OT_bake_bbox_gradient_to_vertex_colors)
     bpy.utils.register_class(OBJECT_OT_bake_origin_radial_gradient_to_vertex_colors)
@@ -488,11 +768,23 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_loose_parts_to_vertex_colors)
     bpy.utils.unregister_class(VIEW3D_PT_ID_Map_Baker)
     bpy.utils.unregister_class(OBJECT_OT_bake_vertex_colors_to_image)
+    bpy.utils.unregister_class(OBJECT_OT_batch_bake_id_maps)
     bpy.utils.unregister_class(OBJECT_OT_detect_overlapping_uvs)
     bpy.utils.unregister_class(OBJECT_OT_bake_bbox_gradient_to_vertex_colors)
     bpy.utils.unregister_class(OBJECT_OT_bake_origin_radial_gradient_to_vertex_colors)
 
     del bpy.types.Scene.create_vertex_groups_from_loose_parts
+    del bpy.types.Scene.id_palette
+    del bpy.types.Scene.id_adjacency_space
+    del bpy.types.Scene.id_adjacency_gap
+    del bpy.types.Scene.id_bake_resolution
+    del bpy.types.Scene.id_bake_padding
+    del bpy.types.Scene.id_bake_parallel
+    del bpy.types.Scene.export_baked_ID
+    del bpy.types.Scene.gradient_space
+    del bpy.types.Scene.gradient_bounds
+    del bpy.types.Scene.gradient_pivot
+    del bpy.types.Scene.gradient_pivot_location
     del bpy.types.Scene.gradient_r_axis
     del bpy.types.Scene.gradient_g_axis
     del bpy.types.Scene.gradient_b_axis
@@ -0,0 +1,493 @@
+import heapq
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Mesh analysis on plain numpy arrays for the ID map and UV tools.
+# No bpy here; id_generator reads the mesh with foreach_get and passes the
+# arrays in, so everything below is vectorized and testable outside Blender.
+
+
+def connected_components(n_verts, edges):
+    """
+    Component label per vertex for an (E, 2) edge array, numbered 0..parts-1
+    in order of each part's lowest vertex index. Vectorized union-find: every
+    pass hooks the larger root of each edge onto the smaller one, then
+    pointer jumping flattens the trees, so it finishes in a few numpy passes.
+    """
+    parent = np.arange(n_verts, dtype=np.int64)
+    a = edges[:, 0].astype(np.int64)
+    b = edges[:, 1].astype(np.int64)
+    while len(a):
+        ra, rb = parent[a], parent[b]
+        differ = ra != rb
+        if not differ.any():
+            break
+        # Only edges that still join two trees matter in the next pass
+        a, b, ra, rb = a[differ], b[differ], ra[differ], rb[differ]
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    # Roots are the lowest index in each part, so this keeps that order
+    return np.unique(parent, return_inverse=True)[1].reshape(-1)
+
+
+# UV islands
+
+UV_WELD_PRECISION = 1e-5  # UVs closer than this on the same vertex count as connected
+
+def uv_islands(loop_face, loop_verts, loop_uvs, n_faces):
+    """
+    Island index per face. Two faces are in the same island when they share
+    a vertex with the same UV coordinate, like Blender's UV select linked.
+    """
+    if not len(loop_face):
+        return np.zeros(n_faces, dtype=np.int64)
+    quantized = np.round(loop_uvs / UV_WELD_PRECISION).astype(np.int64)
+    keys = np.column_stack((loop_verts.astype(np.int64), quantized))
+    corner_ids = np.unique(keys, axis=0, return_inverse=True)[1].reshape(-1)
+    # Faces and shared UV corners as one graph: face -> corner edges
+    edges = np.column_stack((loop_face, n_faces + corner_ids))
+    labels = connected_components(n_faces + corner_ids.max() + 1, edges)[:n_faces]
+    return np.unique(labels, return_inverse=True)[1].reshape(-1)
+
+
+# UV overlaps
+
+UVOverlaps = namedtuple("UVOverlaps", "triangle_pairs face_overlaps island_pairs")
+
+BIG_TRIANGLE_CELLS = 8  # triangles spanning more grid cells per axis than this are tested separately
+PAIR_CHUNK = 1_000_000  # candidate pairs tested per batch, bounds memory on stacked UVs
+
+def triangles_overlap(a, b, eps=1e-7):
+    """
+    Vectorized 2D triangle overlap for (K, 3, 2) arrays: separating axis test
+    on the six edge normals. Shared edges or corners don't count, only
+    overlapping interiors (by more than eps).
+    """
+    edges = np.concatenate((np.roll(a, -1, axis=1) - a, np.roll(b, -1, axis=1) - b), axis=1)
+    axes = np.stack((-edges[..., 1], edges[..., 0]), axis=-1)  # (K, 6, 2)
+    proj_a = np.einsum('kad,kvd->kav', axes, a)
+    proj_b = np.einsum('kad,kvd->kav', axes, b)
+    overlap = np.minimum(proj_a.max(axis=2), proj_b.max(axis=2)) - np.maximum(proj_a.min(axis=2), proj_b.min(axis=2))
+    length = np.linalg.norm(axes, axis=2)
+    # Degenerate edges give no axis; the other edges decide
+    separated = (overlap <= eps * length) & (length > 0)
+    return ~separated.any(axis=1)
+
+def _cell_pairs(keys, order):
+    """Every pair of entries that share a grid cell, yielded in chunks."""
+    sorted_keys = keys[order]
+    n = len(sorted_keys)
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    ends = np.r_[starts[1:], n]
+    group_end = np.repeat(ends, ends - starts)
+    after = group_end - np.arange(n) - 1  # later entries in the same cell
+    cumulative = np.cumsum(after)
+    chunk_start = 0
+    while chunk_start < n:
+        base = cumulative[chunk_start - 1] if chunk_start else 0
+        chunk_end = max(chunk_start + 1, int(np.searchsorted(cumulative, base + PAIR_CHUNK, side='right')))
+        counts = after[chunk_start:chunk_end]
+        first = np.repeat(np.arange(chunk_start, chunk_end), counts)
+        offsets = np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + offsets
+        yield order[first], order[second]
+        chunk_start = chunk_end
+
+def overlapping_uv_triangles(tri_uvs, eps=1e-7):
+    """
+    Pairs of UV triangles (indices into tri_uvs, (T, 3, 2)) whose interiors
+    overlap. Triangles are binned into a uniform grid sized from the average
+    triangle, and only triangles sharing a cell are tested, so the cost is
+    near-linear in the triangle count for normal UV layouts.
+    """
+    tri_uvs = np.asarray(tri_uvs, dtype=np.float64)
+    a, b, c = tri_uvs[:, 0], tri_uvs[:, 1], tri_uvs[:, 2]
+    area2 = np.abs((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+    valid = np.flatnonzero(area2 > eps * eps)  # zero-area triangles can't overlap anything
+    if len(valid) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    lo = tri_uvs[valid].min(axis=1)
+    hi = tri_uvs[valid].max(axis=1)
+    cell = max(float(np.mean((hi - lo).max(axis=1))), eps)
+    origin = lo.min(axis=0)
+    cell_lo = np.floor((lo - origin) / cell).astype(np.int64)
+    cell_hi = np.floor((hi - origin) / cell).astype(np.int64)
+    span = cell_hi - cell_lo + 1
+    big = (span > BIG_TRIANGLE_CELLS).any(axis=1)
+
+    found = []
+
+    def test(i, j):
+        # Bounding boxes first, then the exact test on what's left
+        keep = (lo[i] < hi[j] - eps).all(axis=1) & (lo[j] < hi[i] - eps).all(axis=1)
+        i, j = i[keep], j[keep]
+        if len(i):
+            hit = triangles_overlap(tri_uvs[valid[i]], tri_uvs[valid[j]], eps)
+            found.append(np.column_stack((valid[i[hit]], valid[j[hit]])))
+        return i, j
+
+    # Small triangles: expand into the cells they touch and pair within cells
+    small = np.flatnonzero(~big)
+    counts = span[small, 0] * span[small, 1]
+    entry_tri = np.repeat(small, counts)
+    local = np.arange(len(entry_tri)) - np.repeat(np.cumsum(counts) - counts, counts)
+    width = np.repeat(span[small, 0], counts)
+    cx = cell_lo[entry_tri, 0] + local % width
+    cy = cell_lo[entry_tri, 1] + local // width
+    keys = cx * (int(cell_hi[:, 1].max()) + 1) + cy
+    for first, second in _cell_pairs(keys, np.argsort(keys, kind='stable')):
+        i, j = entry_tri[first], entry_tri[second]
+        # Test each pair only in the cell holding the corner of the bbox overlap
+        corner = np.floor((np.maximum(lo[i], lo[j]) - origin) / cell).astype(np.int64)
+        own = (corner[:, 0] == cx[first]) & (corner[:, 1] == cy[first])
+        test(i[own], j[own])
+
+    # Big triangles: against every other triangle, bbox filtered
+    big_ids = np.flatnonzero(big)
+    everyone = np.arange(len(valid))
+    for k in big_ids:
+        # Big vs big pairs are tested once, from the lower index
+        others = everyone[(everyone != k) & (~big | (everyone > k))]
+        test(np.full(len(others), k), others)
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(found)
+    return np.sort(pairs, axis=1)
+
+def find_uv_overlaps(tri_uvs, tri_face, face_island, n_faces, eps=1e-7):
+    """
+    Overlapping triangle pairs, a per-face overlap flag and the set of
+    (island, island) pairs that overlap; (i, i) means island i folds onto itself.
+    """
+    pairs = overlapping_uv_triangles(tri_uvs, eps)
+    face_overlaps = np.zeros(n_faces, dtype=bool)
+    face_overlaps[tri_face[pairs.reshape(-1)]] = True
+    islands = np.sort(face_island[tri_face[pairs]], axis=1)
+    island_pairs = {tuple(p) for p in np.unique(islands, axis=0).tolist()} if len(islands) else set()
+    return UVOverlaps(pairs, face_overlaps, island_pairs)
+
+
+# Part adjacency and graph coloring
+
+def part_bounds(points, labels, n_parts):
+    """
+    Bounding boxes of the labels that have points: (present, lo, hi), with
+    present the label ids and lo/hi (len(present), D). A part can have no
+    points at all, e.g. a loose vertex has no face corners to carry UVs.
+    """
+    counts = np.bincount(labels, minlength=n_parts)
+    present = np.flatnonzero(counts)
+    order = np.argsort(labels, kind='stable')
+    starts = (np.cumsum(counts) - counts)[present]
+    lo = np.minimum.reduceat(points[order], starts, axis=0)
+    hi = np.maximum.reduceat(points[order], starts, axis=0)
+    return present, lo, hi
+
+def box_adjacency(lo, hi, gap=0.0):
+    """
+    (E, 2) index pairs of boxes (lo, hi (N, D)) that overlap or come within
+    gap of each other. Same uniform grid as the UV overlap search: boxes go
+    into every cell they touch, pairs are tested once, in the cell holding
+    the corner of their overlap, and oversized boxes are tested separately.
+    """
+    n, dims = lo.shape
+    lo = lo - gap / 2
+    hi = hi + gap / 2
+    cell = max(float(np.mean((hi - lo).max(axis=1))), 1e-9)
+    origin = lo.min(axis=0)
+    cell_lo = np.floor((lo - origin) / cell).astype(np.int64)
+    cell_hi = np.floor((hi - origin) / cell).astype(np.int64)
+    span = cell_hi - cell_lo + 1
+    big = (span > BIG_TRIANGLE_CELLS).any(axis=1)
+    found = []
+
+    def test(i, j):
+        near = ((lo[i] <= hi[j]) & (lo[j] <= hi[i])).all(axis=1)
+        found.append(np.column_stack((i[near], j[near])))
+
+    small = np.flatnonzero(~big)
+    counts = np.prod(span[small], axis=1)
+    entry = np.repeat(small, counts)
+    local = np.arange(len(entry)) - np.repeat(np.cumsum(counts) - counts, counts)
+    cells = np.empty((len(entry), dims), dtype=np.int64)
+    for d in range(dims):
+        width = span[entry, d]
+        cells[:, d] = cell_lo[entry, d] + local % width
+        local = local // width
+    keys = np.ravel_multi_index(cells.T, cell_hi.max(axis=0) + 1)
+    for first, second in _cell_pairs(keys, np.argsort(keys, kind='stable')):
+        i, j = entry[first], entry[second]
+        corner = np.floor((np.maximum(lo[i], lo[j]) - origin) / cell).astype(np.int64)
+        own = (corner == cells[first]).all(axis=1)
+        test(i[own], j[own])
+
+    # Oversized boxes against everything, big vs big once
+    everyone = np.arange(n)
+    for k in np.flatnonzero(big):
+        others = everyone[(everyone != k) & (~big | (everyone > k))]
+        test(np.full(len(others), k), others)
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.sort(np.concatenate(found), axis=1)
+
+def part_adjacency(points, labels, n_parts, gap=0.0):
+    """
+    Pairs of parts that may touch: their bounding boxes over points (vertex
+    positions or UVs, labelled by part) overlap or lie within gap. Touching
+    parts always overlap, so this never misses a real neighbour.
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    if n_parts < 2 or not len(labels):
+        return np.empty((0, 2), dtype=np.int64)
+    present, lo, hi = part_bounds(np.asarray(points, dtype=np.float64), labels, n_parts)
+    return present[box_adjacency(lo, hi, gap)]
+
+def color_parts(points, labels, n_parts, gap=0.0):
+    """
+    Color index per part so parts whose bounds touch (see part_adjacency)
+    never share one. Parts without points are left out of the graph and
+    get color 0.
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    present = np.flatnonzero(np.bincount(labels, minlength=n_parts))
+    compact = np.full(n_parts, -1, dtype=np.int64)
+    compact[present] = np.arange(len(present))
+    colors = np.zeros(n_parts, dtype=np.int64)
+    colors[present] = dsatur_coloring(len(present), compact[part_adjacency(points, labels, n_parts, gap)])
+    return colors
+
+def dsatur_coloring(n, edges):
+    """
+    Color index per node so no edge joins two equal colors, using as few
+    colors as DSATUR manages: repeatedly color the node with the most
+    differently colored neighbours (ties: most neighbours) with the lowest
+    free color. Nodes are pulled from a heap with stale entries skipped.
+    """
+    colors = np.full(n, -1, dtype=np.int64)
+    if not n:
+        return colors
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    both = np.concatenate((edges, edges[:, ::-1]))
+    both = both[np.argsort(both[:, 0], kind='stable')]
+    offsets = np.searchsorted(both[:, 0], np.arange(n + 1)).tolist()
+    neighbours = both[:, 1].tolist()
+    degree = np.diff(offsets).tolist()
+
+    node_colors = [-1] * n
+    seen = [set() for _ in range(n)]  # colors among each node's neighbours
+    heap = [(0, -d, i) for i, d in enumerate(degree)]
+    heapq.heapify(heap)
+    while heap:
+        sat, _, node = heapq.heappop(heap)
+        if node_colors[node] >= 0 or -sat != len(seen[node]):
+            continue
+        taken = seen[node]
+        color = 0
+        while color in taken:
+            color += 1
+        node_colors[node] = color
+        for other in neighbours[offsets[node]:offsets[node + 1]]:
+            if node_colors[other] < 0 and color not in seen[other]:
+                seen[other].add(color)
+                heapq.heappush(heap, (-len(seen[other]), -degree[other], other))
+    colors[:] = node_colors
+    return colors
+
+
+# UV rasterizer
+#
+# Bakes per-corner colors straight into UV space, no render engine involved.
+# Each triangle is expanded into the pixels of its bounding box, barycentric
+# weights are computed for all of them at once and the inside ones are
+# written. Rows go bottom to top, like Blender's image.pixels.
+
+RASTER_CHUNK = 1_000_000  # candidate pixels evaluated per numpy batch, per thread
+RASTER_TILE = 256  # tile edge in pixels for the threaded bake
+
+def _rasterize(tri_px, tri_colors, image, covered, x0, y0, x1, y1):
+    """Fills the triangles (pixel space) into image/covered, clipped to [x0, x1) x [y0, y1)."""
+    lo = np.floor(tri_px.min(axis=1)).astype(np.int64)
+    hi = np.ceil(tri_px.max(axis=1)).astype(np.int64)
+    lo = np.maximum(lo, (x0, y0))
+    hi = np.minimum(hi, (x1, y1))
+    span = np.maximum(hi - lo, 0)
+    counts = span[:, 0] * span[:, 1]
+    keep = np.flatnonzero(counts)
+    if not len(keep):
+        return
+
+    # Per-triangle edge setup, so the per-pixel work is a few multiply-adds
+    a = tri_px[:, 0]
+    v0 = tri_px[:, 1] - a
+    v1 = tri_px[:, 2] - a
+    den = v0[:, 0] * v1[:, 1] - v1[:, 0] * v0[:, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = np.where(den != 0, 1.0 / den, 0.0)
+    # wb = (p - a) x v1 / den, wc = v0 x (p - a) / den, as linear functions of the pixel
+    wb_x, wb_y = (v1[:, 1] * inv).astype(np.float32), (-v1[:, 0] * inv).astype(np.float32)
+    wc_x, wc_y = (-v0[:, 1] * inv).astype(np.float32), (v0[:, 0] * inv).astype(np.float32)
+    origin = (lo - a + 0.5).astype(np.float32)  # first pixel centre relative to a
+    base_color = tri_colors[:, 0]
+    d_b = tri_colors[:, 1] - base_color
+    d_c = tri_colors[:, 2] - base_color
+
+    cumulative = np.cumsum(counts[keep])
+    start = 0
+    while start < len(keep):
+        base = cumulative[start - 1] if start else 0
+        end = max(start + 1, int(np.searchsorted(cumulative, base + RASTER_CHUNK, side='right')))
+        tris = keep[start:end]
+        n = counts[tris]
+        tri = np.repeat(tris, n)
+        local = np.arange(len(tri)) - np.repeat(np.cumsum(n) - n, n)
+        width = span[tri, 0]
+        dx, dy = local % width, local // width
+
+        rx = origin[tri, 0] + dx
+        ry = origin[tri, 1] + dy
+        wb = wb_x[tri] * rx + wb_y[tri] * ry
+        wc = wc_x[tri] * rx + wc_y[tri] * ry
+        inside = (wb >= -1e-6) & (wc >= -1e-6) & (wb + wc <= 1.0 + 1e-6) & (inv[tri] != 0)
+
+        tri, wb, wc = tri[inside], wb[inside, None], wc[inside, None]
+        px = lo[tri, 0] + dx[inside]
+        py = lo[tri, 1] + dy[inside]
+        image[py, px] = base_color[tri] + wb * d_b[tri] + wc * d_c[tri]
+        covered[py, px] = True
+        start = end
+
+def dilate(image, covered, padding):
+    """
+    Grows the baked islands outwards by padding pixels so mip maps and
+    bilinear filtering don't bleed the background into the edges.
+    Each new pixel takes the average of its baked 8-neighbours.
+    """
+    h, w = covered.shape
+    offsets = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+    for _ in range(padding):
+        # Uncovered pixels next to a covered one, found on the mask only
+        padded = np.pad(covered, 1)
+        near = np.zeros((h, w), dtype=bool)
+        for dy, dx in offsets:
+            near |= padded[1 + dy:h + 1 + dy, 1 + dx:w + 1 + dx]
+        ys, xs = np.nonzero(near & ~covered)
+        if not len(ys):
+            break
+        # Average only at the frontier pixels
+        total = np.zeros((len(ys), image.shape[2]), dtype=np.float32)
+        count = np.zeros(len(ys), dtype=np.float32)
+        for dy, dx in offsets:
+            ny, nx = ys + dy, xs + dx
+            ok = (ny >= 0) & (ny < h) & (nx >= 0) & (nx < w)
+            ok[ok] = covered[ny[ok], nx[ok]]
+            total[ok] += image[ny[ok], nx[ok]]
+            count[ok] += 1
+        image[ys, xs] = total / count[:, None]
+        covered[ys, xs] = True
+
+def bin_triangles(tri_px, width, height, tile):
+    """
+    Triangles overlapping each tile of a width x height raster, as
+    {(tile x, tile y): triangle indices}. A triangle lands in every tile its
+    bounding box touches.
+    """
+    tiles_x, tiles_y = -(-width // tile), -(-height // tile)
+    lo = np.clip(np.floor(tri_px.min(axis=1) / tile), 0, (tiles_x - 1, tiles_y - 1)).astype(np.int64)
+    hi = np.clip(np.floor(tri_px.max(axis=1) / tile), 0, (tiles_x - 1, tiles_y - 1)).astype(np.int64)
+    # Triangles entirely off the raster
+    off = (tri_px.max(axis=1) < 0).any(axis=1) | (tri_px.min(axis=1) >= (width, height)).any(axis=1)
+    span = np.where(off[:, None], 0, hi - lo + 1)
+    n = span[:, 0] * span[:, 1]
+    tri = np.repeat(np.arange(len(tri_px)), n)
+    local = np.arange(len(tri)) - np.repeat(np.cumsum(n) - n, n)
+    tx = lo[tri, 0] + local % span[tri, 0]
+    ty = lo[tri, 1] + local // span[tri, 0]
+
+    key = ty * tiles_x + tx
+    order = np.argsort(key, kind='stable')
+    key, tri = key[order], tri[order]
+    cuts = np.flatnonzero(np.diff(key)) + 1
+    starts = np.concatenate(([0], cuts))
+    return {(int(key[s] % tiles_x), int(key[s] // tiles_x)): group
+            for s, group in zip(starts, np.split(tri, cuts))}
+
+def _dilate_tile(image, covered, x0, y0, x1, y1, padding):
+    """
+    Dilation for one tile, computed on a copy of the tile plus a padding
+    wide halo so the result matches dilating the whole image. Returns the
+    newly filled pixels (ys, xs, colors) without touching the shared buffers.
+    """
+    h, w = covered.shape
+    hx0, hy0 = max(x0 - padding, 0), max(y0 - padding, 0)
+    hx1, hy1 = min(x1 + padding, w), min(y1 + padding, h)
+    mask = covered[hy0:hy1, hx0:hx1]
+    if mask.all() or not mask.any():
+        return None
+    local_mask = mask.copy()
+    local_image = image[hy0:hy1, hx0:hx1].copy()
+    dilate(local_image, local_mask, padding)
+
+    ty0, tx0 = y0 - hy0, x0 - hx0
+    inner = (slice(ty0, ty0 + y1 - y0), slice(tx0, tx0 + x1 - x0))
+    ys, xs = np.nonzero(local_mask[inner] & ~mask[inner])
+    return ys + y0, xs + x0, local_image[inner][ys, xs]
+
+def raster_buffers(width, height):
+    """Image and coverage buffers for rasterize_uv_colors(out=...), reusable between bakes."""
+    return np.empty((height, width, 4), dtype=np.float32), np.empty((height, width), dtype=bool)
+
+def rasterize_uv_colors(tri_uvs, tri_colors, width, height, padding=0,
+                        background=(0.0, 0.0, 0.0, 1.0), tile=RASTER_TILE, threads=None, out=None):
+    """
+    (height, width, 4) float32 image with every UV triangle (tri_uvs (T, 3, 2))
+    filled with its interpolated corner colors (tri_colors (T, 3, 4)),
+    plus padding pixels of dilation around each island.
+
+    The raster is split into tiles, each filled from its own pre-binned
+    triangles by a thread pool writing into the shared buffers. Tiles don't
+    overlap and numpy releases the GIL in the heavy array work, so big maps
+    scale with the number of cores. threads=None uses every core.
+    out: buffers from raster_buffers to bake into instead of allocating.
+    """
+    image, covered = out if out is not None else raster_buffers(width, height)
+    image[:] = background
+    covered[:] = False
+    tri_px = np.asarray(tri_uvs, dtype=np.float64) * (width, height)
+    tri_colors = np.asarray(tri_colors, dtype=np.float32)
+    if not len(tri_px):
+        return image
+
+    bins = bin_triangles(tri_px, width, height, tile)
+    bounds = {key: (key[0] * tile, key[1] * tile,
+                    min((key[0] + 1) * tile, width), min((key[1] + 1) * tile, height))
+              for key in bins}
+
+    def fill(key):
+        tris = bins[key]
+        _rasterize(tri_px[tris], tri_colors[tris], image, covered, *bounds[key])
+
+    with ThreadPoolExecutor(max_workers=threads or os.cpu_count() or 1) as pool:
+        list(pool.map(fill, bins))
+
+        if padding:
+            # Every tile that could receive padding: the baked ones and their neighbours
+            reach = -(-padding // tile)
+            grown = {(tx + dx, ty + dy) for tx, ty in bins
+                     for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)}
+            tiles = [(tx * tile, ty * tile, min((tx + 1) * tile, width), min((ty + 1) * tile, height))
+                     for tx, ty in grown if 0 <= tx * tile < width and 0 <= ty * tile < height]
+            # All tiles read the undilated buffers, then the results are written in one go
+            filled = [r for r in pool.map(lambda b: _dilate_tile(image, covered, *b, padding), tiles) if r]
+            for ys, xs, colors in filled:
+                image[ys, xs] = colors
+    return image
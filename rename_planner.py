@@ -0,0 +1,106 @@
+from collections import namedtuple
+
+# Bulk rename planning.
+# Works out every rename for a selection before touching any object, so a
+# name that is still held by another object in the batch is freed first and
+# Blender never gets the chance to append ".001". No bpy here; the operators
+# build the requests and apply plan.steps in order.
+
+MAX_NAME_BYTES = 63  # Blender object name limit
+
+SkippedRename = namedtuple("SkippedRename", "old new reason")
+
+
+class RenamePlan:
+    """
+    steps: (current name, new name) pairs, safe to apply in order.
+    renamed: (old, new) for every object that ends up renamed.
+    skipped: renames that would have collided, with the reason.
+    cycles: number of rename cycles (A->B, B->A) broken with a temporary name.
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.renamed = []
+        self.skipped = []
+        self.cycles = 0
+
+    def __len__(self):
+        return len(self.renamed)
+
+
+def _temp_name(taken):
+    i = 1
+    while f"~rename_tmp{i}" in taken:
+        i += 1
+    taken.add(f"~rename_tmp{i}")
+    return f"~rename_tmp{i}"
+
+def plan_renames(requests, existing_names, max_length=MAX_NAME_BYTES):
+    """
+    Plans renames for requests ({current name: wanted name}) given every
+    name already in use. A rename is skipped if its target is held by an
+    object that isn't moving, is wanted by an earlier request, or is too long.
+    """
+    plan = RenamePlan()
+    moves = {}
+    targets = {}  # wanted name -> current name of the object that wants it
+    for old, new in requests.items():
+        if new == old:
+            continue
+        if not new:
+            plan.skipped.append(SkippedRename(old, new, "empty name"))
+        elif len(new.encode('utf-8')) > max_length:
+            plan.skipped.append(SkippedRename(old, new, f"longer than {max_length} bytes"))
+        elif new in targets:
+            plan.skipped.append(SkippedRename(old, new, f"'{targets[new]}' is being renamed to it too"))
+        else:
+            moves[old] = new
+            targets[new] = old
+
+    # Targets held by objects that stay put. Dropping a move keeps that
+    # object's name taken, which can in turn block whoever wanted it.
+    blocked = [old for old, new in moves.items() if new in existing_names and new not in moves]
+    while blocked:
+        old = blocked.pop()
+        new = moves.pop(old, None)
+        if new is None:
+            continue
+        del targets[new]
+        plan.skipped.append(SkippedRename(old, new, f"'{new}' is taken by another object"))
+        waiting = targets.get(old)
+        if waiting is not None:
+            blocked.append(waiting)
+
+    # Each name has at most one object moving into it, so the moves form
+    # chains and simple cycles. Chains are applied from the end whose target
+    # is free; walking back, each move frees the name the previous one wants.
+    done = set()
+    for old, new in moves.items():
+        if new in moves or old in done:
+            continue
+        current = old
+        while current is not None:
+            plan.steps.append((current, moves[current]))
+            done.add(current)
+            current = targets.get(current)
+
+    # What's left are cycles: park one object on a temporary name, rotate the
+    # rest, then move the parked one into place
+    taken = set(existing_names) | set(targets)
+    for start in moves:
+        if start in done:
+            continue
+        plan.cycles += 1
+        temp = _temp_name(taken)
+        plan.steps.append((start, temp))
+        done.add(start)
+        current = targets[start]
+        while current != start:
+            plan.steps.append((current, moves[current]))
+            done.add(current)
+            current = targets[current]
+        plan.steps.append((temp, moves[start]))
+
+    plan.renamed = list(moves.items())
+    return plan
@@ -0,0 +1,127 @@
+import json
+import os
+import time
+
+# Result collector for batch operators.
+# While a log is active, per-object messages are recorded here instead of
+# opening a popup each, and the operator shows one summary at the end.
+# No bpy, so it can be written out from anywhere.
+
+SEVERITIES = ('ERROR', 'WARNING', 'INFO')
+
+
+def message_code(title):
+    """'CSV Row Not Found' -> 'CSV_ROW_NOT_FOUND'"""
+    return "_".join(title.upper().split())
+
+
+class ResultEntry:
+    __slots__ = ("obj_name", "severity", "code", "message")
+
+    def __init__(self, obj_name, severity, code, message):
+        self.obj_name = obj_name
+        self.severity = severity
+        self.code = code
+        self.message = message
+
+    def to_dict(self):
+        return {"object": self.obj_name, "severity": self.severity, "code": self.code, "message": self.message}
+
+
+class ResultLog:
+    """Every message from one operator run, in the order they were added."""
+
+    def __init__(self, operator_name):
+        self.operator_name = operator_name
+        self.started = time.time()
+        self.seconds = 0.0
+        self.entries = []
+
+    def add(self, obj_name, code, message, severity='INFO'):
+        if severity not in SEVERITIES:
+            severity = 'INFO'
+        self.entries.append(ResultEntry(obj_name, severity, code, message))
+
+    def close(self):
+        self.seconds = time.time() - self.started
+
+    def counts(self):
+        counts = dict.fromkeys(SEVERITIES, 0)
+        for entry in self.entries:
+            counts[entry.severity] += 1
+        return counts
+
+    def objects(self):
+        return len({entry.obj_name for entry in self.entries})
+
+    def code_counts(self, severity=None):
+        """{code: count}, most frequent first."""
+        counts = {}
+        for entry in self.entries:
+            if severity is None or entry.severity == severity:
+                counts[entry.code] = counts.get(entry.code, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: -kv[1]))
+
+    def summary(self):
+        c = self.counts()
+        return (f"{self.operator_name}: {self.objects()} objects, {c['ERROR']} errors, "
+                f"{c['WARNING']} warnings, {c['INFO']} info ({self.seconds:.2f}s)")
+
+    def to_text(self):
+        """Plain text report, errors first, grouped by object."""
+        lines = [self.summary(), ""]
+        for severity in SEVERITIES:
+            entries = [e for e in self.entries if e.severity == severity]
+            if not entries:
+                continue
+            lines.append(f"== {severity} ({len(entries)}) ==")
+            for e in entries:
+                lines.append(f"{e.obj_name}  [{e.code}]  {e.message}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def to_json(self):
+        return {
+            "operator": self.operator_name,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "seconds": round(self.seconds, 3),
+            "counts": self.counts(),
+            "entries": [e.to_dict() for e in self.entries],
+        }
+
+    def write_json(self, filepath):
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+_ACTIVE = None
+LAST_RESULT_LOG = None
+
+def active_result_log():
+    return _ACTIVE
+
+def start_result_log(operator_name):
+    global _ACTIVE
+    _ACTIVE = ResultLog(operator_name)
+    return _ACTIVE
+
+def resume_result_log(log):
+    """Makes log active again, e.g. for the next tick of a modal operator."""
+    global _ACTIVE
+    _ACTIVE = log
+
+def suspend_result_log():
+    global _ACTIVE
+    _ACTIVE = None
+
+def end_result_log(log):
+    global _ACTIVE, LAST_RESULT_LOG
+    if _ACTIVE is log:
+        _ACTIVE = None
+    log.close()
+    LAST_RESULT_LOG = log
+    return log
+
+def last_result_log():
+    return LAST_RESULT_LOG
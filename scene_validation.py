@@ -0,0 +1,558 @@
+import bmesh
+import bpy
+import os
+import time
+
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import StringProperty, BoolProperty, EnumProperty
+
+from .asset_table import load_asset_table, cached_asset_table, sheet_spec_abspath, budget_status, AssetCategory
+from .validation_report import write_report
+from .texture_audit import TEXTURE_FORMATS, read_image_header, audit_texture
+
+# Scene-wide validation against the CSV asset sheet
+
+
+def scene_sheet_path(scene):
+    """scene.csv_path made absolute; may name several sheets, see asset_table."""
+    return sheet_spec_abspath(scene.csv_path, bpy.path.abspath)
+
+def triangle_count(mesh):
+    """
+    True triangle count of a mesh: sum of (loop_total - 2) over all polygons.
+    In Edit Mode mesh.polygons is only written back on leaving it, so the
+    edit mesh is counted instead.
+    """
+    if mesh.is_editmode:
+        bm = bmesh.from_edit_mesh(mesh)
+        return sum(len(f.verts) for f in bm.faces) - 2 * len(bm.faces)
+    n = len(mesh.polygons)
+    if n == 0:
+        return 0
+    loop_totals = np.empty(n, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(loop_totals.sum()) - 2 * n
+
+def object_triangle_count(obj, depsgraph=None):
+    """Triangle count of a mesh object, with modifiers applied when a depsgraph is given."""
+    if depsgraph is None or not obj.modifiers:
+        return triangle_count(obj.data)
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        return triangle_count(mesh)
+    finally:
+        obj_eval.to_mesh_clear()
+
+# Bytes per vertex stream, matching a typical engine static mesh layout:
+# float3 position, packed tangent basis, half2 per UV channel, RGBA8 color.
+POSITION_BYTES = 12
+TANGENT_BYTES = 8
+UV_BYTES = 4
+COLOR_BYTES = 4
+
+def _unique_row_count(columns):
+    """Number of unique rows across the given (L, k) column blocks."""
+    rows = np.ascontiguousarray(np.hstack(columns), dtype=np.float32)
+    rows += 0.0  # -0.0 and 0.0 must compare equal
+    as_void = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])))
+    return len(np.unique(as_void))
+
+def mesh_render_cost(mesh):
+    """
+    Estimated runtime cost of a mesh once it is on the GPU. A face corner
+    becomes its own vertex when its (position, normal, UVs, color, material
+    section) differs, so UV seams, hard edges and material splits all count.
+    Returns gpu_verts, sections (draw calls), vertex_bytes and index_bytes.
+    """
+    n_loops = len(mesh.loops)
+    n_polys = len(mesh.polygons)
+    if n_loops == 0:
+        return {"gpu_verts": 0, "sections": 0, "vertex_bytes": 0, "index_bytes": 0}
+
+    vertex_index = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_index)
+
+    loop_totals = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    material_index = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    loop_material = np.repeat(material_index, loop_totals)
+
+    # Everything is compared as float32 bit patterns after rounding
+    columns = [vertex_index.astype(np.float32)[:, None], loop_material.astype(np.float32)[:, None]]
+
+    normals = np.empty(n_loops * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    columns.append(np.round(normals.reshape(-1, 3), 4))
+
+    for uv_layer in mesh.uv_layers:
+        uvs = np.empty(n_loops * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        columns.append(np.round(uvs.reshape(-1, 2), 5))
+
+    color_streams = 0
+    for attr in mesh.color_attributes:
+        if attr.domain not in {'CORNER', 'POINT'}:
+            continue
+        colors = np.empty(len(attr.data) * 4, dtype=np.float32)
+        attr.data.foreach_get("color", colors)
+        colors = colors.reshape(-1, 4)
+        if attr.domain == 'POINT':
+            colors = colors[vertex_index]
+        # 8 bit per channel on the GPU
+        columns.append(np.round(colors * 255.0))
+        color_streams += 1
+
+    gpu_verts = _unique_row_count(columns)
+    tris = int(loop_totals.sum()) - 2 * n_polys
+    stride = POSITION_BYTES + TANGENT_BYTES + UV_BYTES * len(mesh.uv_layers) + COLOR_BYTES * color_streams
+    return {
+        "gpu_verts": gpu_verts,
+        "sections": len(np.unique(material_index)),
+        "vertex_bytes": gpu_verts * stride,
+        "index_bytes": tris * 3 * (2 if gpu_verts <= 0xFFFF else 4),
+    }
+
+
+def build_root_map(objects):
+    """Maps every object to its top-most parent in a single pass over the hierarchy."""
+    roots = {}
+    for obj in objects:
+        chain = []
+        node = obj
+        while node is not None and node not in roots:
+            chain.append(node)
+            node = node.parent
+        root = roots[node] if node is not None else chain[-1]
+        for o in chain:
+            roots[o] = root
+    return roots
+
+
+def expected_asset_name(row):
+    """Name the root object should have for this row, or None if the category has no prefix."""
+    if row.category in (AssetCategory.ENVIRONMENT, AssetCategory.PROP):
+        return f"SM_{row.asset_name}"
+    if row.category is AssetCategory.CHARACTER:
+        return f"SK_{row.asset_name}"
+    return None
+
+def check_naming(root, row):
+    expected = expected_asset_name(row)
+    if expected and root.name.lower() != expected.lower():
+        return [f"Name should be '{expected}'"]
+    return []
+
+def check_materials(meshes, row):
+    if not row.master_material:
+        return ["No MasterMaterial in CSV"]
+    issues = []
+    for obj in meshes:
+        names = {slot.material.name for slot in obj.material_slots if slot.material}
+        if row.master_material not in names:
+            issues.append(f"{obj.name} is missing material '{row.master_material}'")
+    return issues
+
+def asset_images(meshes):
+    """Every image used by image texture nodes in the materials of meshes."""
+    images = set()
+    for obj in meshes:
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat is None or not mat.use_nodes or mat.node_tree is None:
+                continue
+            for node in mat.node_tree.nodes:
+                if node.type == 'TEX_IMAGE' and node.image is not None:
+                    images.add(node.image)
+    return images
+
+def image_dimensions(img):
+    """(width, height, has_alpha) without decoding pixels when the file header allows it."""
+    if img.source == 'FILE' and not img.packed_file:
+        header = read_image_header(bpy.path.abspath(img.filepath))
+        if header is not None:
+            return header
+    if img.source == 'GENERATED':
+        return img.generated_width, img.generated_height, img.alpha_mode != 'NONE'
+    # Packed or unrecognised formats (EXR, HDR, ...) have to go through Blender's loader
+    if img.has_data or img.packed_file or os.path.exists(bpy.path.abspath(img.filepath)):
+        width, height = img.size
+        if width and height:
+            return width, height, img.channels == 4
+    return None
+
+def check_textures(meshes, row=None, texture_format='AUTO'):
+    """
+    Texture audit for one asset: missing files, images over the row's
+    TexResolution budget, non power of two sizes and GPU memory with mips.
+    Returns (issues, per-image entries).
+    """
+    issues = []
+    textures = []
+    max_resolution = row.tex_resolution if row is not None else None
+    for img in sorted(asset_images(meshes), key=lambda i: i.name):
+        dims = image_dimensions(img)
+        if dims is None:
+            if img.source == 'FILE' and not img.packed_file and not os.path.exists(bpy.path.abspath(img.filepath)):
+                issues.append(f"Missing texture file for '{img.name}': {img.filepath}")
+            else:
+                issues.append(f"Could not read the size of '{img.name}'")
+            continue
+        entry = audit_texture(img.name, *dims, texture_format, max_resolution)
+        issues.extend(entry["issues"])
+        textures.append(entry)
+    return issues, textures
+
+
+def validate_asset(root, meshes, table, depsgraph=None, mesh_tris=None, extra_checks=False, texture_format='AUTO'):
+    """
+    Checks one root asset (and its mesh objects) against its CSV row.
+    extra_checks adds naming, material and texture checks to result["issues"].
+    """
+    if mesh_tris is None:
+        mesh_tris = {}  # mesh pointer -> tris, instances share mesh data
+    objects = []
+    total = 0
+    cost = {"gpu_verts": 0, "sections": 0, "vertex_bytes": 0, "index_bytes": 0}
+    for obj in meshes:
+        if extra_checks:
+            obj_cost = object_render_cost(obj, depsgraph)
+            for k in cost:
+                cost[k] += obj_cost[k]
+            tris = obj_cost["tris"]
+        elif depsgraph is not None and obj.modifiers:
+            tris = object_triangle_count(obj, depsgraph)
+        else:
+            key = obj.data.as_pointer()
+            tris = mesh_tris.get(key)
+            if tris is None:
+                tris = mesh_tris[key] = triangle_count(obj.data)
+        objects.append({"object": obj.name, "tris": tris})
+        total += tris
+
+    resolution = table.resolve(root.name) if table else None
+    row = resolution.row if resolution else None
+    result = {
+        "root": root.name,
+        "asset": row.asset_name if row else None,
+        "tris": total,
+        "max_tris": None,
+        "status": "OK",
+        "objects": objects,
+    }
+    if resolution is not None and resolution.ambiguous:
+        result["status"] = "AMBIGUOUS"
+        result["candidates"] = [c.row.asset_name for c in resolution.candidates]
+    elif row is None:
+        result["status"] = "NO_CSV_ROW"
+    else:
+        result["max_tris"] = row.max_tris
+        result["status"] = budget_status(row, total)
+
+    if extra_checks:
+        result["gpu_verts"] = cost["gpu_verts"]
+        result["draw_calls"] = cost["sections"]
+        result["buffer_kb"] = round((cost["vertex_bytes"] + cost["index_bytes"]) / 1024, 1)
+
+        issues, textures = check_textures(meshes, row, texture_format)
+        if row is not None:
+            issues = check_naming(root, row) + check_materials(meshes, row) + issues
+        result["issues"] = issues
+        result["textures"] = textures
+        result["texture_mb"] = round(sum(t["bytes"] for t in textures) / (1024 * 1024), 2)
+    return result
+
+def validate_scene(scene, table, depsgraph=None, extra_checks=False, texture_format='AUTO'):
+    """
+    Checks every mesh asset in the scene against its CSV row.
+    Returns one result dict per root object.
+    """
+    roots = build_root_map(scene.objects)
+    meshes_by_root = {}
+    for obj, root in roots.items():
+        if obj.type == 'MESH':
+            meshes_by_root.setdefault(root, []).append(obj)
+
+    mesh_tris = {}
+    return [validate_asset(root, meshes, table, depsgraph, mesh_tris, extra_checks, texture_format)
+            for root, meshes in meshes_by_root.items()]
+
+
+# Live revalidation of edited assets
+
+ASSET_STATUS = {}  # root object name -> latest validate_asset() result
+_pending_objects = set()  # names of objects whose geometry changed since the last pass
+REVALIDATE_DELAY = 0.25  # seconds, batches rapid edits into one pass
+
+def get_asset_status(obj):
+    """Latest live validation result for the asset obj belongs to, or None."""
+    root = obj
+    while root.parent:
+        root = root.parent
+    return ASSET_STATUS.get(root.name)
+
+def _revalidate_pending():
+    scene = bpy.context.scene
+    table = load_asset_table(scene_sheet_path(scene))
+    roots = set()
+    for name in _pending_objects:
+        obj = scene.objects.get(name)
+        if obj is None:
+            continue
+        while obj.parent:
+            obj = obj.parent
+        roots.add(obj)
+    _pending_objects.clear()
+
+    for root in roots:
+        meshes = [o for o in (root, *root.children_recursive) if o.type == 'MESH']
+        if meshes:
+            ASSET_STATUS[root.name] = validate_asset(root, meshes, table)
+        else:
+            ASSET_STATUS.pop(root.name, None)
+    return None  # one-shot timer
+
+# Panel status cache
+#
+# The tools panel redraws many times a second, so its per-object readout is
+# cached here keyed by (object pointer, mesh pointer, geometry versions, CSV
+# version). draw() only reads; misses are filled on a timer and the panel is
+# redrawn once they are ready. The mesh cost is cached separately on the mesh
+# geometry version alone, so moving an object only redoes the row lookup.
+
+_panel_status = {}  # object pointer -> (key, entry)
+_mesh_cost = {}  # mesh pointer -> (geometry version, triangle count and render cost)
+_csv_versions = {}  # sheet path -> version last seen by _poll_csv
+_panel_pending = {}  # object pointer -> object name, waiting for a refresh
+_geometry_versions = {}  # mesh/object pointer -> edit counter, bumped by the depsgraph handler
+_object_count = [0]  # len(bpy.data.objects) last time we looked, to spot deletions
+CSV_POLL_INTERVAL = 1.0  # seconds between checks of the CSV file on disk
+
+def geometry_version(id_ptr):
+    """Edit counter for an object or mesh pointer, bumped on every depsgraph update to it."""
+    return _geometry_versions.get(id_ptr, 0)
+
+def _table_version(table):
+    # For the SQLite backend mtime_ns runs a PRAGMA, so only _poll_csv calls this
+    return (table.mtime_ns, table.size) if table else None
+
+def _panel_status_key(obj):
+    path = scene_sheet_path(bpy.context.scene)
+    if path not in _csv_versions:
+        _csv_versions[path] = _table_version(cached_asset_table(path))
+    csv_version = _csv_versions[path]
+    mesh_ptr = obj.data.as_pointer() if obj.type == 'MESH' else 0
+    obj_ptr = obj.as_pointer()
+    geometry_version = (_geometry_versions.get(mesh_ptr, 0), _geometry_versions.get(obj_ptr, 0))
+    return (obj_ptr, mesh_ptr, geometry_version, csv_version)
+
+def get_panel_status(obj):
+    """
+    Cached panel readout for obj: dict with asset, tris, max_tris and
+    within_budget. Returns None (and queues a refresh) when not ready yet.
+    """
+    key = _panel_status_key(obj)
+    cached = _panel_status.get(key[0])
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    _panel_pending[key[0]] = obj.name
+    if not bpy.app.timers.is_registered(_refresh_panel_status):
+        bpy.app.timers.register(_refresh_panel_status, first_interval=0.0)
+    return cached[1] if cached is not None else None
+
+def _refresh_panel_status():
+    scene = bpy.context.scene
+    table = load_asset_table(scene_sheet_path(scene))
+    for obj_ptr, name in list(_panel_pending.items()):
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.as_pointer() != obj_ptr:
+            _panel_status.pop(obj_ptr, None)
+            continue
+        root = obj
+        while root.parent:
+            root = root.parent
+        row = table.find(root.name) if table else None
+        entry = {
+            "asset": row.asset_name if row else None,
+            "tris": None,
+            "max_tris": row.max_tris if row else None,
+            "within_budget": None,
+        }
+        if obj.type == 'MESH':
+            entry.update(_cached_mesh_cost(obj.data))
+        if row and entry["tris"] is not None and row.max_tris is not None:
+            entry["within_budget"] = entry["tris"] <= row.max_tris
+        _panel_status[obj_ptr] = (_panel_status_key(obj), entry)
+    _panel_pending.clear()
+    _tag_panel_redraw()
+    return None
+
+def object_render_cost(obj, depsgraph=None):
+    """
+    Triangle count and render cost of a mesh object. With a depsgraph and
+    modifiers it is measured on the evaluated mesh, otherwise it comes from
+    the cache keyed by mesh pointer and geometry version.
+    """
+    if depsgraph is None or not obj.modifiers:
+        return _cached_mesh_cost(obj.data)
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        return {"tris": triangle_count(mesh), **mesh_render_cost(mesh)}
+    finally:
+        obj_eval.to_mesh_clear()
+
+def _cached_mesh_cost(mesh):
+    mesh_ptr = mesh.as_pointer()
+    version = _geometry_versions.get(mesh_ptr, 0)
+    cached = _mesh_cost.get(mesh_ptr)
+    if cached is None or cached[0] != version:
+        cost = {"tris": triangle_count(mesh), **mesh_render_cost(mesh)}
+        cached = _mesh_cost[mesh_ptr] = (version, cost)
+    return cached[1]
+
+def _poll_csv():
+    """
+    Re-stats the CSV (or asks SQLite for its data version) once per interval,
+    so on-disk edits bump the CSV version the panel keys on.
+    """
+    scene = bpy.context.scene
+    if scene is not None and _panel_status:
+        path = scene_sheet_path(scene)
+        version = _table_version(load_asset_table(path))
+        if _csv_versions.get(path) != version:
+            _csv_versions[path] = version
+            _tag_panel_redraw()
+    return CSV_POLL_INTERVAL
+
+def _evict_deleted_objects():
+    alive = {o.as_pointer() for o in bpy.data.objects}
+    for obj_ptr in [p for p in _panel_status if p not in alive]:
+        del _panel_status[obj_ptr]
+    meshes = {m.as_pointer() for m in bpy.data.meshes}
+    for mesh_ptr in [p for p in _mesh_cost if p not in meshes]:
+        del _mesh_cost[mesh_ptr]
+
+def _tag_panel_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+@persistent
+def csv2mesh_depsgraph_update(scene, depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            obj = update.id.original
+            _geometry_versions[obj.as_pointer()] = _geometry_versions.get(obj.as_pointer(), 0) + 1
+            if update.is_updated_geometry and obj.type == 'MESH':
+                mesh_ptr = obj.data.as_pointer()
+                _geometry_versions[mesh_ptr] = _geometry_versions.get(mesh_ptr, 0) + 1
+    if len(bpy.data.objects) != _object_count[0]:
+        _object_count[0] = len(bpy.data.objects)
+        _evict_deleted_objects()
+
+    if not getattr(scene, "csv2mesh_live_validation", False):
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry or not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        if obj.type == 'MESH':
+            _pending_objects.add(obj.name)
+    if _pending_objects and not bpy.app.timers.is_registered(_revalidate_pending):
+        bpy.app.timers.register(_revalidate_pending, first_interval=REVALIDATE_DELAY)
+
+def _live_validation_toggled(self, context):
+    ASSET_STATUS.clear()
+    _pending_objects.clear()
+
+
+class CSV2MESH_OT_ValidateScene(bpy.types.Operator):
+    bl_idname = "csv2mesh.validate_scene"
+    bl_label = "Validate Scene"
+    bl_description = "Validate every asset in the scene against the CSV and write a report"
+
+    def execute(self, context):
+        scene = context.scene
+        start = time.perf_counter()
+        table = load_asset_table(scene_sheet_path(scene))
+        if table is None:
+            self.report({'ERROR'}, "Could not read the CSV file.")
+            return {'CANCELLED'}
+
+        depsgraph = context.evaluated_depsgraph_get() if scene.csv2mesh_report_use_modifiers else None
+        results = validate_scene(scene, table, depsgraph, extra_checks=True,
+                                 texture_format=scene.csv2mesh_texture_format)
+
+        report_path = bpy.path.abspath(scene.csv2mesh_report_path)
+        failed = sum(1 for r in results if r["status"] != "OK" or r.get("issues"))
+        meta = {
+            "scene": scene.name,
+            "csv": table.path,
+            "assets": len(results),
+            "failed": failed,
+            "modifiers": scene.csv2mesh_report_use_modifiers,
+            "csv_issues": [f"line {i.line} ({i.asset}): {i.message}" for i in table.issues],
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+        write_report(results, report_path, meta)
+
+        self.report({'WARNING'} if failed else {'INFO'},
+                    f"Validated {len(results)} assets, {failed} with issues. Report: {report_path}")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CSV2MESH_OT_ValidateScene)
+    bpy.types.Scene.csv2mesh_report_path = StringProperty(
+        name="Report Path",
+        description="Validation report file (.json, .csv or .html)",
+        default="//validation_report.json",
+        subtype='FILE_PATH'
+    )
+    bpy.types.Scene.csv2mesh_report_use_modifiers = BoolProperty(
+        name="Include Modifiers",
+        description="Count triangles on the evaluated mesh with modifiers applied",
+        default=False
+    )
+    bpy.types.Scene.csv2mesh_texture_format = EnumProperty(
+        name="Texture Format",
+        description="GPU compression format used for texture memory estimates",
+        items=[('AUTO', "Auto", "BC3 for images with alpha, BC1 otherwise")] +
+              [(f, f, "") for f in TEXTURE_FORMATS],
+        default='AUTO'
+    )
+    bpy.types.Scene.csv2mesh_live_validation = BoolProperty(
+        name="Live Validation",
+        description="Revalidate assets against the CSV whenever their geometry is edited. "
+                    "In Edit Mode triangle counts follow the edit mesh; render cost estimates update on leaving it",
+        default=False,
+        update=_live_validation_toggled
+    )
+    bpy.app.handlers.depsgraph_update_post.append(csv2mesh_depsgraph_update)
+    bpy.app.timers.register(_poll_csv, first_interval=CSV_POLL_INTERVAL, persistent=True)
+
+def unregister():
+    bpy.utils.unregister_class(CSV2MESH_OT_ValidateScene)
+    del bpy.types.Scene.csv2mesh_report_path
+    del bpy.types.Scene.csv2mesh_report_use_modifiers
+    del bpy.types.Scene.csv2mesh_live_validation
+    del bpy.types.Scene.csv2mesh_texture_format
+    if csv2mesh_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(csv2mesh_depsgraph_update)
+    for timer in (_revalidate_pending, _refresh_panel_status, _poll_csv):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    ASSET_STATUS.clear()
+    _panel_status.clear()
+    _mesh_cost.clear()
+    _csv_versions.clear()
+    _panel_pending.clear()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The add-on package imports bpy; the bpy-free helper modules are imported
+# directly from the repo folder instead.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
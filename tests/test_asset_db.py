@@ -0,0 +1,46 @@
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+# asset_db imports asset_table relatively; load both into a throwaway package
+pkg = types.ModuleType("sheets")
+pkg.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+sys.modules.setdefault("sheets", pkg)
+asset_db = importlib.import_module("sheets.asset_db")
+asset_table = importlib.import_module("sheets.asset_table")
+
+SHEET = """AssetName,Category,MaxTris,ActualTris,TexResolution,Status,MasterMaterial,Notes
+Statue01,Environment,5000,,2048,Pending,PropLit,
+CrateA,Prop,1200,1154,1024,Approved,PropLit,
+"""
+
+
+@pytest.fixture
+def db(tmp_path):
+    csv_path = tmp_path / "GameData.csv"
+    csv_path.write_text(SHEET, encoding="utf-8")
+    db = asset_db.AssetDatabase(str(tmp_path / "GameData.db"))
+    db.import_csv(str(csv_path))
+    yield db
+    db.close()
+
+
+def test_write_back_fills_an_empty_cell(db):
+    queue = asset_table.CSVWriteQueue(db.path, base_table=db)
+    queue.set("SM_Statue01", "ActualTris", 4000)
+    result = queue.flush()
+    assert result.conflicts == []
+    assert result.updated == ["Statue01"]
+    assert db.get("Statue01").actual_tris == 4000
+
+
+def test_write_back_reports_a_concurrent_change(db):
+    queue = asset_table.CSVWriteQueue(db.path, base_table=db)
+    queue.set("SM_CrateA", "ActualTris", 1100)
+    db.conn.execute("UPDATE assets SET ActualTris = '1300' WHERE AssetName = 'CrateA'")
+    result = queue.flush()
+    assert result.updated == []
+    assert result.conflicts == [("CrateA", "ActualTris", "1300", "1100")]
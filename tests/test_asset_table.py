@@ -0,0 +1,58 @@
+import os
+
+from asset_table import load_asset_table, budget_status, replace_sheet
+
+SHEET = """AssetName,Category,MaxTris,ActualTris,TexResolution,Status,MasterMaterial,Notes
+Statue01,Environment,5000,4900,2048,Pending,PropLit,
+CrateA,Prop,,1154,1024,Approved,PropLit,empty budget
+DoorHeavy,Prop,lots,2340,1024,OverBudget,EnvLit,text budget
+"""
+
+
+def load(tmp_path):
+    path = tmp_path / "GameData.csv"
+    path.write_text(SHEET, encoding="utf-8")
+    return load_asset_table(str(path))
+
+
+def test_budget_status_within_and_over(tmp_path):
+    row = load(tmp_path).find("SM_Statue01")
+    assert budget_status(row, 5000) == 'OK'
+    assert budget_status(row, 5001) == 'OVER_BUDGET'
+
+
+def test_missing_max_tris_is_a_malformed_row_not_over_budget(tmp_path):
+    table = load(tmp_path)
+    for name in ("SM_CrateA", "SM_DoorHeavy"):
+        row = table.find(name)
+        assert row.max_tris is None
+        assert budget_status(row, 10) == 'BAD_CSV_ROW'
+    assert {(i.asset, i.message.split(" ")[0]) for i in table.issues} == {("CrateA", "MaxTris"), ("DoorHeavy", "MaxTris")}
+
+
+def test_write_back_keeps_the_sheet_mode(tmp_path):
+    table = load(tmp_path)
+    path = tmp_path / "GameData.csv"
+    os.chmod(path, 0o664)
+    replace_sheet(str(path), table.fieldnames, [row.to_dict(table.fieldnames) for row in table.rows])
+    assert os.stat(path).st_mode & 0o777 == 0o664
+
+
+def test_duplicate_and_lod_suffixes_resolve_to_the_sheet_row(tmp_path):
+    table = load(tmp_path)
+    for name in ("SM_CrateA.001", "SM_CrateA_LOD1", "SM_CrateA_LOD2.003"):
+        resolution = table.resolve(name)
+        assert not resolution.ambiguous
+        assert resolution.row.asset_name == "CrateA"
+
+
+def test_sheet_saved_with_a_byte_order_mark(tmp_path):
+    path = tmp_path / "GameData.csv"
+    path.write_text(SHEET, encoding="utf-8-sig")
+    assert load_asset_table(str(path)).find("SM_Statue01").max_tris == 5000
+
+
+def test_unreadable_sheet_loads_as_none(tmp_path):
+    path = tmp_path / "GameData.csv"
+    path.write_bytes(b"AssetName,MaxTris\n\xff\xfeStatue01,5000\n")
+    assert load_asset_table(str(path)) is None
@@ -0,0 +1,40 @@
+import numpy as np
+
+from mesh_analysis import connected_components, part_adjacency, color_parts
+
+
+def loose_vertex_mesh():
+    """Two touching quads, a separate quad and a trailing loose vertex (index 12)."""
+    quads = [(0, 1, 2, 3), (4, 5, 6, 7), (8, 9, 10, 11)]
+    edges = np.array([(q[i], q[(i + 1) % 4]) for q in quads for i in range(4)])
+    part_ids = connected_components(13, edges)
+    loop_verts = np.array([v for q in quads for v in q])
+    uvs = np.array([
+        (0.0, 0.0), (0.2, 0.0), (0.2, 0.2), (0.0, 0.2),
+        (0.2, 0.0), (0.4, 0.0), (0.4, 0.2), (0.2, 0.2),  # shares an edge with the first
+        (0.8, 0.8), (1.0, 0.8), (1.0, 1.0), (0.8, 1.0),
+    ])
+    return part_ids, loop_verts, uvs
+
+
+def test_loose_vertex_has_no_bounds_and_no_neighbours():
+    part_ids, loop_verts, uvs = loose_vertex_mesh()
+    assert part_ids.max() == 3  # the loose vertex is the last part
+    edges = part_adjacency(uvs, part_ids[loop_verts], 4)
+    assert {tuple(sorted(e)) for e in edges.tolist()} == {(0, 1)}
+
+
+def test_loose_vertex_in_the_middle_does_not_borrow_bounds():
+    # Loose vertex as part 1, between the two touching quads and the far one
+    labels = np.array([0] * 4 + [2] * 4 + [3] * 4)
+    _, _, uvs = loose_vertex_mesh()
+    edges = part_adjacency(uvs, labels, 4)
+    assert {tuple(sorted(e)) for e in edges.tolist()} == {(0, 2)}
+
+
+def test_color_parts_skips_empty_parts():
+    part_ids, loop_verts, uvs = loose_vertex_mesh()
+    colors = color_parts(uvs, part_ids[loop_verts], 4)
+    assert colors[0] != colors[1]
+    assert colors[3] == 0
+    assert colors.max() == 1
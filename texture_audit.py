@@ -0,0 +1,101 @@
+import struct
+
+# Texture memory estimates for the validator.
+# Image sizes are read from the file header only, so auditing a level never
+# decodes pixels. No bpy here; scene_validation feeds it image file paths.
+
+# bytes per 4x4 block for block compressed formats, bytes per pixel otherwise
+TEXTURE_FORMATS = {
+    'BC1':   ("block", 8),    # DXT1, RGB
+    'BC3':   ("block", 16),   # DXT5, RGBA
+    'BC5':   ("block", 16),   # normal maps
+    'BC7':   ("block", 16),
+    'ASTC4': ("block", 16),   # ASTC 4x4
+    'RGBA8': ("pixel", 4),
+    'RGBA16F': ("pixel", 8),
+}
+
+
+def read_image_header(filepath):
+    """
+    (width, height, has_alpha) from the header of a PNG, JPEG, TGA, BMP or
+    DDS file, or None if the format isn't recognised or the file can't be read.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(32)
+            if head[:8] == b'\x89PNG\r\n\x1a\n':
+                width, height, _, color_type = struct.unpack('>IIBB', head[16:26])
+                return width, height, color_type in (4, 6)
+            if head[:2] == b'\xff\xd8':
+                return _read_jpeg_size(f)
+            if head[:2] == b'BM':
+                width, height = struct.unpack('<ii', head[18:26])
+                bits = struct.unpack('<H', head[28:30])[0]
+                return width, abs(height), bits == 32
+            if head[:4] == b'DDS ':
+                height, width = struct.unpack('<II', head[12:20])
+                return width, height, True
+            if filepath.lower().endswith('.tga') and len(head) >= 18:
+                width, height, bits = struct.unpack('<HHB', head[12:17])
+                return width, height, bits == 32
+    except (OSError, struct.error):
+        return None
+    return None
+
+def _read_jpeg_size(f):
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        length = struct.unpack('>H', f.read(2))[0]
+        # Start-of-frame markers carry the image size
+        if code in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+            _, height, width = struct.unpack('>BHH', f.read(5))
+            return width, height, False
+        f.seek(length - 2, 1)
+
+
+def is_power_of_two(n):
+    return n > 0 and (n & (n - 1)) == 0
+
+def resolve_format(texture_format, has_alpha):
+    """'AUTO' picks BC3 for images with alpha and BC1 for the rest."""
+    if texture_format == 'AUTO':
+        return 'BC3' if has_alpha else 'BC1'
+    return texture_format
+
+def texture_memory_bytes(width, height, texture_format, mips=True):
+    """GPU memory for a width x height texture, including the full mip chain."""
+    kind, size = TEXTURE_FORMATS[texture_format]
+    total = 0
+    w, h = width, height
+    while True:
+        if kind == "block":
+            total += ((w + 3) // 4) * ((h + 3) // 4) * size
+        else:
+            total += w * h * size
+        if not mips or (w == 1 and h == 1):
+            return total
+        w, h = max(1, w // 2), max(1, h // 2)
+
+def audit_texture(name, width, height, has_alpha, texture_format, max_resolution=None):
+    """Memory estimate and budget issues for one texture."""
+    fmt = resolve_format(texture_format, has_alpha)
+    entry = {
+        "image": name,
+        "width": width,
+        "height": height,
+        "format": fmt,
+        "bytes": texture_memory_bytes(width, height, fmt),
+        "issues": [],
+    }
+    if max_resolution and max(width, height) > max_resolution:
+        entry["issues"].append(f"{name} is {width}x{height}, budget is {max_resolution}")
+    if not (is_power_of_two(width) and is_power_of_two(height)):
+        entry["issues"].append(f"{name} is not power of two ({width}x{height})")
+    return entry
@@ -0,0 +1,57 @@
+import csv
+import html
+import json
+import os
+
+# Validation report writers.
+# No bpy and no package-relative imports, so the command line batch validator
+# can use this outside Blender.
+
+REPORT_COLUMNS = ("root", "asset", "status", "tris", "max_tris", "gpu_verts", "draw_calls", "buffer_kb",
+                  "texture_mb", "issues")
+
+
+def report_columns(results):
+    """REPORT_COLUMNS, with 'file' first when the results span several .blend files."""
+    if any("file" in r for r in results):
+        return ("file",) + REPORT_COLUMNS
+    return REPORT_COLUMNS
+
+def _cell(value):
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+def write_report(results, filepath, meta=None):
+    """Writes results as JSON, CSV or HTML depending on the file extension."""
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    ext = os.path.splitext(filepath)[1].lower()
+    columns = report_columns(results)
+    if ext == ".csv":
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for r in results:
+                writer.writerow([_cell(r.get(c)) for c in columns])
+    elif ext in (".html", ".htm"):
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(render_html_report(results, meta or {}, columns))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({"meta": meta or {}, "results": results}, f, indent=2)
+
+def render_html_report(results, meta, columns=REPORT_COLUMNS):
+    colors = {"OK": "#c8f7c5", "OVER_BUDGET": "#f7c5c5"}
+    lines = [
+        "<html><head><meta charset='utf-8'><title>Asset Validation Report</title></head><body>",
+        "<h1>Asset Validation Report</h1>",
+        "<p>" + html.escape(", ".join(f"{k}: {_cell(v)}" for k, v in meta.items())) + "</p>",
+        "<table border='1' cellspacing='0' cellpadding='3'>",
+        "<tr>" + "".join(f"<th>{c}</th>" for c in columns) + "</tr>",
+    ]
+    for r in results:
+        color = colors.get(r["status"], "#f7eec5")
+        cells = "".join(f"<td>{html.escape(_cell(r.get(c)))}</td>" for c in columns)
+        lines.append(f"<tr style='background:{color}'>{cells}</tr>")
+    lines.append("</table></body></html>")
+    return "\n".join(lines)
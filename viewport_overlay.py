@@ -0,0 +1,240 @@
+import bpy
+import blf
+import gpu
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import IntProperty
+from gpu_extras.batch import batch_for_shader
+
+from .asset_table import load_asset_table
+from .scene_validation import scene_sheet_path, triangle_count, build_root_map, geometry_version
+
+# Viewport labels for asset roots: CSV asset name, triangles against budget
+# and a status color. Drawn by a SpaceView3D handler, so toggling writes no
+# RNA properties and pushes no undo step.
+#
+# Label data is rebuilt on a timer only when objects or the CSV changed;
+# when objects only moved, the cached roots just get new positions and
+# triangle counts. Root name lookups are memoized per CSV version.
+# draw() just projects the cached root positions in one numpy pass, culls
+# them to the view and draws the nearest few.
+
+STATUS_COLORS = {
+    'OK': (0.35, 0.9, 0.35, 1.0),
+    'OVER_BUDGET': (1.0, 0.3, 0.3, 1.0),
+    'NO_ROW': (1.0, 0.8, 0.2, 1.0),
+}
+REBUILD_INTERVAL = 0.25  # seconds between checks for changes while the overlay is on
+MARKER_SIZE = 4  # half size of the status square, in pixels
+
+_labels = []  # (text, status) per root
+_roots = []  # (root, mesh objects) per label
+_positions = np.empty((0, 4), dtype=np.float32)  # homogeneous world positions, one per label
+_state = {"dirty": True, "moved": False, "table_version": None, "object_count": 0, "handler": None}
+_mesh_tris = {}  # mesh pointer -> (geometry version, triangles)
+_rows = {}  # root name -> CSV row, for the table version in _state
+
+
+def _mesh_triangles(mesh):
+    ptr = mesh.as_pointer()
+    version = geometry_version(ptr)
+    cached = _mesh_tris.get(ptr)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    tris = triangle_count(mesh)
+    _mesh_tris[ptr] = (version, tris)
+    return tris
+
+def _table_version(table):
+    return (id(table), table.mtime_ns, table.size) if table else None
+
+def _find_row(table, name):
+    if name not in _rows:
+        _rows[name] = table.find(name) if table else None
+    return _rows[name]
+
+def _label(root, row, tris):
+    if row is None:
+        return (f"{root.name}  {tris} tris  (no CSV row)", 'NO_ROW')
+    if row.max_tris is None:
+        return (f"{row.asset_name}  {tris} tris", 'NO_ROW')
+    status = 'OK' if tris <= row.max_tris else 'OVER_BUDGET'
+    return (f"{row.asset_name}  {tris}/{row.max_tris} tris", status)
+
+def _set_labels(table):
+    """Labels and positions for the roots in _roots."""
+    global _positions
+    labels = []
+    positions = []
+    for root, meshes in _roots:
+        tris = sum(_mesh_triangles(o.data) for o in meshes)
+        labels.append(_label(root, _find_row(table, root.name), tris))
+        positions.append((*root.matrix_world.translation, 1.0))
+    _labels[:] = labels
+    _positions = np.array(positions, dtype=np.float32).reshape(-1, 4)
+
+def rebuild_labels(scene):
+    table = load_asset_table(scene_sheet_path(scene))
+    version = _table_version(table)
+    if version != _state["table_version"]:
+        _rows.clear()
+        _state["table_version"] = version
+
+    roots = {}
+    for obj, root in build_root_map(scene.objects).items():
+        meshes = roots.setdefault(root, [])
+        if obj.type == 'MESH':
+            meshes.append(obj)
+    _roots[:] = [(root, meshes) for root, meshes in roots.items() if meshes]
+
+    _set_labels(table)
+    _state["object_count"] = len(scene.objects)
+    _state["dirty"] = False
+    _state["moved"] = False
+
+def _hierarchy_unchanged(scene):
+    if len(scene.objects) != _state["object_count"]:
+        return False
+    try:
+        for root, meshes in _roots:
+            if root.parent is not None:
+                return False
+            for obj in meshes:
+                top = obj
+                while top.parent is not None:
+                    top = top.parent
+                if top != root:
+                    return False
+    except ReferenceError:
+        return False  # an object was deleted
+    return True
+
+def refresh_labels(scene):
+    """Objects only moved: new positions and triangle counts for the same roots."""
+    if not _hierarchy_unchanged(scene):
+        rebuild_labels(scene)
+        return
+    _set_labels(load_asset_table(scene_sheet_path(scene)))
+    _state["moved"] = False
+
+def _rebuild_timer():
+    scene = bpy.context.scene
+    if scene is None or not scene.csv2mesh_toggle_show_asset_names:
+        return None  # overlay turned off, stop polling
+    table = load_asset_table(scene_sheet_path(scene))
+    if _state["dirty"] or _table_version(table) != _state["table_version"]:
+        rebuild_labels(scene)
+        _tag_redraw()
+    elif _state["moved"]:
+        refresh_labels(scene)
+        _tag_redraw()
+    return REBUILD_INTERVAL
+
+def _tag_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def visible_labels(perspective_matrix, width, height, max_labels):
+    """(label index, x, y) in region pixels for labels in view, nearest first, at most max_labels."""
+    if not len(_positions):
+        return []
+    clip = _positions @ np.array(perspective_matrix, dtype=np.float32).T
+    w = clip[:, 3]
+    inside = (w > 1e-5) & (np.abs(clip[:, 0]) <= w) & (np.abs(clip[:, 1]) <= w) & (np.abs(clip[:, 2]) <= w)
+    index = np.flatnonzero(inside)
+    if len(index) > max_labels:
+        index = index[np.argpartition(w[index], max_labels)[:max_labels]]
+    index = index[np.argsort(w[index])]
+    x = (clip[index, 0] / w[index] + 1.0) * 0.5 * width
+    y = (clip[index, 1] / w[index] + 1.0) * 0.5 * height
+    return list(zip(index.tolist(), x.tolist(), y.tolist()))
+
+def draw_overlay():
+    context = bpy.context
+    scene = context.scene
+    if not scene.csv2mesh_toggle_show_asset_names or context.region_data is None:
+        return
+    if not bpy.app.timers.is_registered(_rebuild_timer):
+        # e.g. a file saved with the overlay on was just opened
+        bpy.app.timers.register(_rebuild_timer, first_interval=0.0)
+    region = context.region
+    shown = visible_labels(context.region_data.perspective_matrix, region.width, region.height,
+                           scene.csv2mesh_overlay_max_labels)
+    if not shown:
+        return
+
+    # One batch of status squares per color
+    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    gpu.state.blend_set('ALPHA')
+    by_status = {}
+    for i, x, y in shown:
+        by_status.setdefault(_labels[i][1], []).append((x, y))
+    s = MARKER_SIZE
+    for status, points in by_status.items():
+        verts = []
+        for x, y in points:
+            verts += [(x - s, y - s), (x + s, y - s), (x + s, y + s), (x - s, y - s), (x + s, y + s), (x - s, y + s)]
+        batch = batch_for_shader(shader, 'TRIS', {"pos": verts})
+        shader.uniform_float("color", STATUS_COLORS[status])
+        batch.draw(shader)
+    gpu.state.blend_set('NONE')
+
+    font_id = 0
+    blf.size(font_id, 12)
+    blf.enable(font_id, blf.SHADOW)
+    blf.shadow(font_id, 3, 0.0, 0.0, 0.0, 0.8)
+    for i, x, y in shown:
+        text, status = _labels[i]
+        blf.color(font_id, *STATUS_COLORS[status])
+        blf.position(font_id, x + 2 * s, y - s, 0)
+        blf.draw(font_id, text)
+    blf.disable(font_id, blf.SHADOW)
+
+
+@persistent
+def overlay_depsgraph_update(scene, depsgraph):
+    if _state["dirty"] or not getattr(scene, "csv2mesh_toggle_show_asset_names", False):
+        return
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        if update.is_updated_transform and not update.is_updated_geometry:
+            _state["moved"] = True
+        else:
+            _state["dirty"] = True
+            return
+
+def overlay_toggled(self, context):
+    _state["dirty"] = True
+    if self.csv2mesh_toggle_show_asset_names and not bpy.app.timers.is_registered(_rebuild_timer):
+        bpy.app.timers.register(_rebuild_timer, first_interval=0.0)
+    _tag_redraw()
+
+
+def register():
+    bpy.types.Scene.csv2mesh_overlay_max_labels = IntProperty(
+        name="Max Labels",
+        description="Most asset labels drawn per viewport, nearest to the camera first",
+        default=200,
+        min=1,
+        max=5000
+    )
+    _state["handler"] = bpy.types.SpaceView3D.draw_handler_add(draw_overlay, (), 'WINDOW', 'POST_PIXEL')
+    bpy.app.handlers.depsgraph_update_post.append(overlay_depsgraph_update)
+
+def unregister():
+    if _state["handler"] is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_state["handler"], 'WINDOW')
+        _state["handler"] = None
+    if overlay_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(overlay_depsgraph_update)
+    if bpy.app.timers.is_registered(_rebuild_timer):
+        bpy.app.timers.unregister(_rebuild_timer)
+    del bpy.types.Scene.csv2mesh_overlay_max_labels
+    _labels.clear()
+    _roots.clear()
+    _rows.clear()
+    _mesh_tris.clear()